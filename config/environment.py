@@ -1,3 +1,6 @@
+import os
+
+
 class Environment:
     BASE_URL = "https://v0-swagger-backend-frontend.vercel.app"
     API_URL = f"{BASE_URL}/api"
@@ -6,4 +9,11 @@ class Environment:
     TEST_USER = {
         "username": "admin",
         "password": "admin123"
-    }
\ No newline at end of file
+    }
+
+    # Настройки HTTP транспорта (можно переопределить через переменные окружения)
+    API_POOL_CONNECTIONS = int(os.getenv("API_POOL_CONNECTIONS", "10"))
+    API_POOL_MAXSIZE = int(os.getenv("API_POOL_MAXSIZE", "20"))
+    API_CONNECT_TIMEOUT = float(os.getenv("API_CONNECT_TIMEOUT", "5"))
+    API_READ_TIMEOUT = float(os.getenv("API_READ_TIMEOUT", "30"))
+    API_RETRIES = int(os.getenv("API_RETRIES", "2"))
@@ -0,0 +1,159 @@
+import asyncio
+import json
+
+import aiohttp
+from config.environment import Environment
+from src.api.cache import ResponseCache
+from src.api.ledger import created_product_id
+
+
+class AsyncResponse:
+    """Ответ асинхронного клиента с тем же интерфейсом, что и requests.Response"""
+
+    def __init__(self, status_code, headers, content, url):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncApiClient:
+    def __init__(self, base_url=None, limit=100, coalesce=None, breaker=None, ledger=None):
+        self.base_url = base_url or Environment.API_URL
+        self.limit = limit
+        # Необязательный AsyncSingleFlight для одинаковых одновременных GET
+        self.coalesce = coalesce
+        # Необязательный CircuitBreaker, общий с синхронными клиентами
+        self.breaker = breaker
+        # Необязательный ResourceLedger, общий с синхронными клиентами
+        self.ledger = ledger
+        self.headers = {}
+        self.session = None
+        self.token = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Закрыть HTTP сессию"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _get_session(self):
+        # Сессия создается лениво, чтобы она принадлежала текущему event loop
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.limit)
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def _request(self, method, path, **kwargs):
+        if method == "GET" and self.coalesce is not None:
+            key = ResponseCache.make_key(path, kwargs.get("params"), self.token)
+            return await self.coalesce.do(key, lambda: self._send(method, path, **kwargs))
+        return await self._send(method, path, **kwargs)
+
+    async def _send(self, method, path, **kwargs):
+        if self.breaker is not None:
+            self.breaker.before_request()
+        session = self._get_session()
+        try:
+            async with session.request(
+                method,
+                f"{self.base_url}{path}",
+                headers=self.headers,
+                **kwargs
+            ) as response:
+                content = await response.read()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if self.breaker is not None:
+                self.breaker.record_failure()
+            raise
+        if self.breaker is not None:
+            self.breaker.record_success()
+        return AsyncResponse(response.status, response.headers, content, str(response.url))
+
+    async def login(self, username, password):
+        """Логин и сохранение токена"""
+        response = await self._request(
+            "POST",
+            "/auth/login",
+            json={"username": username, "password": password}
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            token = data.get("token")
+            if token:
+                self.set_token(token)
+
+        return response
+
+    def set_token(self, token):
+        """Использовать готовый токен без запроса на логин"""
+        self.token = token
+        self.headers.update({
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json"
+        })
+
+    async def register(self, user_data):
+        """Регистрация нового пользователя"""
+        return await self._request("POST", "/auth/register", json=user_data)
+
+    async def get_products(self, filters=None):
+        """Получить список товаров"""
+        return await self._request("GET", "/products", params=filters or {})
+
+    async def get_product(self, product_id):
+        """Получить товар по ID"""
+        return await self._request("GET", f"/products/{product_id}")
+
+    async def create_product(self, product_data):
+        """Создать новый товар (требует авторизации)"""
+        response = await self._request("POST", "/products", json=product_data)
+        if self.ledger is not None:
+            product_id = created_product_id(response)
+            name = product_data.get("name") if isinstance(product_data, dict) else None
+            if product_id is None and response.status_code in (200, 201) and isinstance(name, str):
+                # Окружение ответило только сообщением: ID ищется по имени, иначе товар не попадет в журнал очистки
+                found = await self.get_products({"search": name})
+                products = found.json().get("products", []) if found.status_code == 200 else []
+                product_id = next((p["id"] for p in products if p.get("name") == name), None)
+            if product_id is not None:
+                self.ledger.add(product_id)
+        return response
+
+    async def update_product(self, product_id, product_data, method="PUT"):
+        """Обновить товар (PUT - полное, PATCH - частичное)"""
+        if method.upper() in ("PUT", "PATCH"):
+            return await self._request(method.upper(), f"/products/{product_id}", json=product_data)
+
+    async def delete_product(self, product_id):
+        """Удалить товар (требует авторизации)"""
+        response = await self._request("DELETE", f"/products/{product_id}")
+        if self.ledger is not None and response.status_code in (200, 404):
+            self.ledger.discard(product_id)
+        return response
+
+    async def get_categories(self):
+        """Получить список категорий"""
+        return await self._request("GET", "/categories")
+
+    async def get_reviews(self, product_id):
+        """Получить отзывы о товаре"""
+        return await self._request("GET", f"/products/{product_id}/review")
+
+    async def create_review(self, product_id, review_data):
+        """Добавить отзыв (требует авторизации)"""
+        return await self._request("POST", f"/products/{product_id}/review", json=review_data)
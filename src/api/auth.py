@@ -0,0 +1,108 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import time
+
+from src.api.filelock import FileLock, write_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class AuthenticationError(Exception):
+    """Не удалось получить токен"""
+
+    def __init__(self, status_code):
+        super().__init__(f"Authentication failed with status {status_code}")
+        self.status_code = status_code
+
+
+def token_expiry(token, default_ttl):
+    """Время истечения токена: exp из JWT или now + default_ttl"""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload))["exp"]
+        return float(exp)
+    except (IndexError, KeyError, TypeError, ValueError):
+        return time.time() + default_ttl
+
+
+class TokenBroker:
+    """Выдает один токен на всю сессию и делит его между воркерами xdist.
+
+    Токен хранится в файле под межпроцессной блокировкой, логин выполняется
+    только если в файле нет действующего токена. На 401 токен обновляется
+    один раз: если другой воркер уже обновил его, берется новый из файла.
+    """
+
+    def __init__(self, login, cache_dir, key, ttl=900.0, expiry_margin=30.0, retry_delay=1.0, failure_ttl=30.0):
+        # login() -> requests.Response от /auth/login
+        self.login = login
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        self.cache_path = os.path.join(str(cache_dir), f"auth-token-{digest}.json")
+        self.lock = FileLock(f"{self.cache_path}.lock", timeout=90.0, stale_after=120.0)
+        self.ttl = ttl
+        self.expiry_margin = expiry_margin
+        self.retry_delay = retry_delay
+        # Неудачный логин запоминается, чтобы остальные тесты и воркеры не повторяли его с паузой
+        self.failure_ttl = failure_ttl
+        self.logins = 0
+        self._token = None
+        self._expires_at = 0.0
+
+    def _is_valid(self, expires_at):
+        return time.time() < expires_at - self.expiry_margin
+
+    def _read(self):
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if "failed_status" in data and time.time() - data.get("failed_at", 0) < self.failure_ttl:
+            raise AuthenticationError(data["failed_status"])
+        if not data.get("token") or not self._is_valid(data.get("expires_at", 0)):
+            return None
+        return data
+
+    def _adopt(self, token, expires_at):
+        self._token = token
+        self._expires_at = expires_at
+        return token
+
+    def _login_locked(self):
+        response = self.login()
+        self.logins += 1
+        if response.status_code != 200:
+            logger.warning("Token broker login failed with %s, retrying in %.1fs", response.status_code, self.retry_delay)
+            time.sleep(self.retry_delay)
+            response = self.login()
+            self.logins += 1
+        token = response.json().get("token") if response.status_code == 200 else None
+        if not token:
+            write_atomic(self.cache_path, json.dumps({"failed_status": response.status_code, "failed_at": time.time()}))
+            raise AuthenticationError(response.status_code)
+        expires_at = token_expiry(token, self.ttl)
+        write_atomic(self.cache_path, json.dumps({"token": token, "expires_at": expires_at}))
+        return self._adopt(token, expires_at)
+
+    def get_token(self):
+        """Действующий токен из памяти, общего файла или новый логин"""
+        if self._token and self._is_valid(self._expires_at):
+            return self._token
+
+        with self.lock:
+            data = self._read()
+            if data:
+                return self._adopt(data["token"], data["expires_at"])
+            return self._login_locked()
+
+    def refresh(self, stale_token):
+        """Обновить токен после 401, не логинясь повторно за другие воркеры"""
+        with self.lock:
+            data = self._read()
+            if data and data["token"] != stale_token:
+                return self._adopt(data["token"], data["expires_at"])
+            return self._login_locked()
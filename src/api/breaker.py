@@ -0,0 +1,134 @@
+import json
+import os
+import threading
+import time
+
+import requests
+
+from src.api.filelock import FileLock, write_atomic
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Сбои, которые говорят о недоступности окружения, а не об ошибке в запросе
+NETWORK_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Окружение признано недоступным, запрос не отправлялся"""
+
+
+class CircuitBreaker:
+    """Предохранитель для всех ApiClient запуска, общий для воркеров xdist.
+
+    После failure_threshold подряд сетевых сбоев (ошибка соединения, таймаут)
+    предохранитель размыкается и запросы сразу падают с CircuitOpenError.
+    Через reset_timeout секунд один запрос пропускается как пробный
+    (half-open): успех замыкает цепь, сбой снова размыкает ее.
+
+    Состояние хранится в JSON файле state_path под FileLock; без state_path
+    предохранитель действует только внутри процесса. Файл перечитывается,
+    только если изменилось время его модификации.
+    """
+
+    def __init__(self, state_path=None, failure_threshold=3, reset_timeout=30.0):
+        self.state_path = str(state_path) if state_path else None
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(f"{self.state_path}.lock", timeout=10.0, stale_after=30.0) if state_path else None
+        self._state = {"state": CLOSED, "failures": 0, "opened_at": 0.0, "probe_at": 0.0}
+        self._mtime = None
+        self.stats = {"rejected": 0, "opened": 0, "probes": 0}
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._load()["state"]
+
+    def _load(self):
+        if self.state_path is None:
+            return self._state
+        try:
+            mtime = os.stat(self.state_path).st_mtime_ns
+        except FileNotFoundError:
+            return self._state
+        if mtime != self._mtime:
+            try:
+                with open(self.state_path, encoding="utf-8") as f:
+                    self._state = json.load(f)
+                self._mtime = mtime
+            except (OSError, ValueError):
+                pass
+        return self._state
+
+    def _update(self, change):
+        """Изменить состояние под межпроцессной блокировкой; change(state) -> bool (менять ли)"""
+        if self._file_lock is None:
+            return change(self._state)
+        with self._file_lock:
+            # Перечитываем под блокировкой: другой воркер мог изменить состояние
+            self._mtime = None
+            state = dict(self._load())
+            changed = change(state)
+            if changed:
+                write_atomic(self.state_path, json.dumps(state))
+                self._state = state
+            return changed
+
+    def before_request(self):
+        """Пропустить запрос или бросить CircuitOpenError"""
+        with self._lock:
+            state = self._load()
+            if state["state"] == CLOSED:
+                return
+            now = time.time()
+
+            def start_probe(state):
+                if state["state"] == CLOSED:
+                    return False
+                # Пробный запрос, не вернувшийся за reset_timeout, считается потерянным
+                waiting_since = state["opened_at"] if state["state"] == OPEN else state["probe_at"]
+                if now - waiting_since < self.reset_timeout:
+                    return False
+                state.update(state=HALF_OPEN, probe_at=now)
+                return True
+
+            if self._update(start_probe):
+                self.stats["probes"] += 1
+                return
+            if self._state["state"] == CLOSED:
+                return
+            self.stats["rejected"] += 1
+            opened_at = self._state["opened_at"]
+        raise CircuitOpenError(
+            f"API circuit is open after {self.failure_threshold} consecutive network failures "
+            f"(opened {now - opened_at:.0f}s ago, next probe in up to {self.reset_timeout:.0f}s)"
+        )
+
+    def record_success(self):
+        with self._lock:
+            state = self._load()
+            if state["state"] == CLOSED and state["failures"] == 0:
+                return
+
+            def close(state):
+                state.update(state=CLOSED, failures=0)
+                return True
+
+            self._update(close)
+
+    def record_failure(self):
+        with self._lock:
+            now = time.time()
+
+            def fail(state):
+                state["failures"] += 1
+                if state["state"] == HALF_OPEN or (
+                        state["state"] == CLOSED and state["failures"] >= self.failure_threshold):
+                    state.update(state=OPEN, opened_at=now)
+                    self.stats["opened"] += 1
+                return True
+
+            self._update(fail)
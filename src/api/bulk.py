@@ -0,0 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BulkResult:
+    """Результат одной операции в пакете"""
+
+    def __init__(self, item, response=None, error=None):
+        self.item = item
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None and self.response is not None and self.response.status_code < 400
+
+    def __repr__(self):
+        status = self.response.status_code if self.response is not None else self.error
+        return f"BulkResult(item={self.item!r}, status={status!r})"
+
+
+def run_bulk(func, items, max_workers):
+    """Выполнить func для каждого элемента в ограниченном пуле потоков.
+
+    Результаты возвращаются в порядке входных элементов, исключение
+    в одном элементе не прерывает остальные.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def call(item):
+        try:
+            return BulkResult(item, response=func(item))
+        except Exception as e:
+            return BulkResult(item, error=e)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        return list(executor.map(call, items))
@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheEntry:
+    """Закэшированный ответ и его валидаторы"""
+
+    def __init__(self, response):
+        self.response = response
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+        self.stored_at = time.monotonic()
+
+    def validators(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """LRU кэш GET ответов с TTL и условной ревалидацией (ETag / Last-Modified).
+
+    Свежие записи отдаются без запроса. Устаревшие записи с валидаторами
+    перепроверяются условным запросом, ответ 304 продлевает запись.
+    """
+
+    def __init__(self, max_entries=256, ttl=30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "revalidations": 0, "invalidations": 0}
+
+    @staticmethod
+    def make_key(path, params=None, token=None):
+        """Ключ записи: путь, параметры и токен (ответы разным пользователям не смешиваются)"""
+        return path, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())), token
+
+    def _count(self, name, value=1):
+        with self._lock:
+            self.stats[name] += value
+
+    def fetch(self, key, send):
+        """Отдать ответ из кэша или выполнить send(headers) и сохранить результат"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None and time.monotonic() - entry.stored_at < self.ttl:
+            self._count("hits")
+            return entry.response
+
+        headers = entry.validators() if entry is not None else {}
+        response = send(headers)
+
+        if entry is not None and response.status_code == 304:
+            self._count("revalidations")
+            entry.stored_at = time.monotonic()
+            return entry.response
+
+        self._count("misses")
+        with self._lock:
+            if response.status_code == 200:
+                self._entries[key] = CacheEntry(response)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.pop(key, None)
+        return response
+
+    def invalidate(self, *paths):
+        """Удалить все записи для указанных путей (с любыми параметрами)"""
+        paths = set(paths)
+        with self._lock:
+            stale = [key for key in self._entries if key[0] in paths]
+            for key in stale:
+                del self._entries[key]
+            self.stats["invalidations"] += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
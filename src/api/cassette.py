@@ -0,0 +1,177 @@
+import hashlib
+import json
+import mmap
+import re
+import struct
+import threading
+from urllib.parse import parse_qsl, unquote_plus, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Сгенерированные в тестах значения, которые отличаются от запуска к запуску
+DEFAULT_IGNORE = [
+    r"Test Product [a-z0-9]{6,8}",
+    r"testuser_[a-z0-9]{8}",
+]
+
+_MAGIC = b"APICAS1\n"
+_FOOTER = struct.Struct("<Q8s")
+_SKIP_HEADERS = {"content-encoding", "transfer-encoding", "connection", "keep-alive", "date"}
+
+
+class CassetteMissError(requests.RequestException):
+    """В кассете нет записи для запроса"""
+
+
+class Cassette:
+    """Запись и воспроизведение HTTP взаимодействий ApiClient.
+
+    Формат файла: заголовок, записи "метаданные JSON + тело", индекс JSON
+    и футер со смещением индекса. В режиме replay файл отображается в память
+    через mmap, тела читаются срезами по смещениям из индекса.
+
+    Запросы сопоставляются по методу, пути, отсортированным параметрам и
+    каноническому JSON телу, в которых сгенерированные значения (ignore)
+    заменены маской. При воспроизведении записанные сгенерированные значения
+    в ответах подменяются значениями текущего запуска.
+    """
+
+    def __init__(self, path, mode="replay", ignore=None):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = str(path)
+        self.mode = mode
+        self.ignore = [re.compile(pattern) for pattern in (ignore if ignore is not None else DEFAULT_IGNORE)]
+        self._lock = threading.Lock()
+        self._index = {}
+        self._cursors = {}
+        self._aliases = {}
+        self.stats = {"recorded": 0, "replayed": 0, "misses": 0}
+
+        if mode == "record":
+            self._file = open(self.path, "wb")
+            self._file.write(_MAGIC)
+            self._offset = len(_MAGIC)
+        else:
+            self._file = open(self.path, "rb")
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            index_offset, magic = _FOOTER.unpack(self._data[-_FOOTER.size:])
+            if magic != _MAGIC:
+                raise ValueError(f"{self.path} is not a complete cassette file")
+            self._index = json.loads(self._data[index_offset:len(self._data) - _FOOTER.size])
+
+    # Сопоставление запросов
+
+    def _mask(self, text):
+        generated = []
+        for pattern in self.ignore:
+            generated.extend(match.group(0) for match in pattern.finditer(text))
+            text = pattern.sub("<generated>", text)
+        return text, generated
+
+    def match_key(self, request):
+        """Ключ запроса и список найденных в нем сгенерированных значений"""
+        url = urlsplit(request.url)
+        query = urlencode(sorted(parse_qsl(url.query)))
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode()
+        try:
+            body_text = json.dumps(json.loads(body), sort_keys=True, ensure_ascii=False) if body else ""
+        except ValueError:
+            body_text = body.decode("utf-8", errors="replace")
+
+        # Маска применяется к раскодированному URL: в query пробелы сгенерированных имен - "+"
+        target, generated_in_url = self._mask(unquote_plus(f"{url.path}?{query}"))
+        body_text, generated_in_body = self._mask(body_text)
+        digest = hashlib.sha1(body_text.encode()).hexdigest()[:16]
+        return f"{request.method} {target} {digest}", generated_in_url + generated_in_body
+
+    # Запись
+
+    def record(self, request, response):
+        key, generated = self.match_key(request)
+        meta = json.dumps({
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in _SKIP_HEADERS},
+            "generated": generated,
+        }).encode()
+        body = response.content
+        with self._lock:
+            self._file.write(meta)
+            self._file.write(body)
+            self._index.setdefault(key, []).append([self._offset, len(meta), len(body)])
+            self._offset += len(meta) + len(body)
+            self.stats["recorded"] += 1
+
+    # Воспроизведение
+
+    def replay(self, request):
+        key, generated = self.match_key(request)
+        with self._lock:
+            entries = self._index.get(key)
+            if not entries:
+                self.stats["misses"] += 1
+                raise CassetteMissError(f"No recorded interaction for {key}", request=request)
+            # Повторяющиеся запросы отдаются по порядку записи, последний повторяется
+            position = self._cursors.get(key, 0)
+            self._cursors[key] = position + 1
+            offset, meta_length, body_length = entries[min(position, len(entries) - 1)]
+            self.stats["replayed"] += 1
+
+        meta = json.loads(self._data[offset:offset + meta_length])
+        body = self._data[offset + meta_length:offset + meta_length + body_length]
+        with self._lock:
+            for recorded, live in zip(meta["generated"], generated):
+                if recorded != live:
+                    self._aliases[recorded.encode()] = live.encode()
+            aliases = list(self._aliases.items())
+        # Значение, сгенерированное в одном запросе, встречается и в ответах последующих
+        for recorded, live in aliases:
+            if recorded in body:
+                body = body.replace(recorded, live)
+
+        response = requests.Response()
+        response.status_code = meta["status"]
+        response.reason = meta["reason"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self.mode == "record":
+            with self._lock:
+                index = json.dumps(self._index, separators=(",", ":")).encode()
+                self._file.write(index)
+                self._file.write(_FOOTER.pack(self._offset, _MAGIC))
+        else:
+            self._data.close()
+        self._file.close()
+
+
+class CassetteAdapter(BaseAdapter):
+    """Адаптер requests: в record пишет ответы транспорта, в replay не ходит в сеть"""
+
+    def __init__(self, cassette, transport):
+        super().__init__()
+        self.cassette = cassette
+        self.transport = transport
+
+    def send(self, request, **kwargs):
+        if self.cassette.mode == "replay":
+            return self.cassette.replay(request)
+        response = self.transport.send(request, **kwargs)
+        self.cassette.record(request, response)
+        return response
+
+    def close(self):
+        self.transport.close()
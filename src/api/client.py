@@ -1,84 +1,334 @@
+import time
+
 import requests
 from config.environment import Environment
+from src.api.breaker import NETWORK_ERRORS, CircuitOpenError
+from src.api.bulk import run_bulk
+from src.api.cache import ResponseCache
+from src.api.cassette import CassetteAdapter
+from src.api.ledger import created_product_id
+from src.api.metrics import RequestInfo
+from src.api.streaming import iter_json_items
+from src.api.transport import Transport, begin_request_timing, end_request_timing
 
 
 class ApiClient:
-    def __init__(self):
-        self.base_url = Environment.API_URL
+    def __init__(self, base_url=None, transport=None, cache=None, token_broker=None, cassette=None,
+                 coalesce=None, limiter=None, breaker=None, ledger=None, product_index=None,
+                 contracts=None):
+        self.base_url = base_url or Environment.API_URL
+        # Transport можно передать общий, чтобы клиенты делили пул соединений
+        self.transport = transport or Transport()
         self.session = requests.Session()
+        # Cassette в режиме record пишет трафик, в режиме replay отдает его без сети
+        self.cassette = cassette
+        adapter = CassetteAdapter(cassette, self.transport) if cassette is not None else self.transport
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Необязательный ResponseCache для GET запросов
+        self.cache = cache
+        # Необязательный SingleFlight: одинаковые одновременные GET идут в сеть одним запросом
+        self.coalesce = coalesce
+        # Необязательный AdaptiveLimiter: ограничивает число запросов в полете (AIMD)
+        self.limiter = limiter
+        # Необязательный CircuitBreaker: при недоступном окружении запросы сразу падают
+        self.breaker = breaker
+        # Необязательный ResourceLedger: созданные товары удаляются пакетно в конце сессии
+        self.ledger = ledger
+        # Необязательный ProductIndex имя -> ID для resolve_product_id
+        self.product_index = product_index
+        # Необязательный ContractValidator: каждый ответ проверяется по схеме эндпоинта
+        self.contracts = contracts
+        # Необязательный TokenBroker: токен обновляется один раз при ответе 401
+        self.token_broker = token_broker
         self.token = None
+        # Колбэки вызываются с RequestInfo до и после каждого HTTP запроса
+        self.hooks = {"request_start": [], "request_end": []}
+
+    @property
+    def transport_stats(self):
+        """Счетчики новых и переиспользованных соединений"""
+        return self.transport.stats
+
+    def add_hook(self, event, callback):
+        """Подписаться на request_start / request_end"""
+        self.hooks[event].append(callback)
+
+    def _emit(self, event, info):
+        for callback in self.hooks[event]:
+            callback(info)
+
+    def _send(self, method, template, url, headers=None, **kwargs):
+        """Один HTTP запрос с замером времени и вызовом хуков"""
+        if self.breaker is not None:
+            self.breaker.before_request()
+        info = RequestInfo(method, template, url)
+        self._emit("request_start", info)
+        if self.limiter is not None:
+            # Ожидание слота не входит в задержку запроса
+            self.limiter.acquire()
+        timing = begin_request_timing()
+        response = None
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, headers=headers, **kwargs)
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return response
+        except Exception as e:
+            info.error = e
+            if self.breaker is not None and isinstance(e, NETWORK_ERRORS):
+                self.breaker.record_failure()
+            raise
+        finally:
+            info.total = time.perf_counter() - start
+            end_request_timing()
+            if self.limiter is not None:
+                self.limiter.release(response, info.total)
+            info.dns, info.connect, info.reused = timing["dns"], timing["connect"], timing["reused"]
+            if response is not None:
+                info.status = response.status_code
+                info.ttfb = response.elapsed.total_seconds()
+                if kwargs.get("stream"):
+                    info.bytes = int(response.headers.get("Content-Length") or 0)
+                else:
+                    info.bytes = len(response.content)
+            self._emit("request_end", info)
+
+    def _request(self, method, template, path_params=None, **kwargs):
+        """Выполнить запрос к эндпоинту, заданному шаблоном пути (например /products/{id})"""
+        path = template.format(**path_params) if path_params else template
+        url = f"{self.base_url}{path}"
+
+        def send_throttled(headers):
+            response = self._send(method, template, url, headers=headers, **kwargs)
+            attempt = 0
+            # Повтор после 429 / 503: acquire() выдержит паузу из Retry-After
+            while self.limiter is not None and self.limiter.should_retry(method, response, attempt):
+                attempt += 1
+                response.close()
+                response = self._send(method, template, url, headers=headers, **kwargs)
+            return response
+
+        def send(headers=None):
+            response = send_throttled(headers)
+            if (response.status_code == 401 and self.token_broker is not None
+                    and self.token and not template.startswith("/auth/")):
+                self.set_token(self.token_broker.refresh(self.token))
+                response = send_throttled(headers)
+            if self.contracts is not None and not kwargs.get("stream"):
+                self.contracts(method, template, response)
+            return response
+
+        if method != "GET" or kwargs.get("stream"):
+            return send()
+
+        # Токен входит в ключ: кэш и объединение не смешивают ответы разным пользователям
+        key = ResponseCache.make_key(path, kwargs.get("params"), self.token)
+
+        def fetch():
+            if self.cache is not None:
+                return self.cache.fetch(key, send)
+            return send()
+
+        if self.coalesce is not None:
+            return self.coalesce.do(key, fetch)
+        return fetch()
+
+    def _invalidate(self, *paths):
+        if self.cache is not None:
+            self.cache.invalidate(*paths)
+
+    def _run_bulk(self, func, items, max_workers):
+        results = run_bulk(func, items, max_workers or self.transport.pool_maxsize)
+        # При разомкнутом предохранителе пакет целиком бессмыслен: поднимаем ошибку как есть
+        for result in results:
+            if isinstance(result.error, CircuitOpenError):
+                raise result.error
+        return results
 
     def login(self, username, password):
         """Логин и сохранение токена"""
-        response = self.session.post(
-            f"{self.base_url}/auth/login",
+        response = self._request(
+            "POST",
+            "/auth/login",
             json={"username": username, "password": password}
         )
 
         if response.status_code == 200:
             data = response.json()
-            self.token = data.get("token")
-            if self.token:
-                self.session.headers.update({
-                    "Authorization": f"Bearer {self.token}",
-                    "Content-Type": "application/json"
-                })
+            token = data.get("token")
+            if token:
+                self.set_token(token)
 
         return response
 
+    def set_token(self, token):
+        """Использовать готовый токен без запроса на логин"""
+        self.token = token
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json"
+        })
+
+    def authenticate(self):
+        """Получить токен у token_broker (один логин на всю сессию)"""
+        self.set_token(self.token_broker.get_token())
+
     def register(self, user_data):
         """Регистрация нового пользователя"""
-        return self.session.post(
-            f"{self.base_url}/auth/register",
-            json=user_data
-        )
+        return self._request("POST", "/auth/register", json=user_data)
 
     def get_products(self, filters=None):
         """Получить список товаров"""
-        return self.session.get(
-            f"{self.base_url}/products",
-            params=filters or {}
-        )
+        return self._request("GET", "/products", params=filters or {})
+
+    def iter_products(self, filters=None, page_size=50):
+        """Постранично перебрать товары, разбирая ответ по мере загрузки.
+
+        Если бэкенд игнорирует page/limit, весь каталог приходит одним
+        ответом и разбирается инкрементально, без загрузки в память целиком.
+        """
+        page = 1
+        previous_first_id = None
+        while True:
+            response = self._request(
+                "GET",
+                "/products",
+                params={**(filters or {}), "page": page, "limit": page_size},
+                stream=True
+            )
+            try:
+                response.raise_for_status()
+                meta = {}
+                count = 0
+                first_id = None
+                for product in iter_json_items(response.iter_content(chunk_size=8192), "products", meta):
+                    if count == 0:
+                        first_id = product.get("id")
+                        # Страница повторяет предыдущую - параметр page не поддерживается
+                        if page > 1 and first_id == previous_first_id:
+                            return
+                    count += 1
+                    yield product
+            finally:
+                response.close()
+
+            total = meta.get("total")
+            if count != page_size or (isinstance(total, int) and page * page_size >= total):
+                return
+            previous_first_id = first_id
+            page += 1
+
+    def resolve_product_id(self, name, create_response=None):
+        """ID товара по точному имени, None если товар не найден.
+
+        Порядок: ответ на создание, индекс product_index, серверный фильтр
+        search и только затем постраничный перебор каталога. Все увиденные
+        по пути товары попадают в индекс.
+        """
+        if create_response is not None:
+            data = create_response.json()
+            if "product" in data:
+                return data["product"]["id"]
+            if "id" in data:
+                return data["id"]
+
+        if self.product_index is not None:
+            product_id = self.product_index.get(name)
+            if product_id is not None:
+                return product_id
+
+        response = self.get_products({"search": name})
+        if response.status_code == 200:
+            data = response.json()
+            products = data.get("products", []) if isinstance(data, dict) else []
+            product_id = self._find_by_name(products, name)
+            if product_id is not None:
+                return product_id
+
+        # Бэкенд без поиска или с другой семантикой search: перебор до первого совпадения
+        for product in self.iter_products():
+            product_id = self._find_by_name([product], name)
+            if product_id is not None:
+                return product_id
+        return None
+
+    def _find_by_name(self, products, name):
+        if self.product_index is not None:
+            self.product_index.observe(products)
+        return next((p["id"] for p in products if p.get("name") == name), None)
 
     def get_product(self, product_id):
         """Получить товар по ID"""
-        return self.session.get(f"{self.base_url}/products/{product_id}")
+        return self._request("GET", "/products/{id}", {"id": product_id})
 
     def create_product(self, product_data):
         """Создать новый товар (требует авторизации)"""
-        return self.session.post(
-            f"{self.base_url}/products",
-            json=product_data
-        )
+        response = self._request("POST", "/products", json=product_data)
+        self._invalidate("/products", "/categories")
+        product_id = created_product_id(response)
+        name = product_data.get("name") if isinstance(product_data, dict) else None
+        if (product_id is None and response.status_code in (200, 201) and isinstance(name, str)
+                and (self.ledger is not None or self.product_index is not None)):
+            # Окружение ответило только сообщением: ID ищется по имени, иначе товар не попадет в журнал очистки
+            product_id = self.resolve_product_id(name)
+        if product_id is not None:
+            if self.ledger is not None:
+                self.ledger.add(product_id)
+            if self.product_index is not None:
+                self.product_index.add(name, product_id)
+        return response
+
+    def create_products(self, products_data, max_workers=None):
+        """Создать несколько товаров параллельно, результаты в порядке входных данных"""
+        return self._run_bulk(self.create_product, products_data, max_workers)
 
     def update_product(self, product_id, product_data, method="PUT"):
         """Обновить товар (PUT - полное, PATCH - частичное)"""
-        if method.upper() == "PUT":
-            return self.session.put(
-                f"{self.base_url}/products/{product_id}",
-                json=product_data
-            )
-        elif method.upper() == "PATCH":
-            return self.session.patch(
-                f"{self.base_url}/products/{product_id}",
-                json=product_data
-            )
+        if method.upper() in ("PUT", "PATCH"):
+            response = self._request(method.upper(), "/products/{id}", {"id": product_id}, json=product_data)
+            self._invalidate("/products", f"/products/{product_id}", "/categories")
+            if self.product_index is not None and response.status_code == 200 and "name" in product_data:
+                self.product_index.add(product_data["name"], product_id)
+            return response
+
+    def update_products(self, updates, method="PUT", max_workers=None):
+        """Обновить несколько товаров параллельно, updates - пары (product_id, product_data)"""
+        return self._run_bulk(
+            lambda update: self.update_product(update[0], update[1], method=method),
+            updates,
+            max_workers
+        )
 
     def delete_product(self, product_id):
         """Удалить товар (требует авторизации)"""
-        return self.session.delete(f"{self.base_url}/products/{product_id}")
+        response = self._request("DELETE", "/products/{id}", {"id": product_id})
+        self._invalidate(
+            "/products", f"/products/{product_id}", f"/products/{product_id}/review", "/categories"
+        )
+        if response.status_code in (200, 404):
+            if self.ledger is not None:
+                self.ledger.discard(product_id)
+            if self.product_index is not None:
+                self.product_index.discard(product_id)
+        return response
+
+    def delete_products(self, product_ids, max_workers=None):
+        """Удалить несколько товаров параллельно"""
+        return self._run_bulk(self.delete_product, product_ids, max_workers)
 
     def get_categories(self):
         """Получить список категорий"""
-        return self.session.get(f"{self.base_url}/categories")
+        return self._request("GET", "/categories")
 
     def get_reviews(self, product_id):
         """Получить отзывы о товаре"""
-        return self.session.get(f"{self.base_url}/products/{product_id}/review")
+        return self._request("GET", "/products/{id}/review", {"id": product_id})
 
     def create_review(self, product_id, review_data):
         """Добавить отзыв (требует авторизации)"""
-        return self.session.post(
-            f"{self.base_url}/products/{product_id}/review",
-            json=review_data
-        )
\ No newline at end of file
+        response = self._request("POST", "/products/{id}/review", {"id": product_id}, json=review_data)
+        # Отзыв меняет рейтинг товара, который виден и в списке товаров
+        self._invalidate("/products", f"/products/{product_id}", f"/products/{product_id}/review")
+        return response
@@ -0,0 +1,81 @@
+import asyncio
+import copy
+import threading
+
+
+class _Call:
+    """Выполняющийся запрос и его результат для ожидающих"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Объединение одинаковых одновременных вызовов из разных потоков.
+
+    Первый вызов с ключом выполняет fn, остальные с тем же ключом ждут
+    его завершения и получают тот же результат (или то же исключение).
+    Результат не кэшируется: следующий вызов после завершения снова идет в сеть.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.stats = {"calls": 0, "executions": 0, "shared": 0}
+
+    def do(self, key, fn):
+        with self._lock:
+            self.stats["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats["executions"] += 1
+            else:
+                self.stats["shared"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            # Каждый получает свой объект ответа, тело общее
+            return copy.copy(call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """То же, что SingleFlight, для корутин одного event loop"""
+
+    def __init__(self):
+        self._calls = {}
+        self.stats = {"calls": 0, "executions": 0, "shared": 0}
+
+    async def do(self, key, fn):
+        self.stats["calls"] += 1
+        future = self._calls.get(key)
+        if future is not None:
+            self.stats["shared"] += 1
+            # shield: отмена одного ожидающего не отменяет запрос остальных
+            return copy.copy(await asyncio.shield(future))
+
+        self.stats["executions"] += 1
+        future = self._calls[key] = asyncio.ensure_future(fn())
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if future.done():
+                self._calls.pop(key, None)
+            else:
+                future.add_done_callback(lambda _: self._calls.pop(key, None))
@@ -0,0 +1,153 @@
+import threading
+
+import fastjsonschema
+
+ID = {"type": ["string", "integer"]}
+
+PRODUCT = {
+    "type": "object",
+    "required": ["id", "name", "price", "category"],
+    "properties": {
+        "id": ID,
+        "name": {"type": "string"},
+        "description": {"type": "string"},
+        "price": {"type": "number"},
+        "category": {"type": "string"},
+        "stock": {"type": "number"},
+        "imageUrl": {"type": "string"},
+        "rating": {"type": "number"},
+    },
+}
+
+REVIEW = {
+    "type": "object",
+    "required": ["rating", "comment"],
+    "properties": {
+        "id": ID,
+        "rating": {"type": "integer", "minimum": 1, "maximum": 5},
+        "comment": {"type": "string"},
+        "author": {"type": "string"},
+    },
+}
+
+ERROR = {
+    "type": "object",
+    "required": ["error"],
+    "properties": {"error": {"type": "string"}},
+}
+
+
+def _envelope(required, **properties):
+    return {"type": "object", "required": required, "properties": properties}
+
+
+def _one_of_keys(*keys, **properties):
+    """Ответ содержит хотя бы один из ключей (бэкенд может вернуть сообщение без объекта)"""
+    return {
+        "type": "object",
+        "anyOf": [{"required": [key]} for key in keys],
+        "properties": properties,
+    }
+
+
+# (метод, шаблон пути) -> {статус: схема}; ответы >= 400 без своей схемы проверяются по ERROR
+SCHEMAS = {
+    ("POST", "/auth/login"): {
+        200: _envelope(["token"], token={"type": "string"}, user={"type": "object"}),
+    },
+    ("POST", "/auth/register"): {
+        200: _one_of_keys("message", "user", "token", user={"type": "object"}),
+        201: _one_of_keys("message", "user", "token", user={"type": "object"}),
+    },
+    ("GET", "/products"): {
+        200: _envelope(["products", "total"], products={"type": "array", "items": PRODUCT},
+                       total={"type": "integer", "minimum": 0}),
+    },
+    # Часть окружений отвечает на создание 200 и только сообщением, без товара
+    ("POST", "/products"): {
+        200: _envelope(["message"], message={"type": "string"}, product=PRODUCT),
+        201: _one_of_keys("product", "message", product=PRODUCT, message={"type": "string"}),
+    },
+    ("GET", "/products/{id}"): {
+        200: _envelope(["product"], product=PRODUCT),
+    },
+    ("PUT", "/products/{id}"): {
+        200: _envelope(["message", "product"], message={"type": "string"}, product=PRODUCT),
+    },
+    ("PATCH", "/products/{id}"): {
+        200: _envelope(["message", "product"], message={"type": "string"}, product=PRODUCT),
+    },
+    ("DELETE", "/products/{id}"): {
+        200: _envelope(["message", "product"], message={"type": "string"}, product=PRODUCT),
+    },
+    ("GET", "/products/{id}/review"): {
+        200: _envelope(["reviews", "total"], reviews={"type": "array", "items": REVIEW},
+                       total={"type": "integer", "minimum": 0}),
+    },
+    ("POST", "/products/{id}/review"): {
+        201: _one_of_keys("review", "message", review=REVIEW, message={"type": "string"}),
+    },
+    ("GET", "/categories"): {
+        200: _envelope(["categories", "total"], categories={"type": "array", "items": {"type": "string"}},
+                       total={"type": "integer", "minimum": 0}),
+    },
+}
+
+# Схемы компилируются один раз при импорте: проверка ответа - вызов готовой функции
+_VALIDATORS = {
+    endpoint: {status: fastjsonschema.compile(schema) for status, schema in by_status.items()}
+    for endpoint, by_status in SCHEMAS.items()
+}
+_ERROR_VALIDATOR = fastjsonschema.compile(ERROR)
+
+
+class ContractError(AssertionError):
+    """Ответ не соответствует контракту эндпоинта"""
+
+    def __init__(self, method, template, status, message):
+        super().__init__(f"{method} {template} -> {status}: {message}")
+        self.method = method
+        self.template = template
+        self.status = status
+
+
+def find_validator(method, template, status):
+    """Скомпилированная схема ответа или None, если контракт не описан"""
+    validator = _VALIDATORS.get((method, template), {}).get(status)
+    if validator is None and status >= 400:
+        return _ERROR_VALIDATOR
+    return validator
+
+
+def validate_response(method, template, response):
+    """Проверить ответ по контракту эндпоинта, при нарушении бросить ContractError"""
+    validator = find_validator(method, template, response.status_code)
+    if validator is None:
+        return False
+    try:
+        data = response.json()
+    except ValueError:
+        raise ContractError(method, template, response.status_code, "response body is not JSON") from None
+    try:
+        validator(data)
+    except fastjsonschema.JsonSchemaValueException as e:
+        raise ContractError(method, template, response.status_code, e.message) from None
+    return True
+
+
+class ContractValidator:
+    """Проверка каждого ответа ApiClient по контрактам со счетчиками для отчета"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats = {"validated": 0, "unknown": 0, "violations": 0}
+
+    def __call__(self, method, template, response):
+        try:
+            known = validate_response(method, template, response)
+        except ContractError:
+            with self._lock:
+                self.stats["violations"] += 1
+            raise
+        with self._lock:
+            self.stats["validated" if known else "unknown"] += 1
@@ -0,0 +1,60 @@
+import os
+import time
+
+
+class FileLock:
+    """Межпроцессная блокировка через эксклюзивное создание lock-файла.
+
+    Работает одинаково на Linux и Windows и подходит для синхронизации
+    воркеров pytest-xdist через общий каталог.
+    """
+
+    def __init__(self, path, timeout=30.0, stale_after=60.0, poll_interval=0.05):
+        self.path = str(path)
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                self._remove_if_stale()
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Could not acquire lock {self.path} in {self.timeout}s")
+                time.sleep(self.poll_interval)
+                continue
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            return
+
+    def release(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _remove_if_stale(self):
+        # Lock-файл процесса, который упал не освободив его
+        try:
+            if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                os.remove(self.path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def write_atomic(path, data):
+    """Записать файл целиком так, чтобы читатели не увидели его наполовину"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
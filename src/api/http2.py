@@ -0,0 +1,167 @@
+import asyncio
+import os
+import ssl
+import threading
+import time
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+from config.environment import Environment
+from src.api.transport import IDEMPOTENT_METHODS, TransportStats, current_request_timing
+
+# Заголовки уровня соединения запрещены в HTTP/2
+_HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"}
+
+
+class Http2Transport(BaseAdapter):
+    """Адаптер requests поверх httpx с HTTP/2.
+
+    Монтируется в ApiClient вместо Transport: параллельные запросы из разных
+    потоков мультиплексируются потоками HTTP/2 в одном соединении с хостом.
+    Запросы выполняет httpx.AsyncClient в отдельном потоке с event loop:
+    синхронный HTTP/2 клиент httpcore небезопасен при вызовах из нескольких потоков.
+    Для https протокол выбирается через ALPN, для http нужен prior_knowledge=True
+    (h2c без Upgrade). Ответ читается целиком, stream=True не стримит тело.
+    verify, cert и прокси из requests применяются: для каждого их сочетания
+    создается свой httpx.AsyncClient.
+    """
+
+    def __init__(self, prior_knowledge=False, max_connections=None, connect_timeout=None,
+                 read_timeout=None, retries=None):
+        super().__init__()
+        self.stats = TransportStats()
+        self.pool_maxsize = max_connections or Environment.API_POOL_MAXSIZE
+        self.timeout = (
+            connect_timeout if connect_timeout is not None else Environment.API_CONNECT_TIMEOUT,
+            read_timeout if read_timeout is not None else Environment.API_READ_TIMEOUT
+        )
+        self.prior_knowledge = prior_knowledge
+        self.retries = retries if retries is not None else Environment.API_RETRIES
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="http2-transport", daemon=True)
+        self._thread.start()
+
+    def _client(self, verify, cert, proxy):
+        """httpx клиент для сочетания verify/cert/прокси (создается при первом запросе)"""
+        key = (verify, cert, proxy)
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is None:
+                # httpx повторяет только неудачные подключения, запрос целиком не повторяется
+                client = httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(
+                    verify=_ssl_context(verify, cert),
+                    http1=not self.prior_knowledge,
+                    http2=True,
+                    retries=self.retries,
+                    limits=httpx.Limits(max_connections=self.pool_maxsize),
+                    proxy=proxy
+                ))
+                self._clients[key] = client
+            return client
+
+    def _timeout(self, timeout):
+        if timeout is None:
+            timeout = self.timeout
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        return httpx.Timeout(connect=connect, read=read, write=read, pool=connect)
+
+    def _trace(self, timing):
+        started = {}
+
+        async def trace(event, info):
+            if event == "connection.connect_tcp.started":
+                self.stats.record_connection()
+                started["connect"] = time.perf_counter()
+                if timing is not None:
+                    timing["reused"] = False
+            elif event in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+                if timing is not None and "connect" in started:
+                    timing["connect"] = time.perf_counter() - started["connect"]
+
+        return trace
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        headers = [(k, v) for k, v in request.headers.items() if k.lower() not in _HOP_BY_HOP_HEADERS]
+        if isinstance(cert, list):
+            cert = tuple(cert)
+        client = self._client(verify, cert, select_proxy(request.url, proxies or {}))
+        http_request = client.build_request(
+            request.method,
+            request.url,
+            headers=headers,
+            content=request.body,
+            timeout=self._timeout(timeout),
+            extensions={"trace": self._trace(current_request_timing())}
+        )
+        self.stats.record_request()
+        try:
+            try:
+                http_response = self._run(client.send(http_request))
+            except (httpx.WriteError, httpx.RemoteProtocolError):
+                # Сервер закрыл соединение (GOAWAY, лимит запросов на соединение):
+                # идемпотентный запрос повторяем один раз в новом соединении
+                if request.method not in IDEMPOTENT_METHODS:
+                    raise
+                http_response = self._run(client.send(http_request))
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(e, request=request)
+        except httpx.TimeoutException as e:
+            raise requests.ReadTimeout(e, request=request)
+        except httpx.ConnectError as e:
+            raise requests.ConnectionError(e, request=request)
+        except httpx.HTTPError as e:
+            raise requests.RequestException(e, request=request)
+
+        response = requests.Response()
+        response.status_code = http_response.status_code
+        response.reason = http_response.reason_phrase
+        # Тело уже распаковано httpx
+        response.headers = CaseInsensitiveDict(
+            (k, v) for k, v in http_response.headers.items() if k.lower() != "content-encoding"
+        )
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = http_response.content
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.http_version = http_response.http_version
+        # httpx считает время до конца чтения тела, requests - до заголовков: для ответов API разница мала
+        response.elapsed = http_response.elapsed
+        return response
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def close(self):
+        if self._loop.is_closed():
+            return
+        with self._clients_lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            self._run(client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def _ssl_context(verify, cert):
+    """SSL контекст по правилам requests: verify - bool или путь к CA файлу/каталогу, cert - файл или (файл, ключ)"""
+    if isinstance(verify, str):
+        context = ssl.create_default_context(
+            cafile=None if os.path.isdir(verify) else verify,
+            capath=verify if os.path.isdir(verify) else None
+        )
+    else:
+        context = httpx.create_ssl_context(verify=verify)
+    if cert:
+        if isinstance(cert, str):
+            context.load_cert_chain(cert)
+        else:
+            context.load_cert_chain(*cert)
+    return context
@@ -0,0 +1,75 @@
+import glob
+import json
+import os
+import threading
+
+
+def created_product_id(response):
+    """ID товара из ответа POST /products, None если его там нет (например, 200 только с сообщением)"""
+    if response.status_code not in (200, 201):
+        return None
+    try:
+        data = response.json()
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    product = data.get("product", data)
+    return product.get("id") if isinstance(product, dict) else None
+
+
+class ResourceLedger:
+    """Журнал товаров, созданных за запуск, для пакетной очистки в конце сессии.
+
+    Каждый процесс (воркер xdist) дописывает строки "+id" / "-id" в свой файл
+    в общем каталоге, поэтому межпроцессная блокировка не нужна. live_ids()
+    сворачивает журналы всех процессов в список еще не удаленных товаров.
+    """
+
+    PATTERN = "api-ledger-*.log"
+
+    def __init__(self, directory, name):
+        self.path = os.path.join(str(directory), f"api-ledger-{name}.log")
+        self._lock = threading.Lock()
+        self.stats = {"created": 0, "deleted": 0}
+
+    def _append(self, op, product_id):
+        # JSON сохраняет тип ID (число или строка) для последующего DELETE
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(f"{op}{json.dumps(product_id)}\n")
+
+    def add(self, product_id):
+        self._append("+", product_id)
+        self.stats["created"] += 1
+
+    def discard(self, product_id):
+        self._append("-", product_id)
+        self.stats["deleted"] += 1
+
+    @classmethod
+    def live_ids(cls, directory):
+        """ID созданных и не удаленных товаров по журналам всех процессов, в порядке создания"""
+        created = {}
+        deleted = set()
+        for path in sorted(glob.glob(os.path.join(str(directory), cls.PATTERN))):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        product_id = json.loads(line[1:])
+                    except ValueError:
+                        # Строка, недописанная упавшим процессом
+                        continue
+                    if line[0] == "+":
+                        created[product_id] = None
+                    elif line[0] == "-":
+                        deleted.add(product_id)
+        return [product_id for product_id in created if product_id not in deleted]
+
+
+def purge_leftovers(client, directory, max_workers=None):
+    """Пакетно удалить товары, оставшиеся в журналах, авторизованным client.
+
+    Возвращает результаты run_bulk; 404 тоже считается удалением.
+    """
+    return client.delete_products(ResourceLedger.live_ids(directory), max_workers=max_workers)
@@ -0,0 +1,137 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from src.api.transport import IDEMPOTENT_METHODS
+
+# Ответы, по которым сервер просит снизить нагрузку
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(value):
+    """Задержка из Retry-After в секундах (число секунд или HTTP дата), None если не разобрать"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveLimiter:
+    """Ограничитель числа одновременных запросов по схеме AIMD.
+
+    Пока ответы успешные, задержка в норме и занята хотя бы половина слотов,
+    лимит растет аддитивно (примерно на increase за каждые limit ответов).
+    На 429 / 503 или всплеск задержки (в spike_factor раз выше сглаженной)
+    лимит умножается на decrease, не чаще одного раза за cooldown секунд. Retry-After
+    приостанавливает выдачу новых слотов до указанного времени.
+    """
+
+    def __init__(self, initial=4, min_limit=1, max_limit=64, increase=1.0, decrease=0.5,
+                 spike_factor=3.0, cooldown=0.1, max_retries=3):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.spike_factor = spike_factor
+        self.cooldown = cooldown
+        self.max_retries = max_retries
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._latency = None
+        self._samples = 0
+        self._condition = threading.Condition()
+        self.stats = {"requests": 0, "throttled": 0, "latency_spikes": 0, "decreases": 0, "waited": 0.0}
+
+    @property
+    def limit(self):
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def acquire(self):
+        """Дождаться свободного слота (и окончания паузы Retry-After)"""
+        start = time.monotonic()
+        with self._condition:
+            while True:
+                pause = self._blocked_until - time.monotonic()
+                if pause > 0:
+                    self._condition.wait(pause)
+                elif self._in_flight >= self.limit:
+                    self._condition.wait()
+                else:
+                    break
+            self._in_flight += 1
+            self.stats["requests"] += 1
+            self.stats["waited"] += time.monotonic() - start
+
+    def release(self, response, elapsed):
+        """Освободить слот и скорректировать лимит по результату запроса"""
+        # Transport сам повторяет идемпотентные запросы после 429 / 503 с Retry-After;
+        # такие ответы видны только в истории повторов urllib3, но это тоже сигнал перегрузки
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+        retried_throttles = sum(
+            1 for attempt in getattr(retries, "history", ()) if attempt.status in THROTTLE_STATUSES
+        )
+        with self._condition:
+            self._in_flight -= 1
+            status = response.status_code if response is not None else None
+            self.stats["throttled"] += retried_throttles
+            if retried_throttles:
+                self._decrease()
+            if status in THROTTLE_STATUSES:
+                self.stats["throttled"] += 1
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None:
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+                self._decrease()
+            elif response is not None and not retried_throttles:
+                if self._is_spike(elapsed):
+                    self.stats["latency_spikes"] += 1
+                    self._decrease()
+                elif self._in_flight + 1 >= self.limit / 2:
+                    # Растем, только если лимит действительно используется
+                    self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+                self._observe(elapsed)
+            self._condition.notify_all()
+
+    def should_retry(self, method, response, attempt):
+        """Повторять ли запрос после ответа сервера о перегрузке.
+
+        429 означает, что запрос не обработан, поэтому повторяется любой метод;
+        503 - только идемпотентные.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if response.status_code == 429:
+            return True
+        return response.status_code == 503 and method in IDEMPOTENT_METHODS
+
+    def _decrease(self):
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.decrease)
+        self.stats["decreases"] += 1
+
+    def _is_spike(self, elapsed):
+        # Базовую задержку оцениваем только по достаточному числу ответов
+        return self._samples >= 10 and elapsed > self._latency * self.spike_factor
+
+    def _observe(self, elapsed):
+        self._samples += 1
+        self._latency = elapsed if self._latency is None else self._latency * 0.9 + elapsed * 0.1
+
+    def snapshot(self):
+        with self._condition:
+            return dict(self.stats, limit=self.limit, waited=round(self.stats["waited"], 3))
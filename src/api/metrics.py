@@ -0,0 +1,129 @@
+import json
+import math
+import threading
+from collections import defaultdict
+
+
+class RequestInfo:
+    """Данные одного HTTP запроса для хуков request_start / request_end.
+
+    Все времена в секундах. dns и connect равны нулю, если соединение
+    было взято из пула (reused=True).
+    """
+
+    def __init__(self, method, endpoint, url):
+        self.method = method
+        self.endpoint = endpoint
+        self.url = url
+        self.status = None
+        self.bytes = 0
+        self.dns = 0.0
+        self.connect = 0.0
+        self.ttfb = 0.0
+        self.total = 0.0
+        self.reused = True
+        self.error = None
+
+    def to_dict(self):
+        return dict(self.__dict__, error=repr(self.error) if self.error else None)
+
+
+class Histogram:
+    """Компактная гистограмма с логарифмическими корзинами (~2% точности)"""
+
+    GROWTH = 1.02
+
+    def __init__(self):
+        self.buckets = defaultdict(int)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value):
+        value = max(value, 1e-6)
+        self.buckets[math.floor(math.log(value, self.GROWTH))] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        for index, count in other.buckets.items():
+            self.buckets[index] += count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q):
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # Середина корзины, ограниченная реальными min/max
+                value = self.GROWTH ** (index + 0.5)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self, scale=1000.0):
+        """p50/p90/p99 и агрегаты, по умолчанию в миллисекундах"""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": round(self.sum / self.count * scale, 3),
+            "min": round(self.min * scale, 3),
+            "max": round(self.max * scale, 3),
+            "p50": round(self.percentile(50) * scale, 3),
+            "p90": round(self.percentile(90) * scale, 3),
+            "p99": round(self.percentile(99) * scale, 3),
+        }
+
+
+class LatencyCollector:
+    """Хук request_end, собирающий гистограммы задержек по эндпоинтам"""
+
+    PHASES = ("total", "ttfb", "connect", "dns")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints = {}
+
+    def __call__(self, info):
+        key = f"{info.method} {info.endpoint}"
+        with self._lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = {
+                    "histograms": {phase: Histogram() for phase in self.PHASES},
+                    "statuses": defaultdict(int),
+                    "bytes": 0,
+                    "reused": 0,
+                    "errors": 0,
+                }
+            for phase in self.PHASES:
+                stats["histograms"][phase].record(getattr(info, phase))
+            stats["statuses"][str(info.status)] += 1
+            stats["bytes"] += info.bytes
+            stats["reused"] += int(info.reused)
+            stats["errors"] += int(info.error is not None)
+
+    def summary(self):
+        with self._lock:
+            return {
+                key: {
+                    **{phase: stats["histograms"][phase].summary() for phase in self.PHASES},
+                    "statuses": dict(stats["statuses"]),
+                    "bytes": stats["bytes"],
+                    "reused_connections": stats["reused"],
+                    "errors": stats["errors"],
+                }
+                for key, stats in sorted(self.endpoints.items())
+            }
+
+    def to_json(self):
+        return json.dumps(self.summary(), indent=2, ensure_ascii=False)
@@ -0,0 +1,187 @@
+import collections
+import threading
+
+
+class PooledProduct:
+    """Товар из пула: ID и данные, с которыми он создан (и к которым сбрасывается)"""
+
+    def __init__(self, product_id, data):
+        self.id = product_id
+        self.data = data
+
+    def __repr__(self):
+        return f"PooledProduct(id={self.id!r}, name={self.data.get('name')!r})"
+
+
+class ProductPool:
+    """Пул заранее созданных одноразовых товаров, выдаваемых тестам монопольно.
+
+    Первый checkout() создает size товаров одним пакетом. checkin(product, dirty)
+    возвращает товар: измененный тестом сбрасывается PUT к исходным данным,
+    удаленный выбрасывается. Сбрасываются только поля товара: отзывы удалить
+    через API нельзя, они и рейтинг по ним остаются от прошлых тестов. Клиенту
+    пула нужен тот же кэш, что и тестам, иначе сброс не удалит из кэша ответы
+    с измененными данными. Сброс и пополнение пула, когда свободных товаров
+    меньше low_watermark, выполняет фоновый поток, поэтому подготовка теста
+    не делает ни одного запроса на запись. С background=False (например, при
+    записи кассеты, где важен порядок запросов) все выполняется синхронно
+    и последовательно.
+    """
+
+    def __init__(self, client, factory, size=3, low_watermark=1, background=True):
+        # client - авторизованный ApiClient, factory() -> данные нового товара
+        self.client = client
+        self.factory = factory
+        self.size = size
+        self.low_watermark = low_watermark
+        self.background = background
+        self._free = collections.deque()
+        self._resets = collections.deque()
+        self._checked_out = set()
+        self._seeded = False
+        self._busy = False
+        self._closed = False
+        self._worker = None
+        self._worker_alive = False
+        self._condition = threading.Condition()
+        self.stats = {"created": 0, "checkouts": 0, "resets": 0, "discarded": 0, "sync_creates": 0}
+
+    def _create(self, count):
+        # Без фонового потока важен порядок запросов, поэтому и пакет создается последовательно
+        results = self.client.create_products(
+            [self.factory() for _ in range(count)],
+            max_workers=None if self.background else 1
+        )
+        products = []
+        for result in results:
+            if not result.ok:
+                continue
+            product_id = self.client.resolve_product_id(result.item["name"], result.response)
+            if product_id is not None:
+                products.append(PooledProduct(product_id, result.item))
+        with self._condition:
+            self.stats["created"] += len(products)
+        return products
+
+    def _reset(self, product):
+        """Вернуть товару исходные данные; False если товара больше нет"""
+        response = self.client.update_product(product.id, product.data, method="PUT")
+        with self._condition:
+            self.stats["resets"] += 1
+        return response.status_code == 200
+
+    def checkout(self):
+        """Взять свободный товар, при необходимости дождавшись фонового сброса или пополнения"""
+        with self._condition:
+            if not self._seeded:
+                self._seeded = True
+                seed = True
+            else:
+                seed = False
+        if seed:
+            created = self._create(self.size)
+            with self._condition:
+                self._free.extend(created)
+                self._condition.notify_all()
+            if self.background:
+                self._worker_alive = True
+                self._worker = threading.Thread(target=self._run, name="product-pool", daemon=True)
+                self._worker.start()
+
+        with self._condition:
+            while not self._free and self._worker_alive and (self._busy or self._resets):
+                self._condition.wait()
+            if self._free:
+                product = self._free.popleft()
+                self._checked_out.add(product.id)
+                self.stats["checkouts"] += 1
+                self._condition.notify_all()
+                return product
+
+        # Пул пуст и пополнять его некому: товар для этого теста создается сразу
+        created = self._create(1)
+        if not created:
+            raise RuntimeError("Product pool could not create a product")
+        product = created[0]
+        with self._condition:
+            self._checked_out.add(product.id)
+            self.stats["checkouts"] += 1
+            self.stats["sync_creates"] += 1
+        return product
+
+    def checkin(self, product, dirty=False, deleted=False):
+        """Вернуть товар в пул после теста"""
+        with self._condition:
+            self._checked_out.discard(product.id)
+            if deleted:
+                self.stats["discarded"] += 1
+                return
+            if not dirty:
+                self._free.append(product)
+                self._condition.notify_all()
+                return
+            if self._worker_alive:
+                self._resets.append(product)
+                self._condition.notify_all()
+                return
+        if self._reset(product):
+            with self._condition:
+                self._free.append(product)
+        else:
+            with self._condition:
+                self.stats["discarded"] += 1
+
+    def _needs_refill(self):
+        return len(self._free) < self.low_watermark and not self._resets
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed and not self._resets and not self._needs_refill():
+                    self._condition.wait()
+                if self._closed:
+                    return
+                product = self._resets.popleft() if self._resets else None
+                self._busy = True
+            try:
+                if product is not None:
+                    keep = self._reset(product)
+                    with self._condition:
+                        if keep:
+                            self._free.append(product)
+                        else:
+                            self.stats["discarded"] += 1
+                else:
+                    created = self._create(self.size - len(self._free))
+                    if not created:
+                        raise RuntimeError("Product pool could not create products")
+                    with self._condition:
+                        self._free.extend(created)
+            except Exception:
+                # Сбой фоновой операции не должен ронять тесты: поток останавливается,
+                # дальше пул работает синхронно и ошибка проявится уже в самом тесте
+                with self._condition:
+                    if product is not None:
+                        self.stats["discarded"] += 1
+                    self._worker_alive = False
+                    self._busy = False
+                    self._condition.notify_all()
+                return
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+
+    def close(self):
+        """Остановить фоновый поток и удалить товары пула пакетом"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join()
+        with self._condition:
+            product_ids = [p.id for p in list(self._free) + list(self._resets)]
+            product_ids.extend(self._checked_out)
+            self._free.clear()
+            self._resets.clear()
+            self._checked_out.clear()
+        return self.client.delete_products(product_ids)
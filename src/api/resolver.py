@@ -0,0 +1,61 @@
+import threading
+from collections import OrderedDict
+
+
+class ProductIndex:
+    """Ограниченный по размеру индекс имя товара -> ID с вытеснением LRU.
+
+    Пополняется ответами на создание и обновление товаров и страницами
+    каталога, просмотренными при поиске. Потокобезопасен, поэтому один
+    индекс можно делить между всеми клиентами сессии.
+    """
+
+    def __init__(self, max_size=4096):
+        self.max_size = max_size
+        self._by_name = OrderedDict()
+        self._by_id = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def get(self, name):
+        with self._lock:
+            product_id = self._by_name.get(name)
+            if product_id is None:
+                self.stats["misses"] += 1
+                return None
+            self._by_name.move_to_end(name)
+            self.stats["hits"] += 1
+            return product_id
+
+    def add(self, name, product_id):
+        if name is None or product_id is None:
+            return
+        with self._lock:
+            # Товар переименован (PUT): старое имя больше не ведет к нему
+            old_name = self._by_id.get(product_id)
+            if old_name is not None and old_name != name:
+                self._by_name.pop(old_name, None)
+            if name in self._by_name:
+                self._by_id.pop(self._by_name[name], None)
+            self._by_name[name] = product_id
+            self._by_name.move_to_end(name)
+            self._by_id[product_id] = name
+            while len(self._by_name) > self.max_size:
+                _, evicted_id = self._by_name.popitem(last=False)
+                self._by_id.pop(evicted_id, None)
+                self.stats["evictions"] += 1
+
+    def observe(self, products):
+        """Запомнить товары из ответа списка или страницы каталога"""
+        for product in products:
+            if isinstance(product, dict):
+                self.add(product.get("name"), product.get("id"))
+
+    def discard(self, product_id):
+        with self._lock:
+            name = self._by_id.pop(product_id, None)
+            if name is not None:
+                self._by_name.pop(name, None)
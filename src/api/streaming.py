@@ -0,0 +1,105 @@
+import codecs
+import json
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+class _StreamBuffer:
+    """Текстовый буфер поверх потока байтовых чанков"""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def more(self):
+        """Дочитать следующий чанк, уже разобранная часть буфера отбрасывается"""
+        if self.eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self.eof = True
+            tail = self._utf8.decode(b"", final=True)
+        else:
+            tail = self._utf8.decode(chunk)
+        self.text = self.text[self.pos:] + tail
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Следующий непробельный символ или пустая строка в конце потока"""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.more():
+                return ""
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, got {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """Декодировать следующее целое JSON значение"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.more():
+                    raise
+                continue
+            # Число в конце буфера может быть обрезано на границе чанка
+            if end == len(self.text) and not self.eof:
+                self.more()
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_array(buffer):
+    buffer.expect("[")
+    if buffer.peek() == "]":
+        buffer.pos += 1
+        return
+    while True:
+        yield buffer.value()
+        separator = buffer.peek()
+        buffer.pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Unexpected {separator!r} in JSON array")
+
+
+def iter_json_items(chunks, key, meta=None):
+    """По одному отдавать элементы массива data[key] из потока JSON.
+
+    В памяти одновременно держится только текущий элемент. Остальные
+    поля верхнего уровня (total, page и т.д.) складываются в meta.
+    Если корень документа сам является массивом, перебираются его элементы.
+    """
+    buffer = _StreamBuffer(chunks)
+    if buffer.peek() == "[":
+        yield from _iter_array(buffer)
+        return
+
+    buffer.expect("{")
+    while buffer.peek() != "}":
+        name = buffer.value()
+        buffer.expect(":")
+        if name == key and buffer.peek() == "[":
+            yield from _iter_array(buffer)
+        else:
+            value = buffer.value()
+            if meta is not None:
+                meta[name] = value
+        if buffer.peek() == ",":
+            buffer.pos += 1
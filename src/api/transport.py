@@ -0,0 +1,196 @@
+import socket
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.retry import Retry
+from config.environment import Environment
+
+# Повторяем только идемпотентные методы: POST и PATCH могут создать дубликаты
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = (502, 503, 504)
+
+# Тайминги соединения текущего запроса в этом потоке (заполняются при connect)
+_timing = threading.local()
+
+
+def begin_request_timing():
+    """Начать сбор таймингов соединения для запроса в текущем потоке"""
+    _timing.current = {"dns": 0.0, "connect": 0.0, "reused": True}
+    return _timing.current
+
+
+def current_request_timing():
+    """Тайминги текущего запроса в этом потоке или None вне ApiClient"""
+    return getattr(_timing, "current", None)
+
+
+def end_request_timing():
+    current = getattr(_timing, "current", None)
+    _timing.current = None
+    return current
+
+
+class TransportStats:
+    """Счетчики переиспользования соединений пула"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+    @property
+    def reused_connections(self):
+        return max(self.requests - self.new_connections, 0)
+
+    @property
+    def reuse_ratio(self):
+        return self.reused_connections / self.requests if self.requests else 0.0
+
+    def snapshot(self):
+        with self._lock:
+            requests, new_connections = self.requests, self.new_connections
+        return {
+            "requests": requests,
+            "new_connections": new_connections,
+            "reused_connections": max(requests - new_connections, 0),
+        }
+
+
+def _timed_connect(conn, connect):
+    """Подключиться, отдельно замерив DNS и установку соединения (вместе с TLS)"""
+    timing = current_request_timing()
+    if timing is None:
+        return connect()
+
+    timing["reused"] = False
+    host = conn._dns_host
+    start = time.perf_counter()
+    try:
+        address = socket.getaddrinfo(host, conn.port, 0, socket.SOCK_STREAM)[0][4][0]
+    except OSError:
+        address = None
+    resolved = time.perf_counter()
+    timing["dns"] += resolved - start
+
+    # Подключаемся к уже разрешенному адресу, чтобы не делать DNS запрос дважды.
+    # conn.host на время connect становится адресом, поэтому для TLS (SNI и проверка
+    # сертификата) имя хоста задается явно через server_hostname. Через туннель прокси
+    # адрес не подставляется: там _dns_host - сам прокси, а SNI берется из имени цели
+    tunneling = getattr(conn, "_tunnel_host", None) is not None
+    substitute = address is not None and not tunneling
+    server_hostname = getattr(conn, "server_hostname", None)
+    try:
+        if substitute:
+            conn._dns_host = address
+            if isinstance(conn, HTTPSConnection) and server_hostname is None:
+                conn.server_hostname = host
+        try:
+            connect()
+        except NewConnectionError:
+            # Не удалось открыть TCP соединение с первым адресом: urllib3 перебирает все адреса имени.
+            # Ошибки TLS рукопожатия сюда не попадают и повторного подключения не вызывают
+            if not substitute:
+                raise
+            conn._dns_host = host
+            connect()
+    finally:
+        conn._dns_host = host
+        if isinstance(conn, HTTPSConnection):
+            conn.server_hostname = server_hostname
+        timing["connect"] += time.perf_counter() - resolved
+
+
+def _counting_pool_classes(stats):
+    """Классы пулов urllib3, которые считают запросы и новые соединения"""
+
+    class CountingHTTPConnection(HTTPConnection):
+        def connect(self):
+            stats.record_connection()
+            _timed_connect(self, super().connect)
+
+    class CountingHTTPSConnection(HTTPSConnection):
+        def connect(self):
+            stats.record_connection()
+            _timed_connect(self, super().connect)
+
+    class CountingHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = CountingHTTPConnection
+
+        def _make_request(self, *args, **kwargs):
+            stats.record_request()
+            return super()._make_request(*args, **kwargs)
+
+    class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = CountingHTTPSConnection
+
+        def _make_request(self, *args, **kwargs):
+            stats.record_request()
+            return super()._make_request(*args, **kwargs)
+
+    return {"http": CountingHTTPConnectionPool, "https": CountingHTTPSConnectionPool}
+
+
+class Transport(HTTPAdapter):
+    """HTTP адаптер с настраиваемым пулом, keep-alive, таймаутами и повторами.
+
+    Один экземпляр можно смонтировать в несколько ApiClient,
+    тогда они делят соединения (и TLS сессии) между собой.
+    """
+
+    def __init__(self, pool_connections=None, pool_maxsize=None, pool_block=False,
+                 keep_alive=True, connect_timeout=None, read_timeout=None,
+                 retries=None, backoff_factor=0.3, backoff_jitter=0.2):
+        self.stats = TransportStats()
+        self.keep_alive = keep_alive
+        self.pool_maxsize = pool_maxsize or Environment.API_POOL_MAXSIZE
+        self.timeout = (
+            connect_timeout if connect_timeout is not None else Environment.API_CONNECT_TIMEOUT,
+            read_timeout if read_timeout is not None else Environment.API_READ_TIMEOUT
+        )
+        retries = retries if retries is not None else Environment.API_RETRIES
+        max_retries = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            allowed_methods=IDEMPOTENT_METHODS,
+            status_forcelist=RETRY_STATUSES,
+            backoff_factor=backoff_factor,
+            backoff_jitter=backoff_jitter,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        super().__init__(
+            pool_connections=pool_connections or Environment.API_POOL_CONNECTIONS,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=max_retries,
+            pool_block=pool_block
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.keep_alive:
+            pool_kwargs.setdefault(
+                "socket_options",
+                HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            )
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = _counting_pool_classes(self.stats)
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        if not self.keep_alive:
+            request.headers["Connection"] = "close"
+        return super().send(request, timeout=timeout, **kwargs)
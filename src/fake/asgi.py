@@ -0,0 +1,102 @@
+import asyncio
+import socket
+import threading
+from urllib.parse import parse_qsl
+
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from src.fake.store import FakeStore
+
+
+class FakeStoreASGI:
+    """ASGI приложение поверх FakeStore"""
+
+    def __init__(self, store=None):
+        self.store = store or FakeStore()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        # FakeStore читает заголовки через get("Authorization") / get("If-None-Match")
+        headers = {name.decode("latin-1").title(): value.decode("latin-1") for name, value in scope["headers"]}
+        status, response_headers, content = self.store.handle(
+            scope["method"], scope["path"], dict(parse_qsl(scope["query_string"].decode())), body, headers
+        )
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(k.lower().encode(), v.encode()) for k, v in response_headers.items()]
+            + [(b"content-length", str(len(content)).encode())],
+        })
+        await send({"type": "http.response.body", "body": content})
+
+
+class Http2FakeStoreServer:
+    """FakeStore под Hypercorn: HTTP/1.1 и HTTP/2 без TLS (h2c prior knowledge) на одном порту"""
+
+    def __init__(self, store=None, host="127.0.0.1", port=0):
+        self.store = store or FakeStore()
+        self._socket = socket.create_server((host, port))
+        self._address = self._socket.getsockname()[:2]
+        self._loop = None
+        self._shutdown = None
+        self._started = threading.Event()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._address
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self):
+        return f"{self.url}/api"
+
+    def _run(self):
+        config = Config()
+        config.bind = [f"fd://{self._socket.fileno()}"]
+        config.accesslog = None
+        config.errorlog = None
+        # По умолчанию Hypercorn закрывает соединение (GOAWAY) после 1000 запросов
+        config.keep_alive_max_requests = 2 ** 31
+        self._loop = asyncio.new_event_loop()
+        self._shutdown = asyncio.Event()
+        self._loop.call_soon(self._started.set)
+        self._loop.run_until_complete(serve(FakeStoreASGI(self.store), config, shutdown_trigger=self._shutdown.wait))
+        self._loop.close()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="fake-store-h2", daemon=True)
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def stop(self):
+        if self._thread is None:
+            self._socket.close()
+            return
+        self._loop.call_soon_threadsafe(self._shutdown.set)
+        self._thread.join()
+        # Hypercorn сам закрывает переданный ему дескриптор
+        self._socket.detach()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
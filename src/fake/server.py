@@ -0,0 +1,115 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from src.fake.store import FakeStore
+
+
+class _FakeStoreHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Буферизованная запись + TCP_NODELAY: заголовки и тело уходят одним пакетом
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def _handle(self):
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        if not self.server.admit():
+            self._write(429, {"Content-Type": "application/json", "Retry-After": self.server.retry_after},
+                        b'{"error": "Too many requests"}')
+            return
+        try:
+            if self.server.latency:
+                time.sleep(self.server.latency)
+            status, headers, content = self.server.store.handle(
+                self.command, url.path, dict(parse_qsl(url.query)), body, self.headers
+            )
+        finally:
+            self.server.leave()
+        self._write(status, headers, content)
+
+    def _write(self, status, headers, content):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _FakeStoreHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, store, max_concurrency, latency, retry_after):
+        super().__init__(address, _FakeStoreHandler)
+        self.store = store
+        self.max_concurrency = max_concurrency
+        self.latency = latency
+        self.retry_after = str(retry_after)
+        self.active = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def admit(self):
+        with self._lock:
+            if self.max_concurrency is not None and self.active >= self.max_concurrency:
+                self.rejected += 1
+                return False
+            self.active += 1
+            return True
+
+    def leave(self):
+        with self._lock:
+            self.active -= 1
+
+
+class FakeStoreServer:
+    """Локальный HTTP сервер поверх FakeStore, запускается в фоновом потоке.
+
+    max_concurrency и latency имитируют перегруженный бэкенд: запросы сверх
+    лимита одновременных получают 429 с Retry-After, каждый ответ задерживается
+    на latency секунд.
+    """
+
+    def __init__(self, store=None, host="127.0.0.1", port=0, max_concurrency=None, latency=0.0, retry_after=1):
+        self.store = store or FakeStore()
+        self._server = _FakeStoreHTTPServer((host, port), self.store, max_concurrency, latency, retry_after)
+        self._thread = None
+
+    @property
+    def rejected(self):
+        """Сколько запросов отклонено с 429"""
+        return self._server.rejected
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self):
+        return f"{self.url}/api"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-store", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,365 @@
+import base64
+import bisect
+import hashlib
+import itertools
+import json
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+SEED_PRODUCTS = [
+    {"name": "Wireless Headphones", "description": "Bluetooth over-ear headphones", "price": 199.99,
+     "category": "Electronics", "stock": 50, "imageUrl": "/headphones.png"},
+    {"name": "Noise Cancelling Headphones", "description": "Active noise cancelling", "price": 299.99,
+     "category": "Electronics", "stock": 30, "imageUrl": "/anc-headphones.png"},
+    {"name": "Smartphone X", "description": "6.5 inch OLED smartphone", "price": 899.0,
+     "category": "Electronics", "stock": 20, "imageUrl": "/phone.png"},
+    {"name": "USB-C Charger", "description": "65W fast charger", "price": 39.99,
+     "category": "Electronics", "stock": 120, "imageUrl": "/charger.png"},
+    {"name": "Mechanical Keyboard", "description": "Hot-swappable mechanical keyboard", "price": 129.99,
+     "category": "Electronics", "stock": 45, "imageUrl": "/keyboard.png"},
+    {"name": "Coffee Maker", "description": "Drip coffee maker, 12 cups", "price": 79.5,
+     "category": "Home", "stock": 25, "imageUrl": "/coffee.png"},
+    {"name": "Desk Lamp", "description": "LED desk lamp with dimmer", "price": 45.0,
+     "category": "Home", "stock": 60, "imageUrl": "/lamp.png"},
+    {"name": "Robot Vacuum", "description": "Self-charging robot vacuum", "price": 249.0,
+     "category": "Home", "stock": 15, "imageUrl": "/vacuum.png"},
+    {"name": "Yoga Mat", "description": "Non-slip yoga mat", "price": 25.0,
+     "category": "Sports", "stock": 80, "imageUrl": "/yoga.png"},
+    {"name": "Running Shoes", "description": "Lightweight running shoes", "price": 119.0,
+     "category": "Sports", "stock": 35, "imageUrl": "/shoes.png"},
+    {"name": "Python Cookbook", "description": "Recipes for mastering Python", "price": 49.9,
+     "category": "Books", "stock": 40, "imageUrl": "/book.png"},
+    {"name": "Winter Jacket", "description": "Waterproof insulated jacket", "price": 159.0,
+     "category": "Clothing", "stock": 18, "imageUrl": "/jacket.png"},
+]
+
+SEED_USERS = [{"username": "admin", "password": "admin123", "email": "admin@example.com", "role": "admin"}]
+
+REQUIRED_PRODUCT_FIELDS = ["name", "price", "category", "stock"]
+TOKEN_TTL = 3600
+
+_ROUTES = [
+    ("POST", re.compile(r"^/auth/login$"), "login"),
+    ("POST", re.compile(r"^/auth/register$"), "register"),
+    ("GET", re.compile(r"^/products$"), "list_products"),
+    ("POST", re.compile(r"^/products$"), "create_product"),
+    ("GET", re.compile(r"^/products/(?P<id>[^/]+)$"), "get_product"),
+    ("PUT", re.compile(r"^/products/(?P<id>[^/]+)$"), "put_product"),
+    ("PATCH", re.compile(r"^/products/(?P<id>[^/]+)$"), "patch_product"),
+    ("DELETE", re.compile(r"^/products/(?P<id>[^/]+)$"), "delete_product"),
+    ("GET", re.compile(r"^/products/(?P<id>[^/]+)/review$"), "list_reviews"),
+    ("POST", re.compile(r"^/products/(?P<id>[^/]+)/review$"), "create_review"),
+    ("GET", re.compile(r"^/categories$"), "list_categories"),
+]
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _number(value):
+    """Число из параметра запроса или None, если оно невалидно"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_valid_price(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _make_token(username):
+    # Токен в формате JWT (без подписи), чтобы клиенты могли прочитать exp
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    header = encode({"alg": "none", "typ": "JWT"})
+    payload = encode({"sub": username, "exp": int(time.time()) + TOKEN_TTL, "jti": uuid.uuid4().hex})
+    return f"{header}.{payload}.fake"
+
+
+class FakeStore:
+    """In-memory реализация API магазина с индексами по имени, категории и цене.
+
+    handle() не зависит от HTTP сервера: принимает метод, путь, параметры,
+    тело и заголовки и возвращает (status, headers, body).
+    """
+
+    def __init__(self, seed=True):
+        self._lock = threading.RLock()
+        self._ids = itertools.count(1)
+        self.products = {}
+        self.reviews = {}
+        self.users = {}
+        self.tokens = {}
+        self._by_name = {}
+        self._by_category = {}
+        self._by_price = []
+        self.request_count = 0
+
+        for user in SEED_USERS:
+            self.users[user["username"]] = dict(user)
+        if seed:
+            for product in SEED_PRODUCTS:
+                self._insert(dict(product))
+
+    # Индексы
+
+    def _index(self, product):
+        self._by_name[product["name"].lower()] = product["id"]
+        self._by_category.setdefault(product["category"], {})[product["id"]] = None
+        bisect.insort(self._by_price, (product["price"], product["_seq"], product["id"]))
+
+    def _unindex(self, product):
+        self._by_name.pop(product["name"].lower(), None)
+        category_ids = self._by_category.get(product["category"], {})
+        category_ids.pop(product["id"], None)
+        if not category_ids:
+            self._by_category.pop(product["category"], None)
+        key = (product["price"], product["_seq"], product["id"])
+        index = bisect.bisect_left(self._by_price, key)
+        if index < len(self._by_price) and self._by_price[index] == key:
+            del self._by_price[index]
+
+    def _insert(self, data):
+        seq = next(self._ids)
+        product = {
+            "id": str(seq),
+            "name": data["name"],
+            "description": data.get("description", ""),
+            "price": data["price"],
+            "category": data["category"],
+            "stock": data["stock"],
+            "imageUrl": data.get("imageUrl", ""),
+            "rating": 0,
+            "createdAt": _now(),
+            "updatedAt": _now(),
+            "_seq": seq,
+        }
+        self.products[product["id"]] = product
+        self.reviews[product["id"]] = []
+        self._index(product)
+        return product
+
+    def _replace(self, product, changes):
+        self._unindex(product)
+        product.update(changes)
+        product["updatedAt"] = _now()
+        self._index(product)
+        return product
+
+    @staticmethod
+    def _public(product):
+        return {key: value for key, value in product.items() if not key.startswith("_")}
+
+    def _query(self, category=None, min_price=None, max_price=None, search=None):
+        """Отбор товаров: сначала по самому узкому индексу, затем фильтрами"""
+        if category is not None:
+            candidates = [self.products[pid] for pid in self._by_category.get(category, {})]
+        elif min_price is not None or max_price is not None:
+            low = bisect.bisect_left(self._by_price, (min_price if min_price is not None else float("-inf"),))
+            high = bisect.bisect_right(self._by_price, (max_price if max_price is not None else float("inf"), float("inf")))
+            candidates = sorted((self.products[pid] for _, _, pid in self._by_price[low:high]),
+                                key=lambda p: p["_seq"])
+        else:
+            candidates = list(self.products.values())
+
+        if min_price is not None:
+            candidates = [p for p in candidates if p["price"] >= min_price]
+        if max_price is not None:
+            candidates = [p for p in candidates if p["price"] <= max_price]
+        if search:
+            needle = search.lower()
+            candidates = [p for p in candidates if needle in p["name"].lower()]
+        return candidates
+
+    # HTTP
+
+    def handle(self, method, path, query, body, headers):
+        """Обработать запрос и вернуть (status, headers, body bytes)"""
+        with self._lock:
+            self.request_count += 1
+        if path.startswith("/api"):
+            path = path[len("/api"):]
+
+        for route_method, pattern, name in _ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                try:
+                    payload = json.loads(body) if body else {}
+                except ValueError:
+                    return self._response(400, {"error": "Invalid JSON body"})
+                if not isinstance(payload, dict):
+                    return self._response(400, {"error": "JSON body must be an object"})
+                try:
+                    with self._lock:
+                        status, data = getattr(self, f"_route_{name}")(
+                            payload=payload, query=query, headers=headers, **match.groupdict()
+                        )
+                except Exception as e:
+                    # Как настоящий бэкенд: необработанная ошибка - это 500, а не оборванное соединение
+                    return self._response(500, {"error": "Internal server error", "detail": type(e).__name__})
+                return self._response(status, data, headers if method == "GET" else None)
+
+        if any(pattern.match(path) for _, pattern, _ in _ROUTES):
+            return self._response(405, {"error": "Method not allowed"})
+        return self._response(404, {"error": "Not found"})
+
+    @staticmethod
+    def _response(status, data, request_headers=None):
+        body = json.dumps(data).encode()
+        headers = {"Content-Type": "application/json"}
+        if request_headers is not None and status == 200:
+            etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            headers["ETag"] = etag
+            if request_headers.get("If-None-Match") == etag:
+                return 304, headers, b""
+        return status, headers, body
+
+    def _authorized(self, headers):
+        auth = headers.get("Authorization") or ""
+        token = auth[len("Bearer "):] if auth.startswith("Bearer ") else None
+        expires_at = self.tokens.get(token)
+        return expires_at is not None and expires_at > time.time()
+
+    # Маршруты
+
+    def _route_login(self, payload, **_):
+        username, password = payload.get("username"), payload.get("password")
+        if not username or not password:
+            return 400, {"error": "Username and password are required"}
+        user = self.users.get(username)
+        if user is None or user["password"] != password:
+            return 401, {"error": "Invalid credentials"}
+        token = _make_token(username)
+        self.tokens[token] = time.time() + TOKEN_TTL
+        return 200, {"token": token, "user": {"username": username, "email": user["email"], "role": user["role"]}}
+
+    def _route_register(self, payload, **_):
+        missing = [field for field in ("username", "password", "email") if not payload.get(field)]
+        if missing:
+            return 400, {"error": "Missing required fields", "required": missing}
+        if payload["username"] in self.users:
+            return 409, {"error": "Username already exists"}
+        user = {"username": payload["username"], "password": payload["password"],
+                "email": payload["email"], "role": "user"}
+        self.users[user["username"]] = user
+        return 201, {"message": "User registered successfully",
+                     "user": {"username": user["username"], "email": user["email"], "role": user["role"]}}
+
+    def _route_list_products(self, query, **_):
+        products = self._query(
+            category=query.get("category"),
+            min_price=_number(query.get("minPrice")),
+            max_price=_number(query.get("maxPrice")),
+            search=query.get("search"),
+        )
+        total = len(products)
+        page, limit = _number(query.get("page")), _number(query.get("limit"))
+        if page and limit and page >= 1 and limit >= 1:
+            start = (int(page) - 1) * int(limit)
+            products = products[start:start + int(limit)]
+        return 200, {"products": [self._public(p) for p in products], "total": total}
+
+    def _validate_product(self, payload, required):
+        missing = [field for field in required if payload.get(field) in (None, "")]
+        if missing:
+            return {"error": "Missing required fields", "required": missing}
+        if "price" in payload and not _is_valid_price(payload["price"]):
+            return {"error": "Price must be a number"}
+        if "stock" in payload and not _is_valid_price(payload["stock"]):
+            return {"error": "Stock must be a number"}
+        for field in ("name", "category", "description", "imageUrl"):
+            if field in payload and not isinstance(payload[field], str):
+                return {"error": f"{field} must be a string"}
+        return None
+
+    def _route_create_product(self, payload, headers, **_):
+        if not self._authorized(headers):
+            return 401, {"error": "Unauthorized"}
+        error = self._validate_product(payload, REQUIRED_PRODUCT_FIELDS)
+        if error:
+            return 400, error
+        if payload["name"].lower() in self._by_name:
+            return 409, {"error": "Product with this name already exists"}
+        product = self._insert(payload)
+        return 201, {"message": "Product created successfully", "product": self._public(product)}
+
+    def _route_get_product(self, id, **_):
+        product = self.products.get(id)
+        if product is None:
+            return 404, {"error": "Product not found"}
+        return 200, {"product": self._public(product)}
+
+    def _update_product(self, id, payload, headers, required):
+        if not self._authorized(headers):
+            return 401, {"error": "Unauthorized"}
+        product = self.products.get(id)
+        if product is None:
+            return 404, {"error": "Product not found"}
+        error = self._validate_product(payload, required)
+        if error:
+            return 400, error
+        changes = {key: payload[key] for key in
+                   ("name", "description", "price", "category", "stock", "imageUrl") if key in payload}
+        # Переименование в имя другого товара - тот же конфликт, что и при создании
+        if "name" in changes and self._by_name.get(changes["name"].lower(), id) != id:
+            return 409, {"error": "Product with this name already exists"}
+        self._replace(product, changes)
+        return 200, {"message": "Product updated successfully", "product": self._public(product)}
+
+    def _route_put_product(self, id, payload, headers, **_):
+        return self._update_product(id, payload, headers, REQUIRED_PRODUCT_FIELDS + ["description"])
+
+    def _route_patch_product(self, id, payload, headers, **_):
+        return self._update_product(id, payload, headers, [])
+
+    def _route_delete_product(self, id, headers, **_):
+        if not self._authorized(headers):
+            return 401, {"error": "Unauthorized"}
+        product = self.products.pop(id, None)
+        if product is None:
+            return 404, {"error": "Product not found"}
+        self._unindex(product)
+        self.reviews.pop(id, None)
+        return 200, {"message": "Product deleted successfully", "product": self._public(product)}
+
+    def _route_list_reviews(self, id, **_):
+        if id not in self.products:
+            return 404, {"error": "Product not found"}
+        reviews = self.reviews[id]
+        return 200, {"reviews": reviews, "total": len(reviews)}
+
+    def _route_create_review(self, id, payload, headers, **_):
+        if not self._authorized(headers):
+            return 401, {"error": "Unauthorized"}
+        product = self.products.get(id)
+        if product is None:
+            return 404, {"error": "Product not found"}
+        rating = payload.get("rating")
+        if not isinstance(rating, int) or isinstance(rating, bool) or not 1 <= rating <= 5:
+            return 400, {"error": "Rating must be an integer between 1 and 5"}
+        if not isinstance(payload.get("comment"), str) or not payload["comment"].strip():
+            return 400, {"error": "Comment is required"}
+        if not isinstance(payload.get("author", ""), str):
+            return 400, {"error": "Author must be a string"}
+        review = {
+            "id": uuid.uuid4().hex[:12],
+            "productId": id,
+            "rating": rating,
+            "comment": payload["comment"],
+            "author": payload.get("author", "Anonymous"),
+            "createdAt": _now(),
+        }
+        reviews = self.reviews[id]
+        reviews.append(review)
+        product["rating"] = round(sum(r["rating"] for r in reviews) / len(reviews), 2)
+        return 201, {"message": "Review added successfully", "review": review}
+
+    def _route_list_categories(self, **_):
+        categories = sorted(self._by_category)
+        return 200, {"categories": categories, "total": len(categories)}
@@ -0,0 +1,61 @@
+import argparse
+import sys
+
+from config.environment import Environment
+from src.api.client import ApiClient
+from src.api.transport import Transport
+from src.fake.server import FakeStoreServer
+from src.fuzz.engine import TARGETS, Fuzzer
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.fuzz",
+        description="Фаззинг валидации товаров и отзывов через ApiClient"
+    )
+    parser.add_argument("--cases", type=int, default=2000, help="Число сгенерированных запросов")
+    parser.add_argument("--workers", type=int, default=16, help="Число параллельных потоков")
+    parser.add_argument("--seed", type=int, default=0, help="Seed генератора данных")
+    parser.add_argument("--target", action="append", choices=TARGETS, default=None,
+                        help="Эндпоинт для фаззинга (можно несколько, по умолчанию все)")
+    parser.add_argument("--outlier-factor", type=float, default=5.0,
+                        help="Выброс - ответ медленнее медианы валидных данных во столько раз")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", default=None, help=f"URL API (по умолчанию {Environment.API_URL})")
+    target.add_argument("--fake-api", action="store_true", help="Запустить локальный fake API")
+    parser.add_argument("--json", metavar="PATH", default=None, help="Сохранить отчет в JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    server = FakeStoreServer().start() if args.fake_api else None
+    base_url = server.api_url if server else args.base_url or Environment.API_URL
+    client = ApiClient(base_url=base_url, transport=Transport(pool_maxsize=args.workers))
+    try:
+        response = client.login(Environment.TEST_USER["username"], Environment.TEST_USER["password"])
+        if client.token is None:
+            print(f"Login failed with status {response.status_code}", file=sys.stderr)
+            return 2
+        report = Fuzzer(
+            client,
+            targets=args.target or TARGETS,
+            cases=args.cases,
+            workers=args.workers,
+            seed=args.seed,
+            outlier_factor=args.outlier_factor
+        ).run()
+    finally:
+        client.transport.close()
+        if server is not None:
+            server.stop()
+
+    print(report.format_table())
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            f.write(report.to_json())
+    return 1 if report.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+import json
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from src.api.breaker import CircuitOpenError
+from src.api.contracts import ContractError, validate_response
+from src.api.ledger import created_product_id
+from src.api.metrics import Histogram
+from src.fuzz.payloads import PRODUCT_CLASSES, REVIEW_CLASSES, summarize, valid_product
+
+TARGETS = ("create_product", "update_product", "create_review")
+
+# Кейс -> (метод, шаблон пути) для проверки ответа по контракту; обновление - по методу кейса
+CONTRACT_ENDPOINTS = {
+    "create_product": ("POST", "/products"),
+    "PUT": ("PUT", "/products/{id}"),
+    "PATCH": ("PATCH", "/products/{id}"),
+    "create_review": ("POST", "/products/{id}/review"),
+}
+
+
+class FuzzCase:
+    """Один сгенерированный запрос: эндпоинт, класс данных, данные и метод обновления"""
+
+    def __init__(self, index, target, payload_class, payload, method=None):
+        self.index = index
+        self.target = target
+        self.payload_class = payload_class
+        self.payload = payload
+        self.method = method
+
+    @property
+    def key(self):
+        return f"{self.target}/{self.payload_class.name}"
+
+    def with_payload(self, payload):
+        return FuzzCase(self.index, self.target, self.payload_class, payload, self.method)
+
+
+class FuzzFailure:
+    """Нарушенное свойство: первый воспроизводящий кейс, число повторов и минимизированные данные"""
+
+    def __init__(self, case, reason):
+        self.case = case
+        self.reason = reason
+        self.count = 1
+        self.shrunk = None
+        self.shrink_steps = 0
+
+    def to_dict(self):
+        return {
+            "target": self.case.target,
+            "method": self.case.method,
+            "payload_class": self.case.payload_class.name,
+            "reason": self.reason,
+            "count": self.count,
+            "payload": summarize(self.case.payload),
+            "shrunk": self.shrunk,
+            "shrink_steps": self.shrink_steps,
+        }
+
+
+def _simpler(value):
+    """Более простые значения того же поля, от самого простого"""
+    if value is None:
+        return []
+    if isinstance(value, bool):
+        return [False] if value else []
+    if isinstance(value, (int, float)):
+        candidates = [0, 1]
+        if isinstance(value, float) and value == value and abs(value) < 2 ** 63:
+            candidates.append(int(value))
+        candidates.append(value // 2 if isinstance(value, int) else value / 2)
+        return [c for c in candidates if c != value or type(c) is not type(value)]
+    if isinstance(value, str):
+        ascii_only = value.encode("ascii", "ignore").decode()
+        candidates = ["", value[:len(value) // 2], value[len(value) // 2:], ascii_only]
+        return [c for c in candidates if c != value]
+    if isinstance(value, list):
+        return [[]] + ([value[:1]] if len(value) > 1 else [])
+    if isinstance(value, dict):
+        return [{}] if value else []
+    return []
+
+
+def shrink_candidates(payload):
+    """Кандидаты на минимизацию: сначала удаление полей, затем упрощение значений"""
+    for key in payload:
+        yield {k: v for k, v in payload.items() if k != key}
+    for key, value in payload.items():
+        for simpler in _simpler(value):
+            yield dict(payload, **{key: simpler})
+
+
+class Fuzzer:
+    """Генеративный фаззинг валидации товаров и отзывов через ApiClient.
+
+    Кейсы строятся детерминированно из seed и номера кейса, равномерно по
+    эндпоинтам и классам данных, и отправляются параллельно в workers потоков.
+    Свойства: нет 5xx и сетевых ошибок, тело ответа - JSON и соответствует
+    контракту эндпоинта, заведомо валидные данные принимаются. Первый кейс
+    каждого нарушения минимизируется повторными запросами, пока нарушение
+    воспроизводится с той же причиной.
+
+    client должен быть авторизован. Созданные товары удаляются в конце прогона.
+    """
+
+    def __init__(self, client, targets=TARGETS, cases=1000, workers=16, seed=0, outlier_factor=5.0,
+                 max_shrink_steps=200, cleanup=True):
+        self.client = client
+        self.targets = tuple(targets)
+        self.cases = cases
+        self.workers = workers
+        self.seed = seed
+        self.outlier_factor = outlier_factor
+        self.max_shrink_steps = max_shrink_steps
+        self.cleanup = cleanup
+        # Часть уникального суффикса имен, чтобы повторный прогон с тем же seed не получал 409
+        self.run_id = uuid.uuid4().hex[:6]
+        self._lock = threading.Lock()
+        self._target_id = None
+        self.created_ids = []
+        self.latency = defaultdict(Histogram)
+        self.samples = defaultdict(list)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.failures = {}
+
+    def _classes(self, target):
+        return REVIEW_CLASSES if target == "create_review" else PRODUCT_CLASSES
+
+    def generate(self, index):
+        """Кейс номер index; одинаковый seed дает одинаковые данные"""
+        rng = random.Random(f"{self.seed}:{index}")
+        target = self.targets[index % len(self.targets)]
+        classes = self._classes(target)
+        payload_class = classes[sorted(classes)[index // len(self.targets) % len(classes)]]
+        payload = payload_class.generate(rng, f"{self.run_id}{index:06d}")
+        method = rng.choice(["PUT", "PATCH"]) if target == "update_product" else None
+        return FuzzCase(index, target, payload_class, payload, method)
+
+    def _send(self, case):
+        if case.target == "create_product":
+            response = self.client.create_product(case.payload)
+            product_id = created_product_id(response)
+            name = case.payload.get("name")
+            if product_id is None and response.status_code in (200, 201) and isinstance(name, str):
+                # Ответ только с сообщением: без ID товар не удалился бы в конце прогона
+                product_id = self.client.resolve_product_id(name)
+            if product_id is not None:
+                with self._lock:
+                    self.created_ids.append(product_id)
+            return response
+        if case.target == "update_product":
+            return self.client.update_product(self._target_id, case.payload, method=case.method)
+        return self.client.create_review(self._target_id, case.payload)
+
+    def check(self, case, response):
+        """Причина нарушения свойства или None"""
+        status = response.status_code
+        if status >= 500:
+            return f"server error {status}"
+        try:
+            body = response.json()
+        except ValueError:
+            return f"non-JSON response {status}"
+        if case.payload_class.valid and not 200 <= status < 300:
+            error = body.get("error") if isinstance(body, dict) else None
+            return f"valid payload rejected with {status}: {error}"
+        try:
+            validate_response(*CONTRACT_ENDPOINTS[case.method or case.target], response)
+        except ContractError as e:
+            return f"contract violation: {e}"
+        return None
+
+    def _execute(self, case):
+        try:
+            response = self._send(case)
+        except CircuitOpenError:
+            raise
+        except requests.RequestException as e:
+            return None, type(e).__name__
+        except ContractError as e:
+            # Клиент с включенной проверкой контрактов (--validate-contracts) бросает ошибку сам
+            return None, f"contract violation: {e}"
+        return response, self.check(case, response)
+
+    def _run_case(self, case):
+        response, reason = self._execute(case)
+        with self._lock:
+            if response is not None:
+                # elapsed - время до заголовков ответа, т.е. в основном обработка на сервере
+                elapsed = response.elapsed.total_seconds()
+                self.latency[case.key].record(elapsed)
+                self.samples[case.key].append((elapsed, case.index))
+                self.statuses[case.key][str(response.status_code)] += 1
+            else:
+                self.statuses[case.key][reason] += 1
+            if reason is not None:
+                failure_key = (case.key, reason)
+                if failure_key in self.failures:
+                    self.failures[failure_key].count += 1
+                else:
+                    self.failures[failure_key] = FuzzFailure(case, reason)
+
+    def shrink(self, failure):
+        """Минимизировать данные нарушения жадным перебором shrink_candidates"""
+        current = failure.case.payload
+        steps = 0
+        improved = True
+        while improved and steps < self.max_shrink_steps:
+            improved = False
+            for candidate in shrink_candidates(current):
+                steps += 1
+                _, reason = self._execute(failure.case.with_payload(candidate))
+                if reason == failure.reason:
+                    current = candidate
+                    improved = True
+                    break
+                if steps >= self.max_shrink_steps:
+                    break
+        failure.shrunk = summarize(current)
+        failure.shrink_steps = steps
+        return current
+
+    def _setup(self):
+        if "update_product" in self.targets or "create_review" in self.targets:
+            payload = valid_product(random.Random(self.seed), f"target-{self.run_id}")
+            response = self.client.create_product(payload)
+            self._target_id = self.client.resolve_product_id(payload["name"], response)
+            if self._target_id is None:
+                raise RuntimeError(f"Could not create fuzz target product: {response.status_code}")
+
+    def run(self):
+        """Выполнить все кейсы, минимизировать нарушения и вернуть отчет"""
+        started = time.perf_counter()
+        self._setup()
+        try:
+            cases = [self.generate(i) for i in range(self.cases)]
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                list(executor.map(self._run_case, cases))
+            for failure in self.failures.values():
+                self.shrink(failure)
+        finally:
+            if self.cleanup:
+                product_ids = list(self.created_ids)
+                if self._target_id is not None:
+                    product_ids.append(self._target_id)
+                self.client.delete_products(product_ids)
+        return FuzzReport(self, cases, time.perf_counter() - started)
+
+
+class FuzzReport:
+    """Итоги фаззинга: нарушения и задержки с выбросами по классам данных"""
+
+    def __init__(self, fuzzer, cases, elapsed):
+        self.elapsed = elapsed
+        self.cases = len(cases)
+        self.failures = [failure.to_dict() for failure in fuzzer.failures.values()]
+        self.classes = {}
+        for key in sorted(set(fuzzer.statuses)):
+            target = key.split("/")[0]
+            baseline = fuzzer.latency.get(f"{target}/valid")
+            # Выброс - ответ медленнее медианы валидных данных того же эндпоинта в outlier_factor раз
+            threshold = baseline.percentile(50) * fuzzer.outlier_factor if baseline and baseline.count else None
+            samples = sorted(fuzzer.samples[key], reverse=True)
+            outliers = [(elapsed, index) for elapsed, index in samples if threshold and elapsed > threshold]
+            self.classes[key] = {
+                "cases": sum(fuzzer.statuses[key].values()),
+                "statuses": dict(fuzzer.statuses[key]),
+                "latency_ms": fuzzer.latency[key].summary() if key in fuzzer.latency else {"count": 0},
+                "outlier_threshold_ms": round(threshold * 1000, 3) if threshold else None,
+                "outliers": len(outliers),
+                "slowest": [
+                    {"ms": round(elapsed * 1000, 3), "payload": summarize(cases[index].payload)}
+                    for elapsed, index in outliers[:3]
+                ],
+            }
+
+    @property
+    def total_failures(self):
+        return sum(failure["count"] for failure in self.failures)
+
+    def to_dict(self):
+        return {
+            "elapsed": round(self.elapsed, 3),
+            "cases": self.cases,
+            "failures": self.failures,
+            "classes": self.classes,
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False, default=repr)
+
+    def format_table(self):
+        header = f"{'target/class':<34}{'cases':>7}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}{'outliers':>10}"
+        lines = [header, "-" * len(header)]
+        for key, stats in self.classes.items():
+            latency = stats["latency_ms"]
+            lines.append(
+                f"{key:<34}{stats['cases']:>7}{latency.get('p50', 0):>10.2f}{latency.get('p99', 0):>10.2f}"
+                f"{latency.get('max', 0):>10.2f}{stats['outliers']:>10}"
+            )
+        lines.append("-" * len(header))
+        for failure in self.failures:
+            lines.append(
+                f"FAIL {failure['target']}/{failure['payload_class']} x{failure['count']}: {failure['reason']}"
+                f"\n     minimal payload: {json.dumps(failure['shrunk'], ensure_ascii=False, default=repr)}"
+            )
+        lines.append(
+            f"{self.cases} cases, {self.elapsed:.1f}s, {len(self.failures)} distinct failures "
+            f"({self.total_failures} cases)"
+        )
+        return "\n".join(lines)
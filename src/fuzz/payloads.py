@@ -0,0 +1,156 @@
+import string
+
+# Границы числовых диапазонов и представлений чисел в JSON
+BOUNDARY_NUMBERS = [
+    0, -0.0, 1, -1, 0.01, 0.005, 1e-9, -1e-9, 99999999.99,
+    2 ** 31 - 1, 2 ** 31, -2 ** 31, 2 ** 53, 2 ** 53 + 1, 2 ** 63, 2 ** 64,
+    1e308, -1e308, 5e-324, 123456789.123456789,
+]
+
+# Юникод, который ломает нормализацию, сортировку, отображение и наивное экранирование
+UNICODE_SAMPLES = [
+    "Ünïcödé", "товар", "商品", "\U0001F600\U0001F680",
+    "\U0001F468\u200d\U0001F469\u200d\U0001F467", "e\u0301", "\u200b\u200b", "\u202eRTL",
+    "שלום", "\u0000nul", "\ud83d", "\ufeffbom", "İı", "ß", "\r\n\t",
+    "'; DROP TABLE products;--", "<script>alert(1)</script>", "%s%n%x", "{{7*7}}", "\\\"'",
+]
+
+# Значения не того типа, которые сервер может попытаться привести
+TYPE_CONFUSION = ["100", "abc", "", " 42 ", "1e3", "NaN", None, True, False, [], [1], {}, {"value": 1}]
+
+OVERSIZED_LENGTHS = [256, 4096, 65536]
+
+CATEGORIES = ["Electronics", "Home", "Sports", "Books", "Clothing"]
+PRODUCT_REQUIRED = ["name", "price", "category", "stock"]
+REVIEW_REQUIRED = ["rating", "comment"]
+
+
+def _text(rng, length=12):
+    return "".join(rng.choices(string.ascii_letters + string.digits + " ", k=length)).strip() or "text"
+
+
+def valid_product(rng, unique):
+    return {
+        "name": f"Fuzz Product {unique}",
+        "description": _text(rng, 40),
+        "price": round(rng.uniform(0.01, 10000), 2),
+        "category": rng.choice(CATEGORIES),
+        "stock": rng.randint(0, 1000),
+        "imageUrl": f"/{unique}.png",
+    }
+
+
+def valid_review(rng, unique):
+    return {
+        "rating": rng.randint(1, 5),
+        "comment": f"{_text(rng, 30)} {unique}",
+        "author": f"Fuzz {unique}",
+    }
+
+
+def _boundary_numbers(fields):
+    def build(rng, base):
+        for field in rng.sample(fields, rng.randint(1, len(fields))):
+            base[field] = rng.choice(BOUNDARY_NUMBERS)
+        return base
+    return build
+
+
+def _unicode(fields, unique_field):
+    def build(rng, base):
+        for field in rng.sample(fields, rng.randint(1, len(fields))):
+            sample = "".join(rng.choices(UNICODE_SAMPLES, k=rng.randint(1, 3)))
+            # Уникальный хвост оставляем, чтобы не получать 409 вместо проверки валидации
+            base[field] = f"{sample} {base[field]}" if field == unique_field else sample
+        return base
+    return build
+
+
+def _oversized(fields):
+    def build(rng, base):
+        field = rng.choice(fields)
+        base[field] = rng.choice(string.ascii_letters) * rng.choice(OVERSIZED_LENGTHS) + str(base[field])
+        return base
+    return build
+
+
+def _type_confusion(fields):
+    def build(rng, base):
+        for field in rng.sample(fields, rng.randint(1, 2)):
+            base[field] = rng.choice(TYPE_CONFUSION)
+        return base
+    return build
+
+
+def _missing_fields(required):
+    def build(rng, base):
+        for field in rng.sample(required, rng.randint(1, len(required))):
+            base.pop(field, None)
+        return base
+    return build
+
+
+def _extra_fields(rng, base):
+    extras = {
+        "id": rng.choice(["1", "0", "-1", "../1", 1]),
+        "createdAt": "1970-01-01T00:00:00Z",
+        "rating": rng.choice([5, 100, -1]),
+        "_seq": 0,
+        "__proto__": {"admin": True},
+        "nested": {"level": {"deeper": [1, {"deepest": None}]}},
+    }
+    for key in rng.sample(sorted(extras), rng.randint(1, 3)):
+        base[key] = extras[key]
+    return base
+
+
+class PayloadClass:
+    """Класс генерируемых данных: base(rng, unique) -> валидные данные, mutate(rng, data) -> итоговые"""
+
+    def __init__(self, name, base, mutate=None):
+        self.name = name
+        self.base = base
+        self.mutate = mutate
+
+    def generate(self, rng, unique):
+        payload = self.base(rng, unique)
+        return self.mutate(rng, payload) if self.mutate else payload
+
+    @property
+    def valid(self):
+        """Данные класса заведомо валидны, сервер обязан их принять"""
+        return self.mutate is None
+
+
+PRODUCT_CLASSES = {
+    "valid": PayloadClass("valid", valid_product),
+    "boundary_numbers": PayloadClass("boundary_numbers", valid_product, _boundary_numbers(["price", "stock"])),
+    "unicode": PayloadClass("unicode", valid_product, _unicode(["name", "description", "category"], "name")),
+    "oversized": PayloadClass("oversized", valid_product, _oversized(["name", "description", "category"])),
+    "type_confusion": PayloadClass(
+        "type_confusion", valid_product, _type_confusion(["name", "price", "category", "stock", "description"])
+    ),
+    "missing_fields": PayloadClass("missing_fields", valid_product, _missing_fields(PRODUCT_REQUIRED)),
+    "extra_fields": PayloadClass("extra_fields", valid_product, _extra_fields),
+}
+
+REVIEW_CLASSES = {
+    "valid": PayloadClass("valid", valid_review),
+    "boundary_numbers": PayloadClass("boundary_numbers", valid_review, _boundary_numbers(["rating"])),
+    "unicode": PayloadClass("unicode", valid_review, _unicode(["comment", "author"], "comment")),
+    "oversized": PayloadClass("oversized", valid_review, _oversized(["comment", "author"])),
+    "type_confusion": PayloadClass("type_confusion", valid_review, _type_confusion(["rating", "comment", "author"])),
+    "missing_fields": PayloadClass("missing_fields", valid_review, _missing_fields(REVIEW_REQUIRED)),
+    "extra_fields": PayloadClass("extra_fields", valid_review, _extra_fields),
+}
+
+
+def summarize(value, limit=40):
+    """Короткое представление данных для отчета: длинные строки заменяются длиной"""
+    if isinstance(value, dict):
+        return {key: summarize(item, limit) for key, item in value.items()}
+    if isinstance(value, list):
+        return [summarize(item, limit) for item in value]
+    if isinstance(value, str) and len(value) > limit:
+        return f"<str len={len(value)}: {value[:16]!r}...>"
+    return value
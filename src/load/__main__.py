@@ -0,0 +1,67 @@
+import argparse
+import sys
+
+from config.environment import Environment
+from src.api.http2 import Http2Transport
+from src.fake.asgi import Http2FakeStoreServer
+from src.fake.server import FakeStoreServer
+from src.load.runner import LoadRunner
+from src.load.scenarios import SCENARIOS
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.load",
+        description="Нагрузочный прогон сценариев ApiClient"
+    )
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="product_lifecycle")
+    parser.add_argument("--users", type=int, default=10, help="Число виртуальных пользователей")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Время выхода всех пользователей, сек")
+    parser.add_argument("--duration", type=float, default=30.0, help="Длительность прогона, сек")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Пауза между итерациями, сек")
+    parser.add_argument("--iterations", type=int, default=None, help="Остановиться после N итераций")
+    parser.add_argument("--http2", action="store_true", help="Использовать HTTP/2 транспорт (httpx)")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", default=None, help=f"URL API (по умолчанию {Environment.API_URL})")
+    target.add_argument("--fake-api", action="store_true", help="Запустить локальный fake API")
+    parser.add_argument("--json", metavar="PATH", default=None, help="Сохранить отчет в JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    server = None
+    if args.fake_api:
+        server = (Http2FakeStoreServer() if args.http2 else FakeStoreServer()).start()
+    base_url = server.api_url if server else args.base_url or Environment.API_URL
+    transport = None
+    if args.http2:
+        # Для http:// без TLS HTTP/2 возможен только с prior knowledge
+        transport = Http2Transport(prior_knowledge=base_url.startswith("http://"), max_connections=args.users)
+    runner = LoadRunner(
+        SCENARIOS[args.scenario],
+        users=args.users,
+        ramp_up=args.ramp_up,
+        duration=args.duration,
+        base_url=base_url,
+        think_time=args.think_time,
+        transport=transport,
+        max_iterations=args.iterations
+    )
+    try:
+        report = runner.run()
+    finally:
+        # Транспорт по умолчанию создает сам LoadRunner, поэтому закрывается транспорт прогона
+        runner.transport.close()
+        if server is not None:
+            server.stop()
+
+    print(report.format_table())
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            f.write(report.to_json())
+    return 1 if report.total_errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
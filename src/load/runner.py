@@ -0,0 +1,213 @@
+import json
+import threading
+import time
+from collections import defaultdict
+
+from config.environment import Environment
+from src.api.client import ApiClient
+from src.api.metrics import Histogram
+from src.api.transport import Transport
+from src.load.scenarios import StepFailed
+
+
+class StepStats:
+    """Задержки и ошибки одного шага сценария"""
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.errors = 0
+        self.statuses = defaultdict(int)
+
+    def summary(self, elapsed):
+        return {
+            "requests": self.latency.count,
+            "rps": round(self.latency.count / elapsed, 2) if elapsed else 0.0,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.latency.count, 4) if self.latency.count else 0.0,
+            "statuses": dict(self.statuses),
+            "latency_ms": self.latency.summary(),
+        }
+
+
+class VirtualUser:
+    """Виртуальный пользователь: свой ApiClient поверх общего транспорта"""
+
+    def __init__(self, runner, client):
+        self.runner = runner
+        self.client = client
+
+    def step(self, name, call, *args, expect=200, **kwargs):
+        """Выполнить и замерить шаг сценария, при неожиданном статусе бросить StepFailed.
+
+        expect - ожидаемый статус или кортеж допустимых статусов.
+        """
+        expected = expect if isinstance(expect, tuple) else (expect,)
+        start = time.perf_counter()
+        response = None
+        try:
+            response = call(*args, **kwargs)
+        finally:
+            status = response.status_code if response is not None else "error"
+            self.runner.record(name, time.perf_counter() - start, status, status not in expected)
+        if response.status_code not in expected:
+            raise StepFailed(name, response.status_code)
+        return response
+
+    def lookup(self, name, call, *args, **kwargs):
+        """Выполнить и замерить шаг, который возвращает значение, а не ответ (поиск по API).
+
+        None считается ошибкой шага: бросается StepFailed со статусом "not found".
+        """
+        start = time.perf_counter()
+        result = status = None
+        try:
+            result = call(*args, **kwargs)
+            status = "found" if result is not None else "not found"
+        finally:
+            self.runner.record(name, time.perf_counter() - start, status or "error", result is None)
+        if result is None:
+            raise StepFailed(name, status, reason="lookup failed,")
+        return result
+
+
+class LoadRunner:
+    """Запуск сценария на нескольких виртуальных пользователях.
+
+    Пользователи стартуют равномерно в течение ramp_up секунд и повторяют
+    сценарий до истечения duration (или до max_iterations итераций). Все
+    клиенты делят один Transport и один токен, полученный единственным логином.
+    """
+
+    def __init__(self, scenario, users=10, ramp_up=0.0, duration=10.0, base_url=None,
+                 think_time=0.0, credentials=None, transport=None, max_iterations=None):
+        self.scenario = scenario
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.base_url = base_url or Environment.API_URL
+        self.think_time = think_time
+        self.credentials = credentials or Environment.TEST_USER
+        self.transport = transport or Transport(pool_maxsize=max(users, Environment.API_POOL_MAXSIZE))
+        # Необязательный предел итераций на всех пользователей: прогон фиксированного объема работы
+        self.max_iterations = max_iterations
+        self._started_iterations = 0
+        self._lock = threading.Lock()
+        self.steps = defaultdict(StepStats)
+        self.iterations = 0
+        self.failed_iterations = 0
+        self.failures = defaultdict(int)
+
+    def record(self, name, elapsed, status, failed):
+        with self._lock:
+            stats = self.steps[name]
+            stats.latency.record(elapsed)
+            stats.statuses[str(status)] += 1
+            stats.errors += int(failed)
+
+    def _login(self):
+        client = ApiClient(base_url=self.base_url, transport=self.transport)
+        response = client.login(self.credentials["username"], self.credentials["password"])
+        if client.token is None:
+            raise RuntimeError(f"Login failed with status {response.status_code}")
+        return client.token
+
+    def _claim_iteration(self):
+        with self._lock:
+            if self.max_iterations is not None and self._started_iterations >= self.max_iterations:
+                return False
+            self._started_iterations += 1
+            return True
+
+    def _user_loop(self, index, token, started, deadline):
+        delay = self.ramp_up * index / self.users if self.users else 0.0
+        time.sleep(max(0.0, started + delay - time.perf_counter()))
+
+        client = ApiClient(base_url=self.base_url, transport=self.transport)
+        client.set_token(token)
+        user = VirtualUser(self, client)
+        while time.perf_counter() < deadline and self._claim_iteration():
+            try:
+                self.scenario(user)
+                failure = None
+            except StepFailed as e:
+                failure = f"{e.step}: {e.status_code}"
+            except Exception as e:
+                failure = type(e).__name__
+            with self._lock:
+                self.iterations += 1
+                if failure is not None:
+                    self.failed_iterations += 1
+                    self.failures[failure] += 1
+            if self.think_time:
+                time.sleep(self.think_time)
+
+    def run(self):
+        """Запустить нагрузку и вернуть отчет"""
+        token = self._login()
+        started = time.perf_counter()
+        deadline = started + self.duration
+        threads = [
+            threading.Thread(target=self._user_loop, args=(i, token, started, deadline), name=f"vu-{i}", daemon=True)
+            for i in range(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return LoadReport(self, time.perf_counter() - started)
+
+
+class LoadReport:
+    """Итоги нагрузочного прогона: пропускная способность, ошибки, перцентили по шагам"""
+
+    def __init__(self, runner, elapsed):
+        self.elapsed = elapsed
+        self.users = runner.users
+        self.iterations = runner.iterations
+        self.failed_iterations = runner.failed_iterations
+        self.failures = dict(runner.failures)
+        self.steps = {name: stats.summary(elapsed) for name, stats in runner.steps.items()}
+        self.connections = runner.transport.stats.snapshot()
+
+    @property
+    def total_requests(self):
+        return sum(step["requests"] for step in self.steps.values())
+
+    @property
+    def total_errors(self):
+        return sum(step["errors"] for step in self.steps.values())
+
+    def to_dict(self):
+        return {
+            "elapsed": round(self.elapsed, 3),
+            "users": self.users,
+            "iterations": self.iterations,
+            "failed_iterations": self.failed_iterations,
+            "failures": self.failures,
+            "requests": self.total_requests,
+            "rps": round(self.total_requests / self.elapsed, 2) if self.elapsed else 0.0,
+            "errors": self.total_errors,
+            "connections": self.connections,
+            "steps": self.steps,
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+
+    def format_table(self):
+        header = f"{'step':<14}{'reqs':>8}{'rps':>10}{'err %':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+        lines = [header, "-" * len(header)]
+        for name, step in self.steps.items():
+            latency = step["latency_ms"]
+            lines.append(
+                f"{name:<14}{step['requests']:>8}{step['rps']:>10.1f}{step['error_rate'] * 100:>8.2f}"
+                f"{latency.get('p50', 0):>10.2f}{latency.get('p90', 0):>10.2f}"
+                f"{latency.get('p99', 0):>10.2f}{latency.get('max', 0):>10.2f}"
+            )
+        lines.append("-" * len(header))
+        lines.append(
+            f"{self.users} users, {self.elapsed:.1f}s, {self.iterations} iterations "
+            f"({self.failed_iterations} failed), {self.total_requests} requests, "
+            f"{self.total_requests / self.elapsed if self.elapsed else 0:.1f} req/s"
+        )
+        return "\n".join(lines)
@@ -0,0 +1,72 @@
+import random
+import string
+
+from src.api.ledger import created_product_id
+
+
+class StepFailed(Exception):
+    """Шаг сценария вернул неожиданный статус или непригодный ответ"""
+
+    def __init__(self, step, status_code, reason="unexpected status"):
+        super().__init__(f"Step {step!r} failed: {reason} {status_code}")
+        self.step = step
+        self.status_code = status_code
+
+
+def unique_product_name():
+    suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    return f"Load Product {suffix}"
+
+
+def product_lifecycle(user):
+    """create -> get -> PATCH -> PUT -> review -> get reviews -> delete"""
+    client = user.client
+
+    name = unique_product_name()
+    response = user.step("create", client.create_product, {
+        "name": name,
+        "description": "Load test product",
+        "price": 100.0,
+        "category": "Electronics",
+        "stock": 10
+    }, expect=(200, 201))
+    product_id = created_product_id(response)
+    if product_id is None:
+        # Некоторые окружения отвечают на создание только {"message": ...}, без товара:
+        # поиск по имени - отдельные запросы, замеряются своим шагом
+        product_id = user.lookup("resolve_id", client.resolve_product_id, name)
+
+    try:
+        user.step("get", client.get_product, product_id)
+        user.step("patch", client.update_product, product_id, {"price": 150.0}, method="PATCH")
+        user.step("put", client.update_product, product_id, {
+            "name": unique_product_name(),
+            "description": "Updated load test product",
+            "price": 200.0,
+            "category": "Home",
+            "stock": 20
+        }, method="PUT")
+        user.step("review", client.create_review, product_id, {
+            "rating": 5,
+            "comment": "Load test review",
+            "author": "Load Test User"
+        }, expect=201)
+        user.step("get_reviews", client.get_reviews, product_id)
+    finally:
+        # Товар удаляется и после упавшего шага, чтобы не засорять каталог
+        user.step("delete", client.delete_product, product_id)
+
+
+def browse_catalog(user):
+    """Список товаров -> категории -> случайный товар"""
+    client = user.client
+    products = user.step("list", client.get_products).json()["products"]
+    user.step("categories", client.get_categories)
+    if products:
+        user.step("get", client.get_product, random.choice(products)["id"])
+
+
+SCENARIOS = {
+    "product_lifecycle": product_lifecycle,
+    "browse_catalog": browse_catalog,
+}
@@ -0,0 +1,123 @@
+import hashlib
+import os
+import uuid
+
+import allure_commons
+import pytest
+from allure_commons.logger import AllureFileLogger
+
+_CHUNK = 1024 * 1024
+
+
+def content_name(digest, file_name):
+    """Имя вложения по содержимому с расширением исходного имени: <хэш>-attachment.<ext>"""
+    return f"{digest}-attachment{os.path.splitext(file_name)[1]}"
+
+
+class DedupFileLogger(AllureFileLogger):
+    """Файловый логгер Allure, хранящий вложения по хэшу содержимого.
+
+    Одинаковое содержимое с одинаковым расширением записывается в
+    allure-results один раз (в том числе между воркерами xdist и
+    запусками без --clean-alluredir), а результаты тестов ссылаются
+    на общий файл. Имя, выданное Allure при attach, заменяется на имя
+    по содержимому перед записью результата.
+    """
+
+    def __init__(self, report_dir, clean=False):
+        super().__init__(report_dir, clean)
+        self._sources = {}
+        self._written = set()
+        self.attached = 0
+
+    def _store(self, file_name, digest, write):
+        name = content_name(digest, file_name)
+        self._sources[file_name] = name
+        self.attached += 1
+        if name in self._written or (self._report_dir / name).exists():
+            self._written.add(name)
+            return
+        # Уникальный временный файл: другой воркер может писать то же содержимое одновременно
+        tmp_path = self._report_dir / f"{name}.{uuid.uuid4().hex}.tmp"
+        write(tmp_path)
+        os.replace(tmp_path, self._report_dir / name)
+        self._written.add(name)
+
+    @allure_commons.hookimpl
+    def report_attached_data(self, body, file_name):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        def write(path):
+            with open(path, "wb") as f:
+                f.write(body)
+
+        self._store(file_name, hashlib.blake2b(body, digest_size=16).hexdigest(), write)
+
+    @allure_commons.hookimpl
+    def report_attached_file(self, source, file_name):
+        digest = hashlib.blake2b(digest_size=16)
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK), b""):
+                digest.update(chunk)
+
+        def write(path):
+            with open(source, "rb") as src, open(path, "wb") as dst:
+                for chunk in iter(lambda: src.read(_CHUNK), b""):
+                    dst.write(chunk)
+
+        self._store(file_name, digest.hexdigest(), write)
+
+    def _rewrite_sources(self, item):
+        for attachment in getattr(item, "attachments", None) or ():
+            attachment.source = self._sources.pop(attachment.source, attachment.source)
+        for children in ("steps", "befores", "afters"):
+            for child in getattr(item, children, None) or ():
+                self._rewrite_sources(child)
+
+    def _report_item(self, item):
+        self._rewrite_sources(item)
+        super()._report_item(item)
+
+
+def pytest_addoption(parser):
+    parser.getgroup("reporting").addoption(
+        "--allure-no-dedup",
+        action="store_true",
+        default=False,
+        help="Писать каждое вложение Allure отдельным файлом, без дедупликации по содержимому"
+    )
+
+
+_logger_key = pytest.StashKey()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    if config.getoption("--allure-no-dedup") or not getattr(config.option, "allure_report_dir", None):
+        return
+    original = next((plugin for plugin in allure_commons.plugin_manager.get_plugins()
+                     if type(plugin) is AllureFileLogger), None)
+    if original is None:
+        return
+    # Каталог уже очищен исходным логгером, если был --clean-alluredir
+    logger = DedupFileLogger(original._report_dir)
+    allure_commons.plugin_manager.unregister(original)
+    allure_commons.plugin_manager.register(logger)
+    config.stash[_logger_key] = logger
+
+    def restore():
+        # Очистка allure-pytest снимает с регистрации исходный логгер, поэтому он возвращается на место
+        allure_commons.plugin_manager.unregister(logger)
+        allure_commons.plugin_manager.register(original)
+
+    config.add_cleanup(restore)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    logger = config.stash.get(_logger_key, None)
+    # С xdist вложения пишут воркеры, у контроллера счетчик пуст
+    if logger is not None and logger.attached:
+        terminalreporter.write_line(
+            f"allure: {logger.attached} attachments stored as {len(logger._written)} unique files"
+        )
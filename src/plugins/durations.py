@@ -0,0 +1,169 @@
+import heapq
+import json
+import os
+import statistics
+from collections import defaultdict
+
+import pytest
+
+HISTORY_FILE = ".test_durations"
+DEFAULT_DURATION = 1.0
+
+
+def split_group(nodeid):
+    """nodeid -> (nodeid без суффикса, группа); xdist с --dist loadgroup добавляет к nodeid "@группа" """
+    base, sep, group = nodeid.rpartition("@")
+    if not sep or not group or "]" in group or "::" in group:
+        return nodeid, None
+    return base, group
+
+
+class DurationHistory:
+    """Длительности тестов (setup + call + teardown, секунды) между запусками в JSON {nodeid: секунды}.
+
+    Новое измерение сглаживается с предыдущим (smoothing - вес нового),
+    чтобы один медленный прогон не перекраивал расписание целиком.
+    """
+
+    def __init__(self, path, smoothing=0.5):
+        self.path = path
+        self.smoothing = smoothing
+        self.durations = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.durations = json.load(f)
+
+    def __len__(self):
+        return len(self.durations)
+
+    def estimate(self, nodeids):
+        """Ожидаемые длительности; для тестов без истории - медиана их файла или всей истории"""
+        by_file = defaultdict(list)
+        for nodeid, seconds in self.durations.items():
+            by_file[nodeid.split("::")[0]].append(seconds)
+        overall = statistics.median(self.durations.values()) if self.durations else DEFAULT_DURATION
+        file_medians = {path: statistics.median(values) for path, values in by_file.items()}
+        estimates = []
+        for nodeid in nodeids:
+            base, _ = split_group(nodeid)
+            if base in self.durations:
+                estimates.append(self.durations[base])
+            else:
+                estimates.append(file_medians.get(base.split("::")[0], overall))
+        return estimates
+
+    def update(self, measured):
+        for nodeid, seconds in measured.items():
+            previous = self.durations.get(nodeid)
+            if previous is not None:
+                seconds = previous + (seconds - previous) * self.smoothing
+            self.durations[nodeid] = round(seconds, 4)
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.durations, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def plan_units(nodeids, estimates):
+    """Единицы расписания от самой длинной: [(секунды, [индексы тестов])].
+
+    Тесты одной группы xdist_group - одна единица: они выполняются
+    на одном воркере подряд и делят дорогие фикстуры.
+    """
+    groups = defaultdict(list)
+    units = []
+    for index, nodeid in enumerate(nodeids):
+        _, group = split_group(nodeid)
+        if group is None:
+            units.append((estimates[index], [index]))
+        else:
+            groups[group].append(index)
+    for indices in groups.values():
+        units.append((sum(estimates[i] for i in indices), indices))
+    # При равной длительности сохраняется порядок сбора
+    units.sort(key=lambda unit: (-unit[0], unit[1][0]))
+    return units
+
+
+def lpt_assign(costs, workers):
+    """LPT: каждая задача от самой длинной - самому свободному исполнителю.
+
+    Возвращает (индексы задач по исполнителям, нагрузки исполнителей).
+    """
+    loads = [0.0] * workers
+    assignment = [[] for _ in range(workers)]
+    heap = [(0.0, worker) for worker in range(workers)]
+    for index in sorted(range(len(costs)), key=lambda i: (-costs[i], i)):
+        load, worker = heapq.heappop(heap)
+        assignment[worker].append(index)
+        loads[worker] = load + costs[index]
+        heapq.heappush(heap, (loads[worker], worker))
+    return assignment, loads
+
+
+def history_path(config):
+    return config.getoption("--durations-path") or str(config.rootpath / HISTORY_FILE)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("durations", "Планирование по длительности тестов")
+    group.addoption(
+        "--duration-schedule",
+        action="store_true",
+        default=False,
+        help="С -n: раздавать тесты воркерам от самых длинных по истории длительностей (минимум общего времени)"
+    )
+    group.addoption(
+        "--store-durations",
+        action="store_true",
+        default=False,
+        help="Сохранить длительности тестов этого запуска в историю (с --duration-schedule сохраняются всегда)"
+    )
+    group.addoption(
+        "--durations-path",
+        metavar="PATH",
+        default=None,
+        help=f"Файл истории длительностей (по умолчанию {HISTORY_FILE} в корне проекта)"
+    )
+
+
+def pytest_configure(config):
+    if hasattr(config, "workerinput"):
+        if config.getoption("--duration-schedule"):
+            # Воркер добавит к nodeid суффикс "@группа" для тестов с маркером xdist_group, как при --dist loadgroup
+            config.option.loadgroup = True
+        return
+    if config.getoption("--duration-schedule"):
+        dist = getattr(config.option, "dist", "no")
+        if dist not in ("no", "load", "loadgroup"):
+            raise pytest.UsageError("--duration-schedule replaces --dist load/loadgroup, not --dist " + dist)
+    if config.getoption("--duration-schedule") or config.getoption("--store-durations"):
+        config.pluginmanager.register(DurationRecorder(config), "duration-recorder")
+
+
+class DurationRecorder:
+    """Собирает длительности тестов на контроллере и пишет их в историю в конце запуска"""
+
+    def __init__(self, config):
+        self.config = config
+        self.measured = defaultdict(float)
+
+    def pytest_runtest_logreport(self, report):
+        self.measured[split_group(report.nodeid)[0]] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        if not self.measured:
+            return
+        history = DurationHistory(history_path(self.config))
+        history.update(self.measured)
+        history.save()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not config.getoption("--duration-schedule"):
+        return None
+    from src.plugins.scheduler import DurationScheduling
+    return DurationScheduling(config, log, DurationHistory(history_path(config)))
@@ -0,0 +1,264 @@
+import json
+import os
+
+import pytest
+from _pytest.runner import call_and_report
+
+from src.plugins.durations import split_group
+
+HISTORY_FILE = ".test_flaky.json"
+# Сколько последних запусков теста учитывается в оценке
+WINDOW = 20
+
+# Исходы теста в истории
+PASSED = "p"        # прошел с первой попытки
+RERUN_PASSED = "r"  # упал и прошел при перезапуске
+FAILED = "f"        # упал во всех попытках
+QUARANTINED = "q"   # не запускался в основной полосе, так как в карантине
+
+
+def flakiness(outcomes):
+    """Доля нестабильных событий в окне: прохождения после перезапуска и смены pass <-> fail.
+
+    Стабильно падающий тест имеет оценку 0: он сломан, а не нестабилен.
+    Тест в карантине получает исходы из полосы карантина (merge_lane), поэтому,
+    перестав нестабильно падать, он накапливает прохождения и выходит из карантина.
+    Отметки q без исходов полосы только разбавляют окно.
+    """
+    window = outcomes[-WINDOW:]
+    if not window:
+        return 0.0
+    events = window.count(RERUN_PASSED)
+    ran = [outcome for outcome in window if outcome != QUARANTINED]
+    events += sum(1 for a, b in zip(ran, ran[1:]) if (a == FAILED) != (b == FAILED))
+    return events / len(window)
+
+
+class FlakyHistory:
+    """История исходов тестов между запусками в JSON {nodeid: "pprfp..."}"""
+
+    def __init__(self, path):
+        self.path = path
+        self.outcomes = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.outcomes = json.load(f)
+
+    def record(self, results):
+        for nodeid, outcome in results.items():
+            self.outcomes[nodeid] = (self.outcomes.get(nodeid, "") + outcome)[-WINDOW:]
+
+    def merge_lane(self, results):
+        """Исходы полосы карантина этого запуска: заменяют отметку q основной полосы, а не добавляются к ней"""
+        for nodeid, outcome in results.items():
+            previous = self.outcomes.get(nodeid, "")
+            if previous.endswith(QUARANTINED):
+                previous = previous[:-1]
+            self.outcomes[nodeid] = (previous + outcome)[-WINDOW:]
+
+    def scores(self):
+        return {nodeid: flakiness(outcomes) for nodeid, outcomes in self.outcomes.items()}
+
+    def quarantined(self, threshold, min_runs):
+        """Хронически нестабильные тесты: {nodeid: оценка}"""
+        return {
+            nodeid: score for nodeid, score in self.scores().items()
+            if score >= threshold and len(self.outcomes[nodeid].replace(QUARANTINED, "")) >= min_runs
+        }
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.outcomes, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def history_path(config):
+    return config.getoption("--flaky-history") or str(config.rootpath / HISTORY_FILE)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("flaky", "Нестабильные тесты")
+    group.addoption(
+        "--flaky-reruns",
+        type=int,
+        default=0,
+        help="Сколько раз перезапускать упавший тест в том же процессе (фикстуры шире function сохраняются)"
+    )
+    group.addoption(
+        "--quarantine",
+        choices=["off", "exclude", "only"],
+        default="off",
+        help="exclude - основная полоса без тестов в карантине, only - полоса карантина (только они)"
+    )
+    group.addoption(
+        "--flaky-threshold",
+        type=float,
+        default=0.2,
+        help="Оценка нестабильности, с которой тест попадает в карантин"
+    )
+    group.addoption(
+        "--flaky-min-runs",
+        type=int,
+        default=5,
+        help="Сколько запусков в истории нужно, чтобы тест мог попасть в карантин"
+    )
+    group.addoption(
+        "--flaky-history",
+        metavar="PATH",
+        default=None,
+        help=f"Файл истории исходов (по умолчанию {HISTORY_FILE} в корне проекта)"
+    )
+    group.addoption(
+        "--flaky-results",
+        metavar="PATH",
+        default=None,
+        help="Записать исходы тестов этого запуска в JSON (для объединения истории полос: python -m src.plugins.flaky)"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--flaky-reruns") > 0 or config.getoption("--quarantine") != "off":
+        config.pluginmanager.register(FlakyPlugin(config), "flaky")
+
+
+class FlakyPlugin:
+    """Перезапуск упавших тестов, история исходов и полосы карантина"""
+
+    def __init__(self, config):
+        self.config = config
+        self.reruns = config.getoption("--flaky-reruns")
+        self.mode = config.getoption("--quarantine")
+        self.history = FlakyHistory(history_path(config))
+        self.quarantine = self.history.quarantined(
+            config.getoption("--flaky-threshold"), config.getoption("--flaky-min-runs")
+        )
+        self.excluded = []
+        self.results = {}
+        self._running = {}
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if self.mode == "off":
+            return
+        in_quarantine = [split_group(item.nodeid)[0] in self.quarantine for item in items]
+        keep = [item for item, quarantined in zip(items, in_quarantine) if quarantined == (self.mode == "only")]
+        deselected = [item for item, quarantined in zip(items, in_quarantine) if quarantined != (self.mode == "only")]
+        if self.mode == "exclude":
+            self.excluded = [split_group(item.nodeid)[0] for item in deselected]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = keep
+
+    def _attempt(self, item, nextitem, can_rerun):
+        """Одна попытка setup/call/teardown; при перезапуске сносятся только фикстуры самого теста"""
+        if hasattr(item, "_request") and not item._request:
+            item._initrequest()
+        try:
+            reports = [call_and_report(item, "setup", log=False)]
+            if reports[0].passed:
+                reports.append(call_and_report(item, "call", log=False))
+            rerun = can_rerun and any(report.failed for report in reports)
+            if item.session.shouldfail or item.session.shouldstop:
+                rerun, nextitem = False, None
+            # Родитель как "следующий тест": teardown_exact снимет только узел самого теста
+            reports.append(call_and_report(item, "teardown", log=False, nextitem=item.parent if rerun else nextitem))
+        finally:
+            if hasattr(item, "_request"):
+                item._request = False
+                item.funcargs = None
+        return reports, rerun
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self.reruns <= 0:
+            return None
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        failures = []
+        for attempt in range(self.reruns + 1):
+            reports, rerun = self._attempt(item, nextitem, attempt < self.reruns)
+            if not rerun:
+                break
+            failures.extend(
+                (f"flaky rerun: attempt {attempt + 1} {report.when} failed", report.longreprtext)
+                for report in reports if report.failed
+            )
+        for report in reports:
+            report.sections.extend(failures)
+            report.user_properties = list(report.user_properties) + [("flaky_attempts", attempt + 1)]
+            item.ihook.pytest_runtest_logreport(report=report)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    def pytest_runtest_logreport(self, report):
+        if hasattr(self.config, "workerinput"):
+            return
+        nodeid = split_group(report.nodeid)[0]
+        state = self._running.setdefault(nodeid, {"failed": False, "skipped": False, "attempts": 1})
+        state["failed"] |= report.failed
+        state["skipped"] |= report.skipped and report.when != "teardown"
+        state["attempts"] = dict(report.user_properties).get("flaky_attempts", state["attempts"])
+        if report.when != "teardown":
+            return
+        state = self._running.pop(nodeid)
+        if state["failed"]:
+            self.results[nodeid] = FAILED
+        elif not state["skipped"]:
+            self.results[nodeid] = RERUN_PASSED if state["attempts"] > 1 else PASSED
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        self.excluded.extend(getattr(node, "workeroutput", {}).get("flaky_excluded", []))
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput"):
+            # Воркер xdist передает контроллеру тесты, снятые в карантин при сборе
+            self.config.workeroutput["flaky_excluded"] = self.excluded
+            return
+        results = dict(self.results)
+        for nodeid in set(self.excluded):
+            results.setdefault(nodeid, QUARANTINED)
+        if results:
+            self.history.record(results)
+            self.history.save()
+        results_path = self.config.getoption("--flaky-results")
+        if results_path:
+            with open(results_path, "w", encoding="utf-8") as f:
+                json.dump(self.results, f, indent=1, sort_keys=True)
+        # В полосе карантина может не оказаться ни одного теста, это не ошибка
+        if self.mode == "only" and session.exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED:
+            session.exitstatus = pytest.ExitCode.OK
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if hasattr(self.config, "workerinput"):
+            return
+        rerun_passed = sorted(nodeid for nodeid, outcome in self.results.items() if outcome == RERUN_PASSED)
+        if rerun_passed:
+            terminalreporter.section("flaky: passed on rerun")
+            for nodeid in rerun_passed:
+                terminalreporter.write_line(f"{nodeid} (score {flakiness(self.history.outcomes[nodeid]):.2f})")
+        if self.quarantine and self.mode != "only":
+            terminalreporter.section("flaky: quarantine")
+            for nodeid, score in sorted(self.quarantine.items(), key=lambda item: -item[1]):
+                terminalreporter.write_line(f"{nodeid} (score {score:.2f})")
+
+
+def main(argv=None):
+    """Добавить в историю основной полосы исходы полосы карантина, запущенной параллельно"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m src.plugins.flaky",
+                                     description="Объединение истории нестабильных тестов двух полос")
+    parser.add_argument("history", help="История основной полосы (--quarantine exclude), обновляется на месте")
+    parser.add_argument("results", nargs="+", help="Файлы --flaky-results полосы карантина (--quarantine only)")
+    args = parser.parse_args(argv)
+
+    history = FlakyHistory(args.history)
+    for path in args.results:
+        with open(path, encoding="utf-8") as f:
+            history.merge_lane(json.load(f))
+    history.save()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from src.plugins.durations import split_group
+
+MAP_FILE = ".test_impact.json"
+# Изменение этих файлов может повлиять на любой тест
+GLOBAL_FILES = {"pytest.ini", "pyproject.toml", "requirements.txt", "setup.cfg", "tox.ini"}
+FILE_LEVEL = "*"
+
+_HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def function_id(path, qualname):
+    """Идентификатор функции в карте: путь::Класс.метод; вложенные функции относятся к внешней"""
+    return f"{path}::{qualname.split('.<locals>')[0]}"
+
+
+def parse_diff(text):
+    """Вывод git diff --unified=0 -> {путь: множество измененных строк нового файла или None (файл удален)}"""
+    changes = {}
+    old_path = path = None
+    for line in text.splitlines():
+        if line.startswith("--- "):
+            old_path = line[6:] if line.startswith("--- a/") else None
+        elif line.startswith("+++ "):
+            path = line[6:] if line.startswith("+++ b/") else None
+            if path is None and old_path is not None:
+                changes[old_path] = None
+            elif path is not None:
+                changes.setdefault(path, set())
+        elif path is not None and line.startswith("@@"):
+            match = _HUNK.match(line)
+            if match:
+                start, count = int(match.group(1)), int(match.group(2) or 1)
+                # Удаление строк отмечается соседними строками: они внутри той же функции
+                changes[path].update(range(start, start + count) if count else (start, start + 1))
+    return changes
+
+
+def function_ranges(source):
+    """[(первая строка с декораторами, последняя строка, Класс.метод)] функций и методов модуля"""
+    ranges = []
+
+    def visit(nodes, prefix):
+        for node in nodes:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+                ranges.append((start, node.end_lineno, prefix + node.name))
+            elif isinstance(node, ast.ClassDef):
+                visit(node.body, f"{prefix}{node.name}.")
+
+    visit(ast.parse(source).body, "")
+    return ranges
+
+
+def changed_units(path, source, lines):
+    """Измененные функции файла; FILE_LEVEL - изменен код модуля вне функций"""
+    if source is None or lines is None:
+        return {FILE_LEVEL}
+    try:
+        ranges = function_ranges(source)
+    except SyntaxError:
+        return {FILE_LEVEL}
+    units = set()
+    for line in lines:
+        owners = [name for start, end, name in ranges if start <= line <= end]
+        # Последний из подходящих - самый вложенный метод
+        units.add(owners[-1] if owners else FILE_LEVEL)
+    return units
+
+
+def select_tests(nodeids, impact, changes, sources):
+    """Затронутые изменениями тесты: (выбранные nodeid, причина запуска всех или None)"""
+    for path in changes:
+        if os.path.basename(path) in GLOBAL_FILES:
+            return list(nodeids), f"{path} changed"
+
+    changed_functions = set()
+    changed_files = set()
+    changed_dirs = set()
+    for path, lines in changes.items():
+        if not path.endswith(".py"):
+            continue
+        units = changed_units(path, sources.get(path), lines)
+        if FILE_LEVEL in units:
+            changed_files.add(path)
+        if os.path.basename(path) == "conftest.py" and any(
+                unit == FILE_LEVEL or unit.startswith("pytest_") for unit in units):
+            # Хуки и код модуля conftest выполняются вне тестов, но влияют на все тесты каталога
+            changed_dirs.add(os.path.dirname(path))
+        changed_functions.update(function_id(path, unit) for unit in units if unit != FILE_LEVEL)
+
+    # Код модуля без функций (константы, настройки) в карту не попадает: такой файл
+    # мог повлиять на любой тест. Тестовые модули и conftest.py выбираются по своим правилам
+    known_files = {function.split("::")[0] for functions in impact.values() for function in functions}
+    for path in changes:
+        if (path.endswith(".py") and path not in known_files and os.path.basename(path) != "conftest.py"
+                and not any(nodeid.startswith(path + "::") for nodeid in nodeids)):
+            return list(nodeids), f"{path} not in impact map"
+
+    selected = []
+    for nodeid in nodeids:
+        functions = impact.get(nodeid)
+        # Тест без записи в карте (новый или не запускавшийся с --impact-record) выполняется всегда
+        if (functions is None or changed_functions.intersection(functions)
+                or any(function.split("::")[0] in changed_files for function in functions)
+                or any(not d or nodeid.startswith(d + "/") for d in changed_dirs)):
+            selected.append(nodeid)
+    return selected, None
+
+
+class ImpactMap:
+    """Карта nodeid -> функции проекта, выполненные тестом, в компактном JSON:
+    таблица функций и для каждого теста индексы в ней.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.tests = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            functions = data["functions"]
+            self.tests = {nodeid: {functions[i] for i in indices} for nodeid, indices in data["tests"].items()}
+
+    def __contains__(self, nodeid):
+        return nodeid in self.tests
+
+    def get(self, nodeid):
+        return self.tests.get(nodeid)
+
+    def values(self):
+        return self.tests.values()
+
+    def update(self, tests):
+        self.tests.update({nodeid: set(functions) for nodeid, functions in tests.items()})
+
+    def save(self):
+        functions = sorted(set().union(*self.tests.values()))
+        index = {function: i for i, function in enumerate(functions)}
+        data = {
+            "functions": functions,
+            "tests": {nodeid: sorted(index[f] for f in fs) for nodeid, fs in sorted(self.tests.items())},
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+
+class ImpactRecorder:
+    """Запись выполненных функций проекта для каждого теста через sys.setprofile.
+
+    Профилировщик видит только вызовы (не строки), поэтому замедляет тесты
+    умеренно. Код, выполненный при подготовке фикстуры, записывается на
+    фикстуру и добавляется каждому тесту, который ее использует: так
+    session-фикстуры, созданные во время первого теста, учитываются у всех.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.root = str(config.rootpath) + os.sep
+        self._codes = set()
+        self._stack = []
+        self._fixture_codes = {}
+        self._ids = {}
+        self.tests = {}
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            self._codes.add(frame.f_code)
+
+    def _start(self):
+        sys.setprofile(self._profile)
+        threading.setprofile(self._profile)
+
+    def _stop(self):
+        sys.setprofile(None)
+        threading.setprofile(None)
+
+    def _function_ids(self, codes):
+        result = set()
+        # Снимок: фоновые потоки теста могут продолжать пополнять множество
+        for code in tuple(codes):
+            function = self._ids.get(code, False)
+            if function is False:
+                filename = code.co_filename
+                if (filename.startswith(self.root) and "site-packages" not in filename
+                        and filename != __file__ and code.co_name != "<module>"):
+                    path = os.path.relpath(filename, self.root).replace(os.sep, "/")
+                    function = function_id(path, code.co_qualname)
+                else:
+                    function = None
+                self._ids[code] = function
+            if function is not None:
+                result.add(function)
+        return result
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        self._stack.append(self._codes)
+        self._codes = set()
+        try:
+            yield
+        finally:
+            # Сама функция фикстуры тоже зависимость, даже если ее код не вызывался (значение из кэша)
+            codes = self._codes
+            self._codes = self._stack.pop()
+            code = getattr(fixturedef.func, "__code__", None)
+            if code is not None:
+                codes.add(code)
+            key = (fixturedef.argname, fixturedef.baseid)
+            self._fixture_codes.setdefault(key, set()).update(self._function_ids(codes))
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self._codes = set()
+        self._start()
+        try:
+            yield
+        finally:
+            self._stop()
+            functions = self._function_ids(self._codes)
+            for name, fixturedefs in item._fixtureinfo.name2fixturedefs.items():
+                for fixturedef in fixturedefs:
+                    functions.update(self._fixture_codes.get((name, fixturedef.baseid), ()))
+            self.tests[split_group(item.nodeid)[0]] = sorted(functions)
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput"):
+            # Воркер xdist передает свою часть карты контроллеру
+            self.config.workeroutput["impact"] = self.tests
+        elif self.tests:
+            impact = ImpactMap(impact_map_path(self.config))
+            impact.update(self.tests)
+            impact.save()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        self.tests.update(getattr(node, "workeroutput", {}).get("impact", {}))
+
+
+def impact_map_path(config):
+    return config.getoption("--impact-map") or str(config.rootpath / MAP_FILE)
+
+
+def git_changes(root, ref):
+    """Изменения рабочего дерева (вместе с незакоммиченными) относительно ref"""
+    result = subprocess.run(
+        ["git", "diff", "--unified=0", "--no-color", "--no-renames", "--no-ext-diff", ref, "--"],
+        cwd=root, capture_output=True, text=True, encoding="utf-8"
+    )
+    if result.returncode != 0:
+        raise pytest.UsageError(f"--changed-since {ref}: {result.stderr.strip()}")
+    return parse_diff(result.stdout)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact", "Выбор тестов по изменениям")
+    group.addoption(
+        "--impact-record",
+        action="store_true",
+        default=False,
+        help="Записать для каждого теста выполненные функции проекта в карту влияния"
+    )
+    group.addoption(
+        "--changed-since",
+        metavar="REF",
+        default=None,
+        help="Запустить только тесты, затронутые изменениями относительно git ref (по карте влияния)"
+    )
+    group.addoption(
+        "--impact-map",
+        metavar="PATH",
+        default=None,
+        help=f"Файл карты влияния (по умолчанию {MAP_FILE} в корне проекта)"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--impact-record"):
+        config.pluginmanager.register(ImpactRecorder(config), "impact-recorder")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    ref = config.getoption("--changed-since")
+    if ref is None:
+        return
+
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    path = impact_map_path(config)
+    if not os.path.exists(path):
+        if reporter is not None:
+            reporter.write_line(f"impact: no map at {path}, running all tests (record one with --impact-record)")
+        return
+
+    root = config.rootpath
+    changes = git_changes(root, ref)
+    sources = {}
+    for changed in changes:
+        file_path = root / changed
+        if changed.endswith(".py") and file_path.exists():
+            sources[changed] = file_path.read_text(encoding="utf-8")
+    nodeids = [split_group(item.nodeid)[0] for item in items]
+    selected, reason = select_tests(nodeids, ImpactMap(path), changes, sources)
+
+    selected = set(selected)
+    deselected = [item for item, nodeid in zip(items, nodeids) if nodeid not in selected]
+    if reporter is not None:
+        detail = reason or f"{len(changes)} changed files"
+        reporter.write_line(f"impact: {detail}, selected {len(items) - len(deselected)} of {len(items)} tests")
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item, nodeid in zip(items, nodeids) if nodeid in selected]
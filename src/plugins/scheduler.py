@@ -0,0 +1,98 @@
+from xdist.scheduler import LoadScheduling
+
+from src.plugins.durations import lpt_assign, plan_units, split_group
+
+
+class DurationScheduling(LoadScheduling):
+    """Раздача тестов воркерам xdist от самых длинных (жадный LPT по истории длительностей).
+
+    Единица раздачи - тест или целая группа xdist_group. Освободившийся
+    воркер получает самую длинную из оставшихся единиц, поэтому короткие
+    тесты в конце заполняют простои, а общее время прогона (makespan)
+    близко к оптимальному, а не к равному числу тестов на воркер.
+    Воркер xdist запускает тест, только зная следующий, поэтому у каждого
+    в очереди держится одна единица впрок.
+    """
+
+    def __init__(self, config, log=None, history=None):
+        super().__init__(config, log)
+        self.history = history
+        self.units = []
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        estimates = self.history.estimate(self.collection)
+        self.units = [indices for _, indices in plan_units(self.collection, estimates)]
+        self.pending[:] = [index for unit in self.units for index in unit]
+        self._report_plan(estimates)
+
+        # Первые единицы по кругу, чтобы самые длинные тесты не достались одному воркеру
+        for _ in range(2):
+            for node in self.nodes:
+                if self.units and len(self.node2pending[node]) < 2:
+                    self._send_unit(node, self.units.pop(0))
+        if not self.units:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration=0):
+        if node.shutting_down:
+            return
+        if not self.units:
+            node.shutdown()
+            return
+        while self.units and len(self.node2pending[node]) < 2:
+            self._send_unit(node, self.units.pop(0))
+
+    def mark_test_pending(self, item):
+        index = self.collection.index(item)
+        self.units.insert(0, [index])
+        self.pending.insert(0, index)
+        for node in self.nodes:
+            self.check_schedule(node)
+
+    def remove_node(self, node):
+        pending = self.node2pending.pop(node)
+        if not pending:
+            return None
+        crashitem = self.collection[pending.pop(0)]
+        if pending:
+            # Оставшиеся тесты упавшего воркера отдаются другому одной единицей
+            self.units.insert(0, pending)
+            self.pending[:0] = pending
+        for other in self.nodes:
+            self.check_schedule(other)
+        return crashitem
+
+    def _send_unit(self, node, unit):
+        sent = set(unit)
+        self.pending[:] = [index for index in self.pending if index not in sent]
+        self.node2pending[node].extend(unit)
+        node.send_runtest_some(unit)
+
+    def _report_plan(self, estimates):
+        if not self.nodes:
+            return
+        units = plan_units(self.collection, estimates)
+        _, loads = lpt_assign([cost for cost, _ in units], len(self.nodes))
+        known = sum(1 for nodeid in self.collection if split_group(nodeid)[0] in self.history.durations)
+        message = (
+            f"duration schedule: {len(self.collection)} tests in {len(units)} units, "
+            f"{known} with history, estimated makespan {max(loads):.1f}s "
+            f"on {len(self.nodes)} workers (lower bound {sum(estimates) / len(self.nodes):.1f}s)"
+        )
+        self.log(message)
+        reporter = self.config.pluginmanager.get_plugin("terminalreporter")
+        if reporter is not None:
+            reporter.write_line(message)
@@ -0,0 +1,97 @@
+import pytest
+
+from src.plugins.durations import DurationHistory, history_path, lpt_assign, split_group
+
+
+def item_group(item):
+    """Имя группы xdist_group теста или None: тесты одной группы попадают в один шард"""
+    names = sorted({str(mark.args[0] if mark.args else mark.kwargs.get("name", "default"))
+                    for mark in item.iter_markers("xdist_group")})
+    return "_".join(names) or None
+
+
+def plan_shards(nodeids, estimates, groups, count):
+    """Разбить тесты на count шардов почти равной длительности (LPT).
+
+    Результат зависит только от набора тестов и истории длительностей:
+    единицы упорядочены по nodeid, равные длительности разбираются по
+    нему же, поэтому все шарды одного запуска считают одинаковый план.
+    Возвращает (индексы тестов по шардам, ожидаемые секунды по шардам).
+    """
+    units = {}
+    for index, nodeid in enumerate(nodeids):
+        key = ("group", groups[index]) if groups[index] else ("test", split_group(nodeid)[0])
+        units.setdefault(key, []).append(index)
+    ordered = sorted(units.values(), key=lambda indices: split_group(nodeids[indices[0]])[0])
+    assignment, loads = lpt_assign([sum(estimates[i] for i in unit) for unit in ordered], count)
+    shards = [sorted(i for unit_index in unit_indices for i in ordered[unit_index]) for unit_indices in assignment]
+    return shards, loads
+
+
+def format_plan(nodeids, shards, loads, known):
+    lines = [f"{'shard':<7}{'tests':>7}{'predicted':>12}", "-" * 26]
+    for index, (shard, load) in enumerate(zip(shards, loads)):
+        lines.append(f"{index:<7}{len(shard):>7}{load:>11.1f}s")
+    lines.append("-" * 26)
+    mean = sum(loads) / len(loads) if loads else 0.0
+    lines.append(
+        f"{len(nodeids)} tests ({known} with history), {sum(loads):.1f}s total, "
+        f"slowest shard {max(loads, default=0.0):.1f}s vs mean {mean:.1f}s"
+    )
+    return "\n".join(lines)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("durations")
+    group.addoption(
+        "--shard-count",
+        type=int,
+        default=1,
+        help="На сколько шардов (машин) делится набор тестов по истории длительностей"
+    )
+    group.addoption(
+        "--shard-index",
+        type=int,
+        default=0,
+        help="Номер шарда этого запуска, от 0 до --shard-count - 1"
+    )
+    group.addoption(
+        "--shard-plan",
+        action="store_true",
+        default=False,
+        help="Только напечатать разбиение на шарды и ожидаемое время каждого, не запуская тесты"
+    )
+
+
+def pytest_configure(config):
+    count = config.getoption("--shard-count")
+    index = config.getoption("--shard-index")
+    if count < 1 or not 0 <= index < count:
+        raise pytest.UsageError(f"--shard-index must be in [0, {count}) and --shard-count >= 1")
+    if config.getoption("--shard-plan") and getattr(config.option, "numprocesses", None):
+        raise pytest.UsageError("--shard-plan runs without xdist (-n)")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    count = config.getoption("--shard-count")
+    if count == 1 and not config.getoption("--shard-plan"):
+        return
+
+    history = DurationHistory(history_path(config))
+    nodeids = [item.nodeid for item in items]
+    estimates = history.estimate(nodeids)
+    shards, loads = plan_shards(nodeids, estimates, [item_group(item) for item in items], count)
+
+    if config.getoption("--shard-plan"):
+        known = sum(1 for nodeid in nodeids if split_group(nodeid)[0] in history.durations)
+        reporter = config.pluginmanager.get_plugin("terminalreporter")
+        if reporter is not None:
+            reporter.write_line(format_plan(nodeids, shards, loads, known))
+        pytest.exit("shard plan printed", returncode=0)
+
+    selected = set(shards[config.getoption("--shard-index")])
+    deselected = [item for i, item in enumerate(items) if i not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for i, item in enumerate(items) if i in selected]
@@ -1,5 +1,6 @@
 import pytest
 import allure
+from src.api.contracts import validate_response
 
 @pytest.mark.api
 @pytest.mark.categories
@@ -18,14 +19,12 @@ class TestCategoriesGet:
         with allure.step("Проверить статус код 200"):
             assert response.status_code == 200
 
-        with allure.step("Проверить структуру ответа"):
+        with allure.step("Проверить ответ по контракту GET /categories"):
+            validate_response("GET", "/categories", response)
             data = response.json()
-            assert "categories" in data
-            assert "total" in data
 
         with allure.step("Проверить содержимое категорий"):
             categories = data["categories"]
-            assert isinstance(categories, list)
             assert len(categories) > 0
             assert "Electronics" in categories
             assert "Home" in categories
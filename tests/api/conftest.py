@@ -1,15 +1,47 @@
 import pytest
+import pytest_asyncio
+import allure
 import sys
 import os
 import random
 import string
+import hashlib
+import requests
 
 # Добавляем корневую директорию в path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 from src.api.client import ApiClient
+from src.api.async_client import AsyncApiClient
+from src.api.auth import AuthenticationError, TokenBroker
+from src.api.breaker import CircuitBreaker, CircuitOpenError
+from src.api.cache import ResponseCache
+from src.api.cassette import Cassette
+from src.api.http2 import Http2Transport
+from src.api.ledger import ResourceLedger
+from src.api.limiter import AdaptiveLimiter
+from src.api.coalesce import AsyncSingleFlight, SingleFlight
+from src.api.contracts import ContractValidator
+from src.api.metrics import LatencyCollector
+from src.api.pool import ProductPool
+from src.api.resolver import ProductIndex
+from src.api.transport import Transport
+from src.fake.asgi import Http2FakeStoreServer
+from src.fake.server import FakeStoreServer
+from src.fake.store import FakeStore
 from config.environment import Environment
+from tests.conftest import api_ledger_dir
+
+
+class MessageOnlyStore(FakeStore):
+    """Окружение, которое отвечает на создание товара 200 и только сообщением, без товара"""
+
+    def _route_create_product(self, payload, headers, **kwargs):
+        status, body = super()._route_create_product(payload, headers, **kwargs)
+        if status == 201:
+            return 200, {"message": body["message"]}
+        return status, body
 
 
 def generate_unique_product_name():
@@ -18,55 +50,395 @@ def generate_unique_product_name():
     return f"Test Product {random_suffix}"
 
 
+def new_product_data():
+    """Данные нового товара с уникальным именем"""
+    return {
+        "name": generate_unique_product_name(),
+        "description": "Mechanical gaming keyboard with RGB",
+        "price": 129.99,
+        "category": "Electronics",
+        "stock": 25,
+        "imageUrl": "/keyboard.png"
+    }
+
+
 def generate_unique_username():
     """Генерация уникального имени пользователя"""
     random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
     return f"testuser_{random_suffix}"
 
 
+@pytest.fixture(scope="session")
+def api_base_url(request):
+    """URL API: удаленный Environment.API_URL или локальный FakeStore (--fake-api)"""
+    if not request.config.getoption("--fake-api"):
+        yield Environment.API_URL
+        return
+
+    server_class = Http2FakeStoreServer if request.config.getoption("--api-http2") else FakeStoreServer
+    with server_class() as server:
+        yield server.api_url
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Тесты, упавшие на разомкнутом предохранителе, отмечаются пропущенными"""
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed and call.excinfo is not None and call.excinfo.errisinstance(CircuitOpenError):
+        report.outcome = "skipped"
+        report.longrepr = (str(item.path), item.location[1] or 0, f"Skipped: {call.excinfo.value}")
+
+
+@pytest.fixture(scope="session")
+def api_breaker(request, api_base_url):
+    """Предохранитель для недоступного окружения, общий для воркеров xdist"""
+    threshold = request.config.getoption("--api-breaker-threshold")
+    if threshold <= 0:
+        yield None
+        return
+
+    digest = hashlib.sha1(api_base_url.encode()).hexdigest()[:16]
+    breaker = CircuitBreaker(
+        # Каталог текущего запуска: общий для воркеров xdist, но не для следующих запусков
+        state_path=api_ledger_dir(request.config) / f"api-breaker-{digest}.json",
+        failure_threshold=threshold,
+        reset_timeout=request.config.getoption("--api-breaker-reset")
+    )
+    yield breaker
+
+    if breaker.stats["rejected"] or breaker.stats["opened"]:
+        allure.attach(
+            str(breaker.stats),
+            name="Circuit Breaker Stats",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+
+@pytest.fixture(scope="session")
+def api_cassette(request):
+    """Кассета record/replay (--api-record / --api-replay) или None"""
+    record_path = request.config.getoption("--api-record")
+    replay_path = request.config.getoption("--api-replay")
+    if record_path and replay_path:
+        raise pytest.UsageError("--api-record and --api-replay are mutually exclusive")
+    if not record_path and not replay_path:
+        yield None
+        return
+    # Повторяющиеся запросы воспроизводятся в порядке записи, поэтому без xdist
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        raise pytest.UsageError("--api-record/--api-replay must run without xdist to keep a single request order")
+
+    cassette = Cassette(record_path or replay_path, mode="record" if record_path else "replay")
+    yield cassette
+
+    cassette.close()
+    allure.attach(
+        str(cassette.stats),
+        name="Cassette Stats",
+        attachment_type=allure.attachment_type.TEXT
+    )
+
+
+@pytest.fixture(scope="session")
+def api_transport(request, api_base_url):
+    """Общий пул соединений для всех клиентов в сессии (воркере xdist)"""
+    if request.config.getoption("--api-http2"):
+        # Без TLS HTTP/2 согласуется только с prior knowledge
+        transport = Http2Transport(prior_knowledge=api_base_url.startswith("http://"))
+    else:
+        transport = Transport()
+    yield transport
+
+    allure.attach(
+        str(transport.stats.snapshot()),
+        name="Transport Stats",
+        attachment_type=allure.attachment_type.TEXT
+    )
+    transport.close()
+
+
+@pytest.fixture(scope="session")
+def api_cache(request):
+    """Общий кэш GET ответов, включается опцией --api-cache"""
+    if not request.config.getoption("--api-cache"):
+        yield None
+        return
+
+    cache = ResponseCache(ttl=request.config.getoption("--api-cache-ttl"))
+    yield cache
+
+    allure.attach(
+        str(cache.stats),
+        name="Response Cache Stats",
+        attachment_type=allure.attachment_type.TEXT
+    )
+
+
+@pytest.fixture(scope="session")
+def api_coalesce(request):
+    """Общий SingleFlight для GET запросов, включается опцией --api-coalesce"""
+    if not request.config.getoption("--api-coalesce"):
+        yield None
+        return
+
+    single_flight = SingleFlight()
+    yield single_flight
+
+    allure.attach(
+        str(single_flight.stats),
+        name="Request Coalescing Stats",
+        attachment_type=allure.attachment_type.TEXT
+    )
+
+
+@pytest.fixture(scope="session")
+def api_limiter(request):
+    """Общий адаптивный ограничитель запросов, включается опцией --api-limiter"""
+    if not request.config.getoption("--api-limiter"):
+        yield None
+        return
+
+    limiter = AdaptiveLimiter(max_limit=request.config.getoption("--api-limiter-max"))
+    yield limiter
+
+    allure.attach(
+        str(limiter.snapshot()),
+        name="Adaptive Limiter Stats",
+        attachment_type=allure.attachment_type.TEXT
+    )
+
+
+@pytest.fixture(scope="session")
+def api_ledger(request):
+    """Журнал созданных товаров; оставшиеся удаляются пакетно в конце запуска (pytest_sessionfinish)"""
+    config = request.config
+    if (config.getoption("--api-keep-created") or config.getoption("--fake-api")
+            or config.getoption("--api-replay")):
+        yield None
+        return
+
+    ledger = ResourceLedger(api_ledger_dir(config), os.environ.get("PYTEST_XDIST_WORKER", "main"))
+    yield ledger
+
+    allure.attach(
+        str(ledger.stats),
+        name="Resource Ledger Stats",
+        attachment_type=allure.attachment_type.TEXT
+    )
+
+
+@pytest.fixture(scope="session")
+def product_index():
+    """Общий на сессию индекс имя товара -> ID для extract_product_id"""
+    index = ProductIndex()
+    yield index
+
+    allure.attach(
+        str(dict(index.stats, size=len(index))),
+        name="Product Index Stats",
+        attachment_type=allure.attachment_type.TEXT
+    )
+
+
+@pytest.fixture(scope="session")
+def api_contracts(request):
+    """Проверка ответов по контрактам эндпоинтов, включается опцией --validate-contracts"""
+    if not request.config.getoption("--validate-contracts"):
+        yield None
+        return
+
+    contracts = ContractValidator()
+    yield contracts
+
+    allure.attach(
+        str(contracts.stats),
+        name="Contract Validation Stats",
+        attachment_type=allure.attachment_type.TEXT
+    )
+
+
+@pytest.fixture(scope="session")
+def latency_collector(request):
+    """Гистограммы задержек всех запросов ApiClient, в конце сессии пишутся в JSON и Allure"""
+    collector = LatencyCollector()
+    yield collector
+
+    report = collector.to_json()
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    reports_dir = request.config.rootpath / "reports"
+    reports_dir.mkdir(exist_ok=True)
+    (reports_dir / f"api-latency-{worker}.json").write_text(report, encoding="utf-8")
+    allure.attach(
+        report,
+        name="API Latency Summary",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
 @pytest.fixture
-def api_client():
+def api_client(api_base_url, api_transport, api_cache, api_cassette, api_coalesce, api_limiter,
+               api_breaker, api_ledger, product_index, api_contracts, latency_collector):
     """Базовый неавторизованный клиент"""
-    return ApiClient()
+    client = ApiClient(
+        base_url=api_base_url,
+        transport=api_transport,
+        cache=api_cache,
+        cassette=api_cassette,
+        coalesce=api_coalesce,
+        limiter=api_limiter,
+        breaker=api_breaker,
+        ledger=api_ledger,
+        product_index=product_index,
+        contracts=api_contracts
+    )
+    client.add_hook("request_end", latency_collector)
+    return client
 
 
-@pytest.fixture
-def auth_client():
-    """Авторизованный клиент с повторной попыткой при неудаче"""
-    client = ApiClient()
-    response = client.login(
-        Environment.TEST_USER["username"],
-        Environment.TEST_USER["password"]
-    )
-
-    # Если аутентификация не удалась, делаем повторную попытку
-    if response.status_code != 200:
-        print(f"First login attempt failed with {response.status_code}, retrying...")
-        import time
-        time.sleep(1)
-        response = client.login(
+@pytest.fixture(scope="session")
+def token_broker(request, api_base_url, api_transport, api_cassette, api_limiter, api_breaker,
+                 latency_collector):
+    """Один логин на сессию, токен делится между воркерами xdist через общий файл"""
+    login_client = ApiClient(base_url=api_base_url, transport=api_transport, cassette=api_cassette,
+                             limiter=api_limiter, breaker=api_breaker)
+    login_client.add_hook("request_end", latency_collector)
+    return TokenBroker(
+        login=lambda: login_client.login(
             Environment.TEST_USER["username"],
             Environment.TEST_USER["password"]
-        )
+        ),
+        # Каталог текущего запуска: токен не переживает запуск и не делится с чужими сессиями
+        cache_dir=api_ledger_dir(request.config),
+        key=f"{login_client.base_url}|{Environment.TEST_USER['username']}"
+    )
 
-    # Если вторая попытка тоже не удалась, пропускаем тест
-    if response.status_code != 200:
-        pytest.skip(f"Authentication failed with status {response.status_code}")
 
+@pytest.fixture
+def auth_client(api_base_url, api_transport, api_cache, api_cassette, api_coalesce, api_limiter, api_breaker,
+                api_ledger, product_index, api_contracts, token_broker, latency_collector):
+    """Авторизованный клиент с общим на сессию токеном"""
+    client = ApiClient(
+        base_url=api_base_url,
+        transport=api_transport,
+        cache=api_cache,
+        token_broker=token_broker,
+        cassette=api_cassette,
+        coalesce=api_coalesce,
+        limiter=api_limiter,
+        breaker=api_breaker,
+        ledger=api_ledger,
+        product_index=product_index,
+        contracts=api_contracts
+    )
+    client.add_hook("request_end", latency_collector)
+    try:
+        client.authenticate()
+    except AuthenticationError as e:
+        pytest.skip(str(e))
     return client
 
 
+@pytest_asyncio.fixture
+async def async_api_client(request, api_base_url, api_cassette, api_breaker):
+    """Базовый неавторизованный асинхронный клиент"""
+    if api_cassette is not None and api_cassette.mode == "replay":
+        pytest.skip("AsyncApiClient is not covered by cassette replay")
+    coalesce = AsyncSingleFlight() if request.config.getoption("--api-coalesce") else None
+    async with AsyncApiClient(base_url=api_base_url, coalesce=coalesce, breaker=api_breaker) as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def async_auth_client(request, api_base_url, api_cassette, api_breaker, api_ledger, token_broker):
+    """Авторизованный асинхронный клиент с общим на сессию токеном"""
+    if api_cassette is not None and api_cassette.mode == "replay":
+        pytest.skip("AsyncApiClient is not covered by cassette replay")
+    try:
+        token = token_broker.get_token()
+    except AuthenticationError as e:
+        pytest.skip(str(e))
+
+    coalesce = AsyncSingleFlight() if request.config.getoption("--api-coalesce") else None
+    async with AsyncApiClient(base_url=api_base_url, coalesce=coalesce, breaker=api_breaker,
+                              ledger=api_ledger) as client:
+        client.set_token(token)
+        yield client
+
+
+@pytest.fixture(scope="session")
+def product_pool(request, api_base_url, api_transport, api_cache, api_cassette, api_limiter, api_breaker,
+                 api_ledger, product_index, api_contracts, token_broker, latency_collector):
+    """Пул заранее созданных товаров на сессию (воркер xdist), товары удаляются в конце сессии"""
+    client = ApiClient(
+        base_url=api_base_url,
+        transport=api_transport,
+        # Общий кэш: сброс товара пулом удаляет закэшированные тестами ответы с измененными данными
+        cache=api_cache,
+        token_broker=token_broker,
+        cassette=api_cassette,
+        limiter=api_limiter,
+        breaker=api_breaker,
+        ledger=api_ledger,
+        product_index=product_index,
+        contracts=api_contracts
+    )
+    client.add_hook("request_end", latency_collector)
+    try:
+        client.authenticate()
+    except AuthenticationError as e:
+        pytest.skip(str(e))
+
+    pool = ProductPool(
+        client,
+        new_product_data,
+        size=request.config.getoption("--api-pool-size"),
+        # Кассета воспроизводит запросы по порядку, фоновые запросы его бы нарушили
+        background=api_cassette is None
+    )
+    yield pool
+
+    try:
+        pool.close()
+    except requests.RequestException:
+        # Оставшиеся товары удалит очистка по ResourceLedger
+        pass
+    allure.attach(
+        str(pool.stats),
+        name="Product Pool Stats",
+        attachment_type=allure.attachment_type.TEXT
+    )
+
+
+@pytest.fixture
+def pooled_product(product_pool, auth_client):
+    """Товар из пула в монопольном пользовании теста; измененный тестом товар сбрасывается в фоне.
+
+    Отзывы, оставленные предыдущими тестами, и рассчитанный по ним рейтинг сохраняются:
+    тесты не должны рассчитывать на пустой список отзывов товара из пула.
+    """
+    product = product_pool.checkout()
+    product_url = f"{auth_client.base_url}/products/{product.id}"
+    changes = {"dirty": False, "deleted": False}
+
+    def track(info):
+        if info.url != product_url:
+            return
+        if info.method in ("PUT", "PATCH"):
+            changes["dirty"] = True
+        elif info.method == "DELETE" and info.status in (200, 404):
+            changes["deleted"] = True
+
+    auth_client.add_hook("request_end", track)
+    yield product
+
+    product_pool.checkin(product, **changes)
+
+
 @pytest.fixture
 def sample_product():
     """Тестовые данные товара с уникальным именем"""
-    return {
-        "name": generate_unique_product_name(),
-        "description": "Mechanical gaming keyboard with RGB",
-        "price": 129.99,
-        "category": "Electronics",
-        "stock": 25,
-        "imageUrl": "/keyboard.png"
-    }
+    return new_product_data()
 
 
 @pytest.fixture
@@ -81,16 +453,6 @@ def sample_review():
 
 def extract_product_id(create_response, product_name, auth_client):
     """Вспомогательная функция для извлечения ID созданного товара"""
-    data = create_response.json()
-
-    if "product" in data:
-        return data["product"]["id"]
-    elif "id" in data:
-        return data["id"]
-    else:
-        # Если ID нет в ответе, ищем товар по имени в списке
-        products_response = auth_client.get_products()
-        products_data = products_response.json()
-        our_product = next((p for p in products_data["products"] if p["name"] == product_name), None)
-        assert our_product is not None, f"Товар с именем '{product_name}' не найден в списке"
-        return our_product["id"]
\ No newline at end of file
+    product_id = auth_client.resolve_product_id(product_name, create_response)
+    assert product_id is not None, f"Товар с именем '{product_name}' не найден в списке"
+    return product_id
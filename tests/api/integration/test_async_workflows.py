@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+import allure
+from tests.api.conftest import generate_unique_product_name
+
+
+@pytest.mark.api
+@pytest.mark.integrations
+@pytest.mark.workflows
+@allure.feature("Integration Workflows - Async")
+@allure.severity(allure.severity_level.NORMAL)
+class TestAsyncWorkflows:
+
+    @allure.story("Параллельное чтение каталога")
+    @allure.description("Проверка одновременных запросов на чтение через асинхронный клиент")
+    @allure.tag("workflow", "async", "concurrency")
+    @pytest.mark.asyncio
+    async def test_concurrent_reads(self, async_api_client):
+        """GET /products, /categories - параллельные запросы"""
+        with allure.step("Выполнить 20 одновременных запросов"):
+            responses = await asyncio.gather(
+                *[async_api_client.get_products() for _ in range(10)],
+                *[async_api_client.get_categories() for _ in range(10)]
+            )
+            allure.attach(str([r.status_code for r in responses]),
+                          name="Concurrent Responses",
+                          attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Проверить что все запросы успешны"):
+            assert all(r.status_code == 200 for r in responses)
+            assert all("products" in r.json() for r in responses[:10])
+
+    @allure.story("Параллельное создание товаров")
+    @allure.description("Проверка одновременного создания и удаления нескольких товаров")
+    @allure.tag("workflow", "async", "lifecycle")
+    @pytest.mark.asyncio
+    async def test_concurrent_product_lifecycle(self, async_auth_client):
+        """POST/DELETE /products - параллельный жизненный цикл"""
+        with allure.step("Создать 5 товаров одновременно"):
+            payloads = [
+                {
+                    "name": generate_unique_product_name(),
+                    "price": 10.0 + i,
+                    "category": "Electronics",
+                    "stock": i + 1
+                }
+                for i in range(5)
+            ]
+            create_responses = await asyncio.gather(
+                *[async_auth_client.create_product(p) for p in payloads]
+            )
+            assert all(r.status_code == 201 for r in create_responses)
+
+        with allure.step("Извлечь ID созданных товаров"):
+            product_ids = []
+            for response in create_responses:
+                data = response.json()
+                product_ids.append(data["product"]["id"] if "product" in data else data["id"])
+            allure.attach(str(product_ids), name="Product IDs", attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Удалить товары одновременно"):
+            delete_responses = await asyncio.gather(
+                *[async_auth_client.delete_product(pid) for pid in product_ids]
+            )
+            assert all(r.status_code == 200 for r in delete_responses)
@@ -0,0 +1,59 @@
+import socket
+import time
+
+import pytest
+import allure
+import requests
+from src.api.breaker import CLOSED, OPEN, CircuitBreaker, CircuitOpenError
+from src.api.client import ApiClient
+from src.api.transport import Transport
+from src.fake.server import FakeStoreServer
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.api
+@pytest.mark.integrations
+@allure.feature("Integration Workflows - Circuit Breaker")
+@allure.severity(allure.severity_level.NORMAL)
+class TestCircuitBreaker:
+    """Недоступное окружение имитируется портом, на котором никто не слушает"""
+
+    @allure.story("Быстрый отказ при недоступном окружении")
+    @allure.description("Предохранитель размыкается после 3 сбоев, общий файл состояния видят другие процессы")
+    @allure.tag("breaker", "fast-fail")
+    def test_opens_and_recovers(self, tmp_path):
+        """Сбои -> open -> half-open проба -> closed"""
+        port = free_port()
+        state_path = tmp_path / "breaker.json"
+        breaker = CircuitBreaker(state_path=state_path, failure_threshold=3, reset_timeout=0.5)
+        client = ApiClient(base_url=f"http://127.0.0.1:{port}/api", transport=Transport(retries=0), breaker=breaker)
+
+        with allure.step("Три сетевых сбоя размыкают предохранитель"):
+            for _ in range(3):
+                with pytest.raises(requests.ConnectionError):
+                    client.get_categories()
+            assert breaker.state == OPEN
+
+        with allure.step("Следующие запросы падают сразу, в том числе у другого 'воркера'"):
+            other_worker = CircuitBreaker(state_path=state_path, failure_threshold=3, reset_timeout=0.5)
+            other_client = ApiClient(base_url=client.base_url, transport=Transport(retries=0), breaker=other_worker)
+            start = time.monotonic()
+            with pytest.raises(CircuitOpenError):
+                client.get_products()
+            with pytest.raises(CircuitOpenError):
+                other_client.get_categories()
+            assert time.monotonic() - start < 0.1
+
+        with allure.step("После reset_timeout пробный запрос к поднявшемуся окружению замыкает цепь"):
+            time.sleep(0.6)
+            with FakeStoreServer(port=port):
+                assert client.get_categories().status_code == 200
+                assert breaker.state == CLOSED
+                assert other_client.get_categories().status_code == 200
+            allure.attach(str(breaker.stats), name="Circuit Breaker Stats",
+                          attachment_type=allure.attachment_type.TEXT)
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import allure
+from src.api.async_client import AsyncApiClient
+from src.api.client import ApiClient
+from src.api.coalesce import AsyncSingleFlight, SingleFlight
+
+
+@pytest.mark.api
+@pytest.mark.integrations
+@allure.feature("Integration Workflows - Request Coalescing")
+@allure.severity(allure.severity_level.NORMAL)
+class TestRequestCoalescing:
+
+    @allure.story("Объединение одинаковых GET из потоков")
+    @allure.description("10 потоков одновременно запрашивают /categories, в сеть уходит один запрос")
+    @allure.tag("coalescing", "concurrency")
+    def test_threaded_identical_gets_coalesced(self, api_base_url, api_transport, api_cassette, api_breaker):
+        """GET /categories - одновременные вызовы из потоков"""
+        callers = 10
+        single_flight = SingleFlight()
+        client = ApiClient(base_url=api_base_url, transport=api_transport, cassette=api_cassette,
+                           coalesce=single_flight, breaker=api_breaker)
+
+        def hold_until_all_joined(info):
+            # Первый запрос ждет, пока остальные потоки встанут в очередь за ним
+            deadline = time.monotonic() + 5
+            while single_flight.stats["calls"] < callers and time.monotonic() < deadline:
+                time.sleep(0.001)
+
+        client.add_hook("request_start", hold_until_all_joined)
+        barrier = threading.Barrier(callers)
+
+        def call(_):
+            barrier.wait()
+            return client.get_categories()
+
+        with allure.step("Выполнить 10 одновременных запросов"):
+            with ThreadPoolExecutor(max_workers=callers) as executor:
+                responses = list(executor.map(call, range(callers)))
+            allure.attach(str(single_flight.stats), name="Coalescing Stats",
+                          attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Проверить что выполнен один запрос"):
+            assert all(r.status_code == 200 for r in responses)
+            assert len({id(r) for r in responses}) == callers
+            assert all(r.json() == responses[0].json() for r in responses)
+            assert single_flight.stats == {"calls": callers, "executions": 1, "shared": callers - 1}
+
+    @allure.story("Объединение одинаковых GET из корутин")
+    @allure.description("Одинаковые запросы объединяются, запросы с другими параметрами - нет")
+    @allure.tag("coalescing", "async")
+    @pytest.mark.asyncio
+    async def test_async_identical_gets_coalesced(self, api_base_url, api_cassette, api_breaker):
+        """GET /products - одновременные корутины"""
+        if api_cassette is not None and api_cassette.mode == "replay":
+            pytest.skip("AsyncApiClient is not covered by cassette replay")
+        single_flight = AsyncSingleFlight()
+
+        with allure.step("Выполнить 10 одинаковых и 1 отличающийся запрос"):
+            async with AsyncApiClient(base_url=api_base_url, coalesce=single_flight, breaker=api_breaker) as client:
+                responses = await asyncio.gather(
+                    *[client.get_products() for _ in range(10)],
+                    client.get_products({"category": "Electronics"})
+                )
+            allure.attach(str(single_flight.stats), name="Coalescing Stats",
+                          attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Проверить что выполнено два запроса"):
+            assert all(r.status_code == 200 for r in responses)
+            assert single_flight.stats == {"calls": 11, "executions": 2, "shared": 9}
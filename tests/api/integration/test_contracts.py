@@ -0,0 +1,85 @@
+import json
+
+import pytest
+import allure
+import requests
+from src.api.contracts import ContractError, ContractValidator, validate_response
+from tests.api.conftest import new_product_data
+
+
+def _response(status, body):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode()
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.mark.api
+@pytest.mark.integrations
+@allure.feature("Integration Workflows - Contracts")
+@allure.severity(allure.severity_level.NORMAL)
+class TestContracts:
+
+    @allure.story("Контракты ответов")
+    @allure.description("Ответы всех эндпоинтов товара и отзывов проходят проверку по схемам")
+    @allure.tag("contracts", "schema")
+    def test_responses_match_contracts(self, auth_client):
+        """Полный цикл товара с включенной проверкой контрактов"""
+        contracts = ContractValidator()
+        auth_client.contracts = contracts
+        product = new_product_data()
+
+        with allure.step("Создать, изменить, отрецензировать и удалить товар"):
+            product_id = auth_client.resolve_product_id(product["name"], auth_client.create_product(product))
+            assert product_id is not None
+            assert auth_client.get_product(product_id).status_code == 200
+            assert auth_client.update_product(product_id, dict(product, price=1.5)).status_code == 200
+            assert auth_client.update_product(product_id, {"stock": 3}, method="PATCH").status_code == 200
+            assert auth_client.create_review(product_id, {"rating": 5, "comment": "Contract"}).status_code == 201
+            assert auth_client.get_reviews(product_id).status_code == 200
+            assert auth_client.get_categories().status_code == 200
+            assert auth_client.delete_product(product_id).status_code == 200
+
+        with allure.step("Ошибки тоже проверяются по схеме"):
+            assert auth_client.get_product(product_id).status_code == 404
+
+        allure.attach(str(contracts.stats), name="Contract Validation Stats",
+                      attachment_type=allure.attachment_type.TEXT)
+        assert contracts.stats["violations"] == 0
+        assert contracts.stats["validated"] >= 9
+
+    @allure.story("Нарушение контракта")
+    @allure.description("Ответ с неверной структурой падает с указанием эндпоинта и поля")
+    @allure.tag("contracts", "schema", "negative")
+    def test_violation_is_reported(self):
+        """ContractError с методом, шаблоном пути и причиной"""
+        contracts = ContractValidator()
+        broken = _response(200, {"products": [{"id": "1", "name": "x", "price": "free", "category": "A"}],
+                                 "total": 1})
+
+        with allure.step("Неверный тип поля в элементе списка"):
+            with pytest.raises(ContractError) as excinfo:
+                contracts("GET", "/products", broken)
+            assert excinfo.value.template == "/products"
+            assert "price" in str(excinfo.value)
+            allure.attach(str(excinfo.value), name="Contract Error", attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Ошибка без поля error и ответ без схемы"):
+            with pytest.raises(ContractError):
+                validate_response("GET", "/products/{id}", _response(404, {"message": "not found"}))
+            assert validate_response("GET", "/unknown", _response(200, {})) is False
+            assert contracts.stats == {"validated": 0, "unknown": 0, "violations": 1}
+
+    @allure.story("Создание товара без товара в ответе")
+    @allure.description("Ответ 200 только с сообщением на POST /products описан контрактом, как и 201")
+    @allure.tag("contracts", "schema")
+    def test_create_product_message_only_variant(self):
+        """POST /products -> 200 {"message": ...}"""
+        contracts = ContractValidator()
+        contracts("POST", "/products", _response(200, {"message": "Product created successfully"}))
+        contracts("POST", "/products", _response(201, {"message": "Created", "product": {
+            "id": 1, "name": "x", "price": 1.0, "category": "A"}}))
+        with pytest.raises(ContractError):
+            contracts("POST", "/products", _response(200, {"product": {"id": 1}}))
+        assert contracts.stats == {"validated": 2, "unknown": 0, "violations": 1}
@@ -0,0 +1,53 @@
+import pytest
+import allure
+from src.fake.server import FakeStoreServer
+from src.load.runner import LoadRunner
+from src.load.scenarios import product_lifecycle
+from tests.api.conftest import MessageOnlyStore
+
+
+@pytest.mark.api
+@pytest.mark.integrations
+@pytest.mark.workflows
+@allure.feature("Integration Workflows - Load")
+@allure.severity(allure.severity_level.MINOR)
+class TestLoadRunner:
+
+    @allure.story("Нагрузочный прогон сценария")
+    @allure.description("Короткий прогон жизненного цикла товара на локальном fake API")
+    @allure.tag("workflow", "load")
+    def test_product_lifecycle_load(self):
+        """Сценарий product_lifecycle на 4 виртуальных пользователях"""
+        with allure.step("Запустить нагрузку на 1 секунду"):
+            # Нагрузка всегда идет на локальный fake, чтобы не нагружать общий стенд
+            with FakeStoreServer() as server:
+                report = LoadRunner(product_lifecycle, users=4, ramp_up=0.2, duration=1.0,
+                                    base_url=server.api_url).run()
+            allure.attach(report.format_table(), name="Load Report",
+                          attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Проверить отчет"):
+            assert report.iterations > 0
+            assert report.failed_iterations == 0
+            assert set(report.steps) == {"create", "get", "patch", "put", "review", "get_reviews", "delete"}
+            assert all(step["requests"] == report.iterations for step in report.steps.values())
+            assert report.steps["create"]["latency_ms"]["p99"] > 0
+
+    @allure.story("Нагрузка на окружение без товара в ответе на создание")
+    @allure.description("ID созданного товара находится по имени, если POST /products вернул только сообщение")
+    @allure.tag("workflow", "load")
+    def test_product_lifecycle_message_only_create(self):
+        """Сценарий product_lifecycle, POST /products отвечает 200 {"message": ...}"""
+        with allure.step("Запустить нагрузку на fake API с ответом без товара"):
+            with FakeStoreServer(store=MessageOnlyStore()) as server:
+                report = LoadRunner(product_lifecycle, users=2, duration=0.5, base_url=server.api_url).run()
+            allure.attach(report.format_table(), name="Load Report",
+                          attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Проверить что итерации проходят целиком"):
+            assert report.iterations > 0
+            assert report.failed_iterations == 0
+            assert report.steps["delete"]["requests"] == report.iterations
+            # Поиск ID по имени замерен отдельным шагом, а не спрятан в create
+            assert report.steps["resolve_id"]["requests"] == report.iterations
+            assert report.steps["resolve_id"]["statuses"] == {"found": report.iterations}
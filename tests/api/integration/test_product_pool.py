@@ -0,0 +1,89 @@
+import time
+
+import pytest
+import allure
+from config.environment import Environment
+from src.api.cache import ResponseCache
+from src.api.client import ApiClient
+from src.api.pool import ProductPool
+from src.api.transport import Transport
+from src.fake.server import FakeStoreServer
+from tests.api.conftest import new_product_data
+
+
+@pytest.mark.api
+@pytest.mark.integrations
+@allure.feature("Integration Workflows - Product Pool")
+@allure.severity(allure.severity_level.NORMAL)
+class TestProductPool:
+
+    @allure.story("Переиспользование товаров из пула")
+    @allure.description("Измененный товар сбрасывается в фоне и выдается снова, пустой пул пополняется")
+    @allure.tag("pool", "fixtures")
+    def test_checkout_reset_and_refill(self):
+        """checkout -> PATCH -> checkin -> повторная выдача исходного товара"""
+        with FakeStoreServer() as server:
+            transport = Transport()
+            client = ApiClient(base_url=server.api_url, transport=transport)
+            assert client.login(Environment.TEST_USER["username"], Environment.TEST_USER["password"]).status_code == 200
+            pool = ProductPool(client, new_product_data, size=2)
+
+            with allure.step("Взять товар и изменить его"):
+                first = pool.checkout()
+                assert pool.stats["created"] == 2
+                assert client.update_product(first.id, {"price": 1.0}, method="PATCH").status_code == 200
+                pool.checkin(first, dirty=True)
+
+            with allure.step("Следующие выдачи: свободный товар, затем сброшенный"):
+                second = pool.checkout()
+                recycled = pool.checkout()
+                assert second.id != first.id
+                assert recycled.id == first.id
+                assert client.get_product(recycled.id).json()["product"]["price"] == first.data["price"]
+
+            with allure.step("Пустой пул пополняется в фоне"):
+                deadline = time.monotonic() + 5
+                while pool.stats["created"] < 4 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert pool.stats["created"] == 4
+                allure.attach(str(pool.stats), name="Product Pool Stats",
+                              attachment_type=allure.attachment_type.TEXT)
+
+            with allure.step("close удаляет все товары пула"):
+                pool.checkin(second)
+                pool.checkin(recycled, deleted=client.delete_product(recycled.id).status_code == 200)
+                results = pool.close()
+                assert len(results) == 3
+                assert all(r.response.status_code == 200 for r in results)
+            transport.close()
+
+    @allure.story("Сброс товара и общий кэш")
+    @allure.description("Сброс товара пулом сбрасывает закэшированный тестом ответ с измененными данными")
+    @allure.tag("pool", "cache")
+    def test_reset_invalidates_shared_cache(self):
+        """PATCH + GET в тесте -> checkin -> следующий тест читает исходный товар, а не кэш"""
+        with FakeStoreServer() as server:
+            transport = Transport()
+            cache = ResponseCache(ttl=60)
+            pool_client = ApiClient(base_url=server.api_url, transport=transport, cache=cache)
+            assert pool_client.login(
+                Environment.TEST_USER["username"], Environment.TEST_USER["password"]).status_code == 200
+            test_client = ApiClient(base_url=server.api_url, transport=transport, cache=cache)
+            test_client.set_token(pool_client.token)
+            pool = ProductPool(pool_client, new_product_data, size=1, background=False)
+
+            with allure.step("Тест меняет товар и читает его, ответ попадает в кэш"):
+                product = pool.checkout()
+                assert test_client.update_product(product.id, {"price": 1.0}, method="PATCH").status_code == 200
+                assert test_client.get_product(product.id).json()["product"]["price"] == 1.0
+                pool.checkin(product, dirty=True)
+
+            with allure.step("Следующий тест получает сброшенный товар без устаревшего кэша"):
+                recycled = pool.checkout()
+                assert recycled.id == product.id
+                assert test_client.get_product(recycled.id).json()["product"]["price"] == product.data["price"]
+                allure.attach(str(cache.stats), name="Cache Stats", attachment_type=allure.attachment_type.TEXT)
+
+            pool.checkin(recycled)
+            pool.close()
+            transport.close()
@@ -0,0 +1,48 @@
+import pytest
+import allure
+from src.api.resolver import ProductIndex
+from tests.api.conftest import generate_unique_product_name
+
+
+@pytest.mark.api
+@pytest.mark.integrations
+@allure.feature("Integration Workflows - Product Resolver")
+@allure.severity(allure.severity_level.NORMAL)
+class TestProductResolver:
+
+    @allure.story("Поиск ID товара по имени")
+    @allure.description("Индекс отвечает без запросов, промах идет через фильтр search, а не перебор каталога")
+    @allure.tag("resolver", "index")
+    def test_resolve_product_id(self, auth_client):
+        """Индекс -> search -> перебор каталога"""
+        index = ProductIndex(max_size=2)
+        auth_client.product_index = index
+        requests_log = []
+        auth_client.add_hook("request_end", lambda info: requests_log.append((info.method, info.url)))
+        names = [generate_unique_product_name() for _ in range(3)]
+
+        with allure.step("Создать 3 товара в индексе на 2 записи"):
+            ids = [
+                auth_client.resolve_product_id(name, auth_client.create_product(
+                    {"name": name, "price": 10.0, "category": "Electronics", "stock": 1}
+                ))
+                for name in names
+            ]
+            assert len(index) == 2
+            assert index.stats["evictions"] == 1
+
+        with allure.step("Свежие имена разрешаются из индекса без запросов"):
+            requests_log.clear()
+            assert [auth_client.resolve_product_id(name) for name in names[1:]] == ids[1:]
+            assert requests_log == []
+
+        with allure.step("Вытесненное имя разрешается одним запросом с search"):
+            assert auth_client.resolve_product_id(names[0]) == ids[0]
+            assert requests_log == [("GET", f"{auth_client.base_url}/products")]
+            allure.attach(str(index.stats), name="Product Index Stats",
+                          attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Удаленный товар пропадает из индекса"):
+            assert auth_client.delete_product(ids[0]).status_code == 200
+            assert index.get(names[0]) is None
+            assert auth_client.resolve_product_id(names[0]) is None
@@ -0,0 +1,65 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import allure
+from config.environment import Environment
+from src.api.client import ApiClient
+from src.api.limiter import AdaptiveLimiter
+from src.api.transport import Transport
+from src.fake.server import FakeStoreServer
+
+
+@pytest.mark.api
+@pytest.mark.integrations
+@allure.feature("Integration Workflows - Adaptive Limiter")
+@allure.severity(allure.severity_level.NORMAL)
+class TestAdaptiveLimiter:
+    """Перегрузка имитируется локальным fake API с лимитом одновременных запросов"""
+
+    @allure.story("Снижение лимита при 429")
+    @allure.description("Всплеск из 32 потоков против сервера, принимающего 4 запроса одновременно")
+    @allure.tag("limiter", "concurrency")
+    def test_burst_adapts_to_server_capacity(self):
+        """GET /categories - 64 запроса из 32 потоков"""
+        limiter = AdaptiveLimiter(initial=16, max_limit=32)
+
+        with allure.step("Выполнить всплеск запросов"):
+            with FakeStoreServer(max_concurrency=4, latency=0.01, retry_after=0) as server:
+                client = ApiClient(base_url=server.api_url, transport=Transport(pool_maxsize=32), limiter=limiter)
+                with ThreadPoolExecutor(max_workers=32) as executor:
+                    responses = list(executor.map(lambda _: client.get_categories(), range(64)))
+            allure.attach(str(limiter.snapshot()), name="Limiter Stats",
+                          attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Проверить что все запросы успешны после повторов"):
+            assert [r.status_code for r in responses] == [200] * 64
+            assert server.rejected == limiter.stats["throttled"] > 0
+            assert limiter.stats["decreases"] > 0
+            assert limiter.limit < 16
+
+    @allure.story("Пауза по Retry-After")
+    @allure.description("После 429 с Retry-After: 1 повтор уходит не раньше чем через секунду")
+    @allure.tag("limiter", "retry-after")
+    def test_retry_after_is_honored(self):
+        """POST /auth/login - два одновременных запроса к серверу с одним слотом.
+
+        POST транспорт не повторяет, поэтому паузу и повтор выполняет ограничитель.
+        """
+        limiter = AdaptiveLimiter(initial=2)
+
+        with allure.step("Выполнить два одновременных запроса"):
+            with FakeStoreServer(max_concurrency=1, latency=0.2, retry_after=1) as server:
+                client = ApiClient(base_url=server.api_url, transport=Transport(), limiter=limiter)
+                start = time.monotonic()
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    responses = list(executor.map(
+                        lambda _: client.login(Environment.TEST_USER["username"], Environment.TEST_USER["password"]),
+                        range(2)
+                    ))
+                elapsed = time.monotonic() - start
+
+        with allure.step("Проверить паузу и успешный повтор"):
+            assert [r.status_code for r in responses] == [200, 200]
+            assert server.rejected == limiter.stats["throttled"] == 1
+            assert elapsed >= 1.0
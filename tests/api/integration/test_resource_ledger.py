@@ -0,0 +1,88 @@
+import pytest
+import allure
+from config.environment import Environment
+from src.api.client import ApiClient
+from src.api.ledger import ResourceLedger, created_product_id, purge_leftovers
+from src.api.transport import Transport
+from src.fake.server import FakeStoreServer
+from tests.api.conftest import MessageOnlyStore, generate_unique_product_name
+
+
+@pytest.mark.api
+@pytest.mark.integrations
+@allure.feature("Integration Workflows - Resource Ledger")
+@allure.severity(allure.severity_level.NORMAL)
+class TestResourceLedger:
+    """Два воркера xdist имитируются двумя журналами в общем каталоге"""
+
+    @allure.story("Пакетная очистка созданных товаров")
+    @allure.description("Товары, не удаленные тестами обоих воркеров, удаляются одним пакетом")
+    @allure.tag("ledger", "cleanup")
+    def test_leftovers_are_purged(self, tmp_path):
+        """POST /products в двух воркерах -> DELETE части -> пакетная очистка остатков"""
+        with FakeStoreServer() as server:
+            transport = Transport()
+            workers = {}
+            for name in ("gw0", "gw1"):
+                client = ApiClient(base_url=server.api_url, transport=transport,
+                                   ledger=ResourceLedger(tmp_path, name))
+                assert client.login(Environment.TEST_USER["username"],
+                                    Environment.TEST_USER["password"]).status_code == 200
+                workers[name] = client
+
+            with allure.step("Каждый воркер создает 3 товара и удаляет один"):
+                created = []
+                for client in workers.values():
+                    ids = [
+                        created_product_id(client.create_product({
+                            "name": generate_unique_product_name(),
+                            "price": 10.0,
+                            "category": "Electronics",
+                            "stock": 1
+                        }))
+                        for _ in range(3)
+                    ]
+                    assert client.delete_product(ids[0]).status_code == 200
+                    created.extend(ids[1:])
+
+            with allure.step("Журналы обоих воркеров сводятся к оставшимся товарам"):
+                assert sorted(ResourceLedger.live_ids(tmp_path)) == sorted(created)
+
+            with allure.step("Удалить остатки пакетом"):
+                cleanup_client = workers["gw0"]
+                results = purge_leftovers(cleanup_client, tmp_path)
+                allure.attach(str(results), name="Cleanup Results", attachment_type=allure.attachment_type.TEXT)
+                assert [r.response.status_code for r in results] == [200] * len(created)
+                assert all(cleanup_client.get_product(pid).status_code == 404 for pid in created)
+                assert ResourceLedger.live_ids(tmp_path) == []
+            transport.close()
+
+    @allure.story("Журнал при ответе без товара")
+    @allure.description("Товар, созданный с ответом 200 только с сообщением, находится по имени и попадает в журнал")
+    @allure.tag("ledger", "cleanup")
+    def test_message_only_create_is_recorded(self, tmp_path):
+        """POST /products -> 200 {"message": ...} -> ID по имени в журнале -> пакетная очистка"""
+        with FakeStoreServer(store=MessageOnlyStore()) as server:
+            transport = Transport()
+            ledger = ResourceLedger(tmp_path, "gw0")
+            client = ApiClient(base_url=server.api_url, transport=transport, ledger=ledger)
+            assert client.login(Environment.TEST_USER["username"],
+                                Environment.TEST_USER["password"]).status_code == 200
+            name = generate_unique_product_name()
+
+            with allure.step("Создать товар, ответ без ID"):
+                response = client.create_product({"name": name, "price": 10.0, "category": "Electronics", "stock": 1})
+                assert response.status_code == 200
+                assert created_product_id(response) is None
+
+            with allure.step("ID найден по имени и записан в журнал"):
+                product_id = client.resolve_product_id(name)
+                assert product_id is not None
+                assert ResourceLedger.live_ids(tmp_path) == [product_id]
+                assert ledger.stats["created"] == 1
+
+            with allure.step("Пакетная очистка удаляет товар"):
+                results = purge_leftovers(client, tmp_path)
+                assert [r.response.status_code for r in results] == [200]
+                assert client.get_product(product_id).status_code == 404
+            transport.close()
@@ -0,0 +1,34 @@
+import pytest
+import allure
+from src.api.cache import ResponseCache
+from src.api.client import ApiClient
+
+
+@pytest.mark.api
+@pytest.mark.integrations
+@allure.feature("Integration Workflows - Response Cache")
+@allure.severity(allure.severity_level.NORMAL)
+class TestResponseCache:
+
+    @allure.story("Кэш не смешивает пользователей")
+    @allure.description("Ответ, закэшированный для одного токена, не отдается клиенту с другим токеном")
+    @allure.tag("cache", "auth")
+    def test_cache_key_includes_token(self, api_base_url, api_transport, api_cassette, api_breaker):
+        """GET /categories - анонимный клиент и клиент с токеном на общем кэше"""
+        cache = ResponseCache(ttl=60)
+        anonymous = ApiClient(base_url=api_base_url, transport=api_transport, cassette=api_cassette,
+                              cache=cache, breaker=api_breaker)
+        authorized = ApiClient(base_url=api_base_url, transport=api_transport, cassette=api_cassette,
+                               cache=cache, breaker=api_breaker)
+        authorized.set_token("token-of-another-user")
+
+        with allure.step("Запросы от разных пользователей идут в сеть"):
+            assert anonymous.get_categories().status_code == 200
+            assert authorized.get_categories().status_code == 200
+            assert cache.stats["misses"] == 2 and cache.stats["hits"] == 0
+
+        with allure.step("Повторный запрос того же пользователя берется из кэша"):
+            assert anonymous.get_categories().status_code == 200
+            allure.attach(str(cache.stats), name="Cache Stats", attachment_type=allure.attachment_type.TEXT)
+            assert cache.stats["hits"] == 1
+            assert len(cache) == 2
@@ -0,0 +1,128 @@
+import shutil
+import ssl
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import allure
+import requests
+from src.api.http2 import Http2Transport
+from src.api.transport import Transport, begin_request_timing, end_request_timing
+
+
+def _make_certificates(directory):
+    """Локальный CA и подписанный им сертификат для localhost (openssl)"""
+    def openssl(*args):
+        subprocess.run(["openssl", *args], cwd=directory, check=True, capture_output=True)
+
+    openssl("req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=Test CA",
+            "-keyout", "ca.key", "-out", "ca.pem")
+    openssl("req", "-newkey", "rsa:2048", "-nodes", "-subj", "/CN=localhost",
+            "-keyout", "server.key", "-out", "server.csr")
+    (directory / "san.ext").write_text("subjectAltName=DNS:localhost\n", encoding="utf-8")
+    openssl("x509", "-req", "-in", "server.csr", "-CA", "ca.pem", "-CAkey", "ca.key", "-CAcreateserial",
+            "-days", "1", "-extfile", "san.ext", "-out", "server.pem")
+    return directory / "ca.pem", directory / "server.pem", directory / "server.key"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _CountingServer(ThreadingHTTPServer):
+    """HTTPS сервер, считающий принятые TCP соединения"""
+    daemon_threads = True
+
+    def __init__(self, context):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.context = context
+        self.accepted = 0
+
+    def get_request(self):
+        sock, address = super().get_request()
+        self.accepted += 1
+        return self.context.wrap_socket(sock, server_side=True), address
+
+
+@pytest.fixture
+def tls_server(tmp_path):
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl не найден")
+    ca, cert, key = _make_certificates(tmp_path)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server = _CountingServer(context)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, str(ca)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.api
+@pytest.mark.integrations
+@allure.feature("Integration Workflows - Transport")
+@allure.severity(allure.severity_level.NORMAL)
+class TestTransport:
+
+    @allure.story("HTTPS через разрешенный заранее адрес")
+    @allure.description("Новое HTTPS соединение - одно TCP подключение с проверкой сертификата по имени хоста")
+    @allure.tag("transport", "tls")
+    def test_https_connection_uses_hostname_for_tls(self, tls_server):
+        """GET https://localhost - рукопожатие с первой попытки, затем соединение переиспользуется"""
+        server, ca = tls_server
+        transport = Transport(retries=0)
+        session = requests.Session()
+        session.mount("https://", transport)
+        url = f"https://localhost:{server.server_address[1]}/"
+
+        with allure.step("Два запроса подряд с замером таймингов"):
+            timings = []
+            for _ in range(2):
+                begin_request_timing()
+                try:
+                    response = session.get(url, verify=ca)
+                finally:
+                    timings.append(end_request_timing())
+                assert response.status_code == 200
+            allure.attach(str(timings), name="Connection Timings", attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Одно TCP подключение на одно новое соединение"):
+            assert server.accepted == 1
+            assert transport.stats.snapshot()["new_connections"] == 1
+            assert timings[0]["reused"] is False and timings[1]["reused"] is True
+
+    @allure.story("HTTP/2 транспорт: verify и elapsed")
+    @allure.description("Http2Transport проверяет сертификат по переданному CA и заполняет response.elapsed")
+    @allure.tag("transport", "tls", "http2")
+    def test_http2_transport_applies_verify_and_elapsed(self, tls_server):
+        """Без CA рукопожатие отклоняется, с verify=CA запрос проходит и время ответа не нулевое"""
+        server, ca = tls_server
+        transport = Http2Transport(retries=0)
+        session = requests.Session()
+        session.mount("https://", transport)
+        url = f"https://localhost:{server.server_address[1]}/"
+        try:
+            with allure.step("verify по умолчанию - сертификат локального CA не принимается"):
+                with pytest.raises(requests.ConnectionError):
+                    session.get(url)
+
+            with allure.step("verify=CA - запрос проходит"):
+                response = session.get(url, verify=ca)
+                allure.attach(str(response.elapsed), name="Elapsed", attachment_type=allure.attachment_type.TEXT)
+                assert response.status_code == 200
+                assert response.elapsed.total_seconds() > 0
+        finally:
+            transport.close()
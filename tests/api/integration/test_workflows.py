@@ -2,6 +2,7 @@ import pytest
 import allure
 import random
 import string
+from tests.api.conftest import extract_product_id
 
 @pytest.mark.api
 @pytest.mark.integrations
@@ -38,17 +39,7 @@ class TestWorkflows:
             assert create_response.status_code == 201
 
         with allure.step("Извлечь ID созданного товара"):
-            create_data = create_response.json()
-            if "product" in create_data:
-                product_id = create_data["product"]["id"]
-            elif "id" in create_data:
-                product_id = create_data["id"]
-            else:
-                products_response = auth_client.get_products()
-                products_data = products_response.json()
-                our_product = next((p for p in products_data["products"] if p["name"] == product_data["name"]), None)
-                assert our_product is not None
-                product_id = our_product["id"]
+            product_id = extract_product_id(create_response, product_data["name"], auth_client)
 
             allure.attach(f"Product ID: {product_id}", name="Product ID", attachment_type=allure.attachment_type.TEXT)
 
@@ -125,17 +116,7 @@ class TestWorkflows:
             assert create_response.status_code == 201
 
         with allure.step("Извлечь ID товара"):
-            create_data = create_response.json()
-            if "product" in create_data:
-                product_id = create_data["product"]["id"]
-            elif "id" in create_data:
-                product_id = create_data["id"]
-            else:
-                products_response = auth_client.get_products()
-                products_data = products_response.json()
-                our_product = next((p for p in products_data["products"] if p["name"] == product_data["name"]), None)
-                assert our_product is not None
-                product_id = our_product["id"]
+            product_id = extract_product_id(create_response, product_data["name"], auth_client)
 
         with allure.step("Получить начальные отзывы"):
             initial_reviews_response = auth_client.get_reviews(product_id)
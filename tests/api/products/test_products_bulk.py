@@ -0,0 +1,57 @@
+import pytest
+import allure
+from tests.api.conftest import generate_unique_product_name, extract_product_id
+
+
+@pytest.mark.api
+@pytest.mark.products
+@allure.feature("Products - Bulk")
+@allure.severity(allure.severity_level.NORMAL)
+class TestProductsBulk:
+
+    @allure.story("Пакетное создание и удаление")
+    @allure.description("Проверка пакетного создания и удаления товаров с сохранением порядка")
+    @allure.tag("products", "bulk", "positive")
+    def test_bulk_create_and_delete(self, auth_client):
+        """POST/DELETE /products - пакетные операции"""
+        with allure.step("Создать 10 товаров пакетом"):
+            payloads = [
+                {
+                    "name": generate_unique_product_name(),
+                    "price": 10.0 + i,
+                    "category": "Electronics",
+                    "stock": i + 1
+                }
+                for i in range(10)
+            ]
+            create_results = auth_client.create_products(payloads)
+            allure.attach(str(create_results), name="Create Results", attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Проверить статусы и порядок результатов"):
+            assert len(create_results) == len(payloads)
+            assert all(r.ok and r.response.status_code == 201 for r in create_results)
+            assert [r.item["name"] for r in create_results] == [p["name"] for p in payloads]
+
+        with allure.step("Удалить товары пакетом"):
+            product_ids = [extract_product_id(r.response, r.item["name"], auth_client) for r in create_results]
+            delete_results = auth_client.delete_products(product_ids)
+            assert [r.item for r in delete_results] == product_ids
+            assert all(r.response.status_code == 200 for r in delete_results)
+
+    @allure.story("Частичные ошибки в пакете")
+    @allure.description("Проверка что ошибка одного элемента не прерывает пакет")
+    @allure.tag("products", "bulk", "negative")
+    def test_bulk_delete_partial_failure(self, auth_client, sample_product):
+        """DELETE /products - пакет с несуществующим товаром"""
+        with allure.step("Создать тестовый товар"):
+            create_response = auth_client.create_product(sample_product)
+            assert create_response.status_code == 201
+            product_id = extract_product_id(create_response, sample_product["name"], auth_client)
+
+        with allure.step("Удалить пакет с несуществующим ID в середине"):
+            results = auth_client.delete_products(["nonexistent-id", product_id, "nonexistent-id-2"])
+            allure.attach(str(results), name="Delete Results", attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Проверить результаты по каждому элементу"):
+            assert [r.response.status_code for r in results] == [404, 200, 404]
+            assert [r.ok for r in results] == [False, True, False]
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+import allure
+from config.environment import Environment
+from src.api.client import ApiClient
+from src.api.transport import Transport
+from src.fake.server import FakeStoreServer
+from src.fuzz.engine import Fuzzer
+
+
+class _ExpensivePriceFuzzer(Fuzzer):
+    """Искусственное свойство "цена меньше 5000", чтобы проверить минимизацию"""
+
+    def check(self, case, response):
+        price = case.payload.get("price")
+        if isinstance(price, (int, float)) and not isinstance(price, bool) and price >= 5000:
+            return "price >= 5000"
+        return None
+
+
+@pytest.fixture
+def fake_fuzz_client(api_contracts):
+    """Авторизованный клиент локального fake API; транспорт закрывается и при падении теста"""
+    with FakeStoreServer() as server:
+        client = ApiClient(base_url=server.api_url, transport=Transport(), contracts=api_contracts)
+        try:
+            client.login(Environment.TEST_USER["username"], Environment.TEST_USER["password"])
+            yield client
+        finally:
+            client.transport.close()
+
+
+@pytest.mark.api
+@pytest.mark.products
+@pytest.mark.validation
+@allure.feature("Products - Validation")
+@allure.severity(allure.severity_level.NORMAL)
+class TestProductsFuzz:
+
+    @allure.story("Фаззинг валидации")
+    @allure.description("Граничные числа, юникод, большие поля, путаница типов: без 5xx, валидные данные принимаются")
+    @allure.tag("products", "reviews", "validation", "fuzz")
+    def test_fuzz_product_and_review_payloads(self, request):
+        """POST /products, PUT/PATCH /products/{id}, POST /products/{id}/review - сгенерированные данные"""
+        live = request.config.getoption("--api-fuzz-live")
+        cases = request.config.getoption("--api-fuzz-cases")
+        with allure.step("Отправить сгенерированные запросы параллельно"):
+            if live:
+                # Общий стенд: только по явной опции и небольшим объемом
+                client = request.getfixturevalue("auth_client")
+                if client.cassette is not None:
+                    pytest.skip("Concurrent generated requests have no stable order for the cassette")
+                report = Fuzzer(client, cases=cases or 30, workers=4).run()
+            else:
+                # По умолчанию враждебные данные уходят на локальный fake, чтобы не нагружать общий стенд
+                client = request.getfixturevalue("fake_fuzz_client")
+                report = Fuzzer(client, cases=cases or 210, workers=8).run()
+            allure.attach(report.format_table(), name="Fuzz Summary", attachment_type=allure.attachment_type.TEXT)
+            allure.attach(report.to_json(), name="Fuzz Report", attachment_type=allure.attachment_type.JSON)
+
+        with allure.step("Проверить что свойства не нарушены"):
+            assert report.failures == [], json.dumps(report.failures, indent=2, ensure_ascii=False, default=repr)
+
+    @allure.story("Минимизация падающих данных")
+    @allure.description("Нарушение сводится к минимальным данным, которые его воспроизводят")
+    @allure.tag("fuzz", "shrinking")
+    def test_failing_case_is_shrunk(self, fake_fuzz_client):
+        """Искусственное нарушение на локальном fake API"""
+        with allure.step("Отправить данные с искусственным свойством"):
+            fuzzer = _ExpensivePriceFuzzer(fake_fuzz_client, targets=["create_product"], cases=42, workers=4, seed=7)
+            report = fuzzer.run()
+
+        with allure.step("Проверить минимизированные данные"):
+            assert report.failures
+            assert {f["reason"] for f in report.failures} == {"price >= 5000"}
+            allure.attach(json.dumps(report.failures, ensure_ascii=False, default=repr),
+                          name="Shrunk Failures", attachment_type=allure.attachment_type.JSON)
+            for failure in report.failures:
+                assert list(failure["shrunk"]) == ["price"]
+                assert 5000 <= failure["shrunk"]["price"] < 10000
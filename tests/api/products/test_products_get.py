@@ -1,5 +1,6 @@
 import pytest
 import allure
+from src.api.contracts import validate_response
 
 @pytest.mark.api
 @pytest.mark.products
@@ -21,11 +22,9 @@ class TestProductsGet:
         with allure.step("Проверить статус код 200"):
             assert response.status_code == 200
 
-        with allure.step("Проверить структуру ответа"):
+        with allure.step("Проверить ответ по контракту GET /products"):
+            validate_response("GET", "/products", response)
             data = response.json()
-            assert "products" in data
-            assert "total" in data
-            assert isinstance(data["products"], list)
             assert len(data["products"]) > 0
 
         allure.attach(f"Total products: {data['total']}", name="Products Count",
@@ -142,3 +141,23 @@ class TestProductsGet:
 
         with allure.step("Проверить статус код 404"):
             assert response.status_code == 404
+
+    @allure.story("Постраничный перебор товаров")
+    @allure.description("Проверка что iter_products отдает тот же набор товаров, что и полный запрос")
+    @allure.tag("products", "get", "pagination", "positive")
+    def test_iter_products_matches_full_list(self, api_client):
+        """GET /products?page=N&limit=M - постраничный перебор"""
+        with allure.step("Получить полный список товаров категории Electronics"):
+            response = api_client.get_products({"category": "Electronics"})
+            assert response.status_code == 200
+            expected_ids = [p["id"] for p in response.json()["products"]]
+
+        with allure.step("Перебрать те же товары маленькими страницами"):
+            iterated_ids = [p["id"] for p in api_client.iter_products({"category": "Electronics"}, page_size=2)]
+            allure.attach(f"Full list: {len(expected_ids)}, iterated: {len(iterated_ids)}",
+                          name="Iterated Products",
+                          attachment_type=allure.attachment_type.TEXT)
+
+        with allure.step("Проверить что наборы совпадают без дубликатов"):
+            assert len(iterated_ids) == len(set(iterated_ids))
+            assert sorted(iterated_ids) == sorted(expected_ids)
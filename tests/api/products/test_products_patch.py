@@ -1,6 +1,5 @@
 import pytest
 import allure
-from tests.api.conftest import extract_product_id
 
 @pytest.mark.api
 @pytest.mark.products
@@ -11,11 +10,10 @@ class TestProductsPatch:
     @allure.story("Частичное обновление")
     @allure.description("Проверка успешного частичного обновления товара")
     @allure.tag("products", "patch", "positive")
-    def test_patch_update_product_success(self, auth_client, sample_product):
+    def test_patch_update_product_success(self, auth_client, pooled_product):
         """PATCH /products/{id} - успешное частичное обновление"""
-        with allure.step("Создать тестовый товар"):
-            create_response = auth_client.create_product(sample_product)
-            product_id = extract_product_id(create_response, sample_product["name"], auth_client)
+        with allure.step("Взять товар из пула"):
+            product_id = pooled_product.id
 
         with allure.step("Подготовить данные для частичного обновления"):
             patch_data = {
@@ -42,16 +40,15 @@ class TestProductsPatch:
             updated_product = data["product"]
             assert updated_product["price"] == patch_data["price"]
             assert updated_product["stock"] == patch_data["stock"]
-            assert updated_product["name"] == sample_product["name"]
+            assert updated_product["name"] == pooled_product.data["name"]
 
     @allure.story("Обновление одного поля")
     @allure.description("Проверка обновления только одного поля товара")
     @allure.tag("products", "patch", "positive")
-    def test_patch_single_field(self, auth_client, sample_product):
+    def test_patch_single_field(self, auth_client, pooled_product):
         """PATCH /products/{id} - обновление одного поля"""
-        with allure.step("Создать тестовый товар"):
-            create_response = auth_client.create_product(sample_product)
-            product_id = extract_product_id(create_response, sample_product["name"], auth_client)
+        with allure.step("Взять товар из пула"):
+            product_id = pooled_product.id
 
         with allure.step("Подготовить данные для обновления цены"):
             patch_data = {"price": 79.99}
@@ -69,7 +66,38 @@ class TestProductsPatch:
             data = response.json()
             updated_product = data["product"]
             assert updated_product["price"] == patch_data["price"]
-            assert updated_product["name"] == sample_product["name"]
+            assert updated_product["name"] == pooled_product.data["name"]
+
+    @allure.story("Переименование в занятое имя")
+    @allure.description("Проверка конфликта при переименовании товара в имя другого товара")
+    @allure.tag("products", "patch", "negative")
+    def test_patch_rename_to_existing_name(self, auth_client, pooled_product, sample_product):
+        """PATCH /products/{id} - имя уже занято другим товаром"""
+        with allure.step("Создать второй товар"):
+            create_response = auth_client.create_product(sample_product)
+            assert create_response.status_code in [200, 201]
+            other_id = auth_client.resolve_product_id(sample_product["name"], create_response)
+            assert other_id is not None
+
+        try:
+            with allure.step("Переименовать товар из пула в имя второго товара"):
+                response = auth_client.update_product(pooled_product.id, {"name": sample_product["name"]},
+                                                      method="PATCH")
+                allure.attach(f"Rename PATCH Response: {response.status_code}",
+                              name="Rename Response",
+                              attachment_type=allure.attachment_type.TEXT)
+
+            with allure.step("Проверить конфликт 409 или ошибку 400"):
+                assert response.status_code in [409, 400], f"Expected 409 or 400, got {response.status_code}"
+                assert "error" in response.json()
+
+            with allure.step("Проверить что оба товара сохранили имена"):
+                assert auth_client.get_product(pooled_product.id).json()["product"]["name"] == \
+                    pooled_product.data["name"]
+                assert auth_client.get_product(other_id).json()["product"]["name"] == sample_product["name"]
+        finally:
+            with allure.step("Очистка - удалить второй товар"):
+                auth_client.delete_product(other_id)
 
     @allure.story("Обновление несуществующего товара")
     @allure.description("Проверка ошибки при обновлении несуществующего товара")
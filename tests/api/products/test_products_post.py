@@ -41,11 +41,8 @@ class TestProductsPost:
             if "product" in data:
                 created_product = data["product"]
             elif "message" in data:
-                products_response = auth_client.get_products()
-                products_data = products_response.json()
-                our_product = next((p for p in products_data["products"] if p["name"] == unique_product["name"]), None)
-                assert our_product is not None
-                created_product = our_product
+                product_id = extract_product_id(response, unique_product["name"], auth_client)
+                created_product = auth_client.get_product(product_id).json()["product"]
             else:
                 created_product = data
 
@@ -2,7 +2,6 @@ import pytest
 import allure
 import random
 import string
-from tests.api.conftest import extract_product_id
 
 
 @pytest.mark.api
@@ -19,17 +18,10 @@ class TestProductsPut:
     @allure.story("Полное обновление")
     @allure.description("Проверка успешного полного обновления товара")
     @allure.tag("products", "put", "positive")
-    def test_put_update_product_success(self, auth_client, sample_product):
+    def test_put_update_product_success(self, auth_client, pooled_product):
         """PUT /products/{id} - успешное полное обновление"""
-        with allure.step("Создать товар для обновления"):
-            unique_product = sample_product.copy()
-            unique_product["name"] = self.generate_unique_product_name()
-            create_response = auth_client.create_product(unique_product)
-
-            # Проверяем успешное создание
-            assert create_response.status_code in [200, 201], f"Create failed with {create_response.status_code}"
-
-            product_id = extract_product_id(create_response, unique_product["name"], auth_client)
+        with allure.step("Взять товар из пула"):
+            product_id = pooled_product.id
 
         with allure.step("Подготовить данные для полного обновления"):
             update_data = {
@@ -65,15 +57,10 @@ class TestProductsPut:
     @allure.story("Валидация данных")
     @allure.description("Проверка ошибки при отсутствии обязательных полей при обновлении")
     @allure.tag("products", "put", "negative", "validation")
-    def test_put_update_missing_required_fields(self, auth_client, sample_product):
+    def test_put_update_missing_required_fields(self, auth_client, pooled_product):
         """PUT /products/{id} - отсутствуют обязательные поля"""
-        with allure.step("Создать товар для обновления"):
-            create_response = auth_client.create_product(sample_product)
-
-            # Проверяем успешное создание
-            assert create_response.status_code in [200, 201], f"Create failed with {create_response.status_code}"
-
-            product_id = extract_product_id(create_response, sample_product["name"], auth_client)
+        with allure.step("Взять товар из пула"):
+            product_id = pooled_product.id
 
         with allure.step("Подготовить неполные данные для обновления"):
             incomplete_data = {
@@ -105,18 +105,9 @@ class TestProductsValidation:
                 pytest.skip("Could not create product for update test")
 
         with allure.step("Извлечь ID созданного товара"):
-            create_data = create_response.json()
-            if "product" in create_data:
-                product_id = create_data["product"]["id"]
-            elif "id" in create_data:
-                product_id = create_data["id"]
-            else:
-                products_response = auth_client.get_products()
-                products_data = products_response.json()
-                our_product = next((p for p in products_data["products"] if p["name"] == valid_data["name"]), None)
-                if our_product is None:
-                    pytest.skip("Could not find created product")
-                product_id = our_product["id"]
+            product_id = auth_client.resolve_product_id(valid_data["name"], create_response)
+            if product_id is None:
+                pytest.skip("Could not find created product")
 
         with allure.step("Подготовить невалидные данные для обновления"):
             invalid_update = {
@@ -1,5 +1,6 @@
 import pytest
 import allure
+from src.api.contracts import validate_response
 
 @pytest.mark.api
 @pytest.mark.reviews
@@ -26,11 +27,9 @@ class TestReviewsGet:
         with allure.step("Проверить статус код 200"):
             assert response.status_code == 200
 
-        with allure.step("Проверить структуру ответа"):
+        with allure.step("Проверить ответ по контракту GET /products/{id}/review"):
+            validate_response("GET", "/products/{id}/review", response)
             data = response.json()
-            assert "reviews" in data
-            assert "total" in data
-            assert isinstance(data["reviews"], list)
 
         allure.attach(f"Total reviews: {data['total']}", name="Reviews Count",
                       attachment_type=allure.attachment_type.TEXT)
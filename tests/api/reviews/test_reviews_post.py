@@ -10,11 +10,10 @@ class TestReviewsPost:
     @allure.story("Создание отзыва")
     @allure.description("Проверка успешного создания отзыва")
     @allure.tag("reviews", "post", "positive")
-    def test_create_review_success(self, auth_client, sample_review):
+    def test_create_review_success(self, auth_client, pooled_product, sample_review):
         """POST /products/{id}/review - успешное создание отзыва"""
-        with allure.step("Получить ID существующего товара"):
-            products_response = auth_client.get_products()
-            product_id = products_response.json()["products"][0]["id"]
+        with allure.step("Взять товар из пула"):
+            product_id = pooled_product.id
 
         with allure.step("Выполнить запрос на создание отзыва"):
             response = auth_client.create_review(product_id, sample_review)
@@ -32,11 +31,10 @@ class TestReviewsPost:
     @allure.story("Валидация рейтинга")
     @allure.description("Проверка ошибки при невалидном рейтинге (больше 5)")
     @allure.tag("reviews", "post", "negative", "validation")
-    def test_create_review_invalid_rating(self, auth_client):
+    def test_create_review_invalid_rating(self, auth_client, pooled_product):
         """POST /products/{id}/review - невалидный рейтинг"""
-        with allure.step("Получить ID существующего товара"):
-            products_response = auth_client.get_products()
-            product_id = products_response.json()["products"][0]["id"]
+        with allure.step("Взять товар из пула"):
+            product_id = pooled_product.id
 
         with allure.step("Подготовить отзыв с рейтингом 6"):
             invalid_review = {
@@ -58,11 +56,10 @@ class TestReviewsPost:
     @allure.story("Валидация рейтинга")
     @allure.description("Проверка ошибки при невалидном рейтинге (меньше 1)")
     @allure.tag("reviews", "post", "negative", "validation")
-    def test_create_review_invalid_rating_low(self, auth_client):
+    def test_create_review_invalid_rating_low(self, auth_client, pooled_product):
         """POST /products/{id}/review - рейтинг меньше 1"""
-        with allure.step("Получить ID существующего товара"):
-            products_response = auth_client.get_products()
-            product_id = products_response.json()["products"][0]["id"]
+        with allure.step("Взять товар из пула"):
+            product_id = pooled_product.id
 
         with allure.step("Подготовить отзыв с рейтингом 0"):
             invalid_review = {
@@ -83,11 +80,10 @@ class TestReviewsPost:
     @allure.story("Валидация данных")
     @allure.description("Проверка ошибки при отсутствии комментария")
     @allure.tag("reviews", "post", "negative", "validation")
-    def test_create_review_missing_comment(self, auth_client):
+    def test_create_review_missing_comment(self, auth_client, pooled_product):
         """POST /products/{id}/review - отсутствует комментарий"""
-        with allure.step("Получить ID существующего товара"):
-            products_response = auth_client.get_products()
-            product_id = products_response.json()["products"][0]["id"]
+        with allure.step("Взять товар из пула"):
+            product_id = pooled_product.id
 
         with allure.step("Подготовить отзыв без комментария"):
             invalid_review = {
@@ -108,11 +104,10 @@ class TestReviewsPost:
     @allure.story("Валидация данных")
     @allure.description("Проверка ошибки при пустом комментарии")
     @allure.tag("reviews", "post", "negative", "validation")
-    def test_create_review_empty_comment(self, auth_client):
+    def test_create_review_empty_comment(self, auth_client, pooled_product):
         """POST /products/{id}/review - пустой комментарий"""
-        with allure.step("Получить ID существующего товара"):
-            products_response = auth_client.get_products()
-            product_id = products_response.json()["products"][0]["id"]
+        with allure.step("Взять товар из пула"):
+            product_id = pooled_product.id
 
         with allure.step("Подготовить отзыв с пустым комментарием"):
             invalid_review = {
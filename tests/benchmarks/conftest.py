@@ -0,0 +1,69 @@
+import pytest
+from config.environment import Environment
+from src.api.auth import TokenBroker
+from src.api.client import ApiClient
+from src.api.metrics import LatencyCollector
+from src.api.transport import Transport
+from src.fake.server import FakeStoreServer
+from tests.api.conftest import generate_unique_product_name
+
+
+def unwrap_fixture(fixture):
+    """Исходная функция фикстуры из conftest (pytest запрещает вызывать фикстуры напрямую)"""
+    return fixture.__wrapped__
+
+
+def new_product_data():
+    return {
+        "name": generate_unique_product_name(),
+        "description": "Benchmark product",
+        "price": 99.99,
+        "category": "Electronics",
+        "stock": 10
+    }
+
+
+@pytest.fixture
+def bench_server():
+    """Свежий локальный fake API на каждый бенчмарк, чтобы каталог не рос между ними"""
+    with FakeStoreServer() as server:
+        yield server
+
+
+@pytest.fixture
+def bench_transport():
+    transport = Transport()
+    yield transport
+    transport.close()
+
+
+@pytest.fixture
+def bench_client(bench_server, bench_transport):
+    """Авторизованный ApiClient против локального fake API"""
+    client = ApiClient(base_url=bench_server.api_url, transport=bench_transport)
+    client.login(Environment.TEST_USER["username"], Environment.TEST_USER["password"])
+    return client
+
+
+@pytest.fixture
+def bench_product_id(bench_client):
+    """ID товара, созданного для бенчмарка"""
+    return bench_client.create_product(new_product_data()).json()["product"]["id"]
+
+
+@pytest.fixture
+def bench_token_broker(bench_server, bench_transport, tmp_path):
+    login_client = ApiClient(base_url=bench_server.api_url, transport=bench_transport)
+    return TokenBroker(
+        login=lambda: login_client.login(
+            Environment.TEST_USER["username"],
+            Environment.TEST_USER["password"]
+        ),
+        cache_dir=tmp_path,
+        key=f"{login_client.base_url}|{Environment.TEST_USER['username']}"
+    )
+
+
+@pytest.fixture
+def bench_collector():
+    return LatencyCollector()
@@ -0,0 +1,101 @@
+import itertools
+
+import pytest
+from config.environment import Environment
+from tests.benchmarks.conftest import new_product_data
+
+pytestmark = pytest.mark.benchmark(group="api-client", max_time=0.5)
+
+
+class TestClientReadBenchmarks:
+
+    def test_get_products(self, benchmark, bench_client):
+        response = benchmark(bench_client.get_products)
+        assert response.status_code == 200
+
+    def test_get_products_filtered(self, benchmark, bench_client):
+        response = benchmark(bench_client.get_products, {"category": "Electronics", "minPrice": 50})
+        assert response.status_code == 200
+
+    def test_iter_products(self, benchmark, bench_client):
+        products = benchmark(lambda: list(bench_client.iter_products(page_size=5)))
+        assert products
+
+    def test_get_product(self, benchmark, bench_client, bench_product_id):
+        response = benchmark(bench_client.get_product, bench_product_id)
+        assert response.status_code == 200
+
+    def test_get_categories(self, benchmark, bench_client):
+        response = benchmark(bench_client.get_categories)
+        assert response.status_code == 200
+
+    def test_get_reviews(self, benchmark, bench_client, bench_product_id):
+        response = benchmark(bench_client.get_reviews, bench_product_id)
+        assert response.status_code == 200
+
+
+class TestClientWriteBenchmarks:
+
+    def test_login(self, benchmark, bench_client):
+        response = benchmark(bench_client.login, Environment.TEST_USER["username"], Environment.TEST_USER["password"])
+        assert response.status_code == 200
+
+    def test_register(self, benchmark, bench_client):
+        counter = itertools.count()
+
+        def register():
+            index = next(counter)
+            return bench_client.register({
+                "username": f"bench_user_{index}",
+                "email": f"bench_user_{index}@example.com",
+                "password": "password123"
+            })
+
+        response = benchmark(register)
+        assert response.status_code == 201
+
+    def test_create_product(self, benchmark, bench_client):
+        response = benchmark(lambda: bench_client.create_product(new_product_data()))
+        assert response.status_code == 201
+
+    def test_update_product_put(self, benchmark, bench_client, bench_product_id):
+        response = benchmark(lambda: bench_client.update_product(bench_product_id, new_product_data(), method="PUT"))
+        assert response.status_code == 200
+
+    def test_update_product_patch(self, benchmark, bench_client, bench_product_id):
+        response = benchmark(bench_client.update_product, bench_product_id, {"price": 10.0}, method="PATCH")
+        assert response.status_code == 200
+
+    def test_delete_product(self, benchmark, bench_client):
+        def setup():
+            return (bench_client.create_product(new_product_data()).json()["product"]["id"],), {}
+
+        response = benchmark.pedantic(bench_client.delete_product, setup=setup, rounds=50)
+        assert response.status_code == 200
+
+    def test_create_review(self, benchmark, bench_client, bench_product_id):
+        review = {"rating": 4, "comment": "Benchmark review", "author": "Bench"}
+        response = benchmark(bench_client.create_review, bench_product_id, review)
+        assert response.status_code == 201
+
+
+@pytest.mark.benchmark(group="api-client-bulk", max_time=0.5)
+class TestClientBulkBenchmarks:
+
+    def test_create_products(self, benchmark, bench_client):
+        results = benchmark(lambda: bench_client.create_products([new_product_data() for _ in range(10)]))
+        assert all(result.ok for result in results)
+
+    def test_update_products(self, benchmark, bench_client):
+        ids = [r.response.json()["product"]["id"] for r in bench_client.create_products(
+            [new_product_data() for _ in range(10)])]
+        results = benchmark(bench_client.update_products, [(pid, {"stock": 1}) for pid in ids], method="PATCH")
+        assert all(result.ok for result in results)
+
+    def test_delete_products(self, benchmark, bench_client):
+        def setup():
+            results = bench_client.create_products([new_product_data() for _ in range(10)])
+            return ([r.response.json()["product"]["id"] for r in results],), {}
+
+        results = benchmark.pedantic(bench_client.delete_products, setup=setup, rounds=20)
+        assert all(result.ok for result in results)
@@ -0,0 +1,29 @@
+import jsonschema
+import pytest
+from src.api.contracts import SCHEMAS, find_validator
+from src.fake.store import SEED_PRODUCTS
+
+pytestmark = pytest.mark.benchmark(group="contracts", max_time=0.5)
+
+CATALOG_SCHEMA = SCHEMAS[("GET", "/products")][200]
+CATALOG = {
+    "products": [dict(SEED_PRODUCTS[i % len(SEED_PRODUCTS)], id=str(i)) for i in range(50)],
+    "total": 50
+}
+
+
+class TestContractBenchmarks:
+
+    def test_compiled_validator(self, benchmark):
+        """Скомпилированная при импорте схема fastjsonschema - как проверяет ApiClient"""
+        validator = find_validator("GET", "/products", 200)
+        benchmark(validator, CATALOG)
+
+    def test_prepared_jsonschema_validator(self, benchmark):
+        """jsonschema с заранее созданным валидатором: без компиляции, но без разбора схемы на каждый вызов"""
+        validator = jsonschema.Draft7Validator(CATALOG_SCHEMA)
+        benchmark(validator.validate, CATALOG)
+
+    def test_uncompiled_validator(self, benchmark):
+        """jsonschema.validate: проверка схемы и создание валидатора на каждый ответ"""
+        benchmark(jsonschema.validate, CATALOG, CATALOG_SCHEMA)
@@ -0,0 +1,83 @@
+import pytest
+from src.api.resolver import ProductIndex
+from tests.api import conftest as api_conftest
+from tests.benchmarks.conftest import new_product_data, unwrap_fixture
+
+pytestmark = pytest.mark.benchmark(group="fixtures", max_time=0.5)
+
+
+class _CreateResponse:
+    """Ответ создания товара без ID, чтобы пройти по ветке поиска extract_product_id"""
+
+    def json(self):
+        return {"message": "Product created"}
+
+
+def _client_fixture_args(server, transport, collector):
+    """Аргументы фикстур api_client / auth_client, необязательные компоненты выключены"""
+    return dict(
+        api_base_url=server.api_url,
+        api_transport=transport,
+        api_cache=None,
+        api_cassette=None,
+        api_coalesce=None,
+        api_limiter=None,
+        api_breaker=None,
+        api_ledger=None,
+        product_index=None,
+        api_contracts=None,
+        latency_collector=collector
+    )
+
+
+class TestFixtureBenchmarks:
+
+    def test_api_client_fixture(self, benchmark, bench_server, bench_transport, bench_collector):
+        make_client = unwrap_fixture(api_conftest.api_client)
+        client = benchmark(make_client, **_client_fixture_args(bench_server, bench_transport, bench_collector))
+        assert client.token is None
+
+    def test_auth_client_fixture(self, benchmark, bench_server, bench_transport, bench_token_broker,
+                                 bench_collector):
+        make_client = unwrap_fixture(api_conftest.auth_client)
+        client = benchmark(
+            make_client,
+            token_broker=bench_token_broker,
+            **_client_fixture_args(bench_server, bench_transport, bench_collector)
+        )
+        assert client.token is not None
+        assert bench_token_broker.logins == 1
+
+    def test_sample_product_fixture(self, benchmark):
+        product = benchmark(unwrap_fixture(api_conftest.sample_product))
+        assert product["name"].startswith("Test Product ")
+
+    def test_sample_product_create(self, benchmark, bench_client):
+        """Типичная подготовка теста: sample_product + create_product + extract_product_id"""
+        make_product = unwrap_fixture(api_conftest.sample_product)
+
+        def create():
+            product = make_product()
+            response = bench_client.create_product(product)
+            return api_conftest.extract_product_id(response, product["name"], bench_client)
+
+        assert benchmark(create)
+
+    def test_extract_product_id_fast_path(self, benchmark, bench_client):
+        product = new_product_data()
+        response = bench_client.create_product(product)
+        product_id = benchmark(api_conftest.extract_product_id, response, product["name"], bench_client)
+        assert product_id == response.json()["product"]["id"]
+
+    def test_extract_product_id_index_hit(self, benchmark, bench_client):
+        bench_client.product_index = ProductIndex()
+        product = new_product_data()
+        created = bench_client.create_product(product).json()["product"]
+        product_id = benchmark(api_conftest.extract_product_id, _CreateResponse(), product["name"], bench_client)
+        assert product_id == created["id"]
+
+    def test_extract_product_id_search(self, benchmark, bench_client):
+        product = new_product_data()
+        created = bench_client.create_product(product).json()["product"]
+        product_id = benchmark(api_conftest.extract_product_id, _CreateResponse(), product["name"], bench_client)
+        assert product_id == created["id"]
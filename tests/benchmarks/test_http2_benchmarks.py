@@ -0,0 +1,45 @@
+import pytest
+from src.api.http2 import Http2Transport
+from src.api.transport import Transport
+from src.fake.asgi import Http2FakeStoreServer
+from src.load.runner import LoadRunner
+from src.load.scenarios import product_lifecycle
+
+USERS = 16
+ITERATIONS = 64
+
+pytestmark = pytest.mark.benchmark(group="http1-vs-http2", max_time=2.0)
+
+
+@pytest.fixture(scope="module")
+def h2_server():
+    """Один сервер для обоих протоколов: Hypercorn принимает HTTP/1.1 и h2c на одном порту"""
+    with Http2FakeStoreServer() as server:
+        yield server
+
+
+@pytest.fixture(params=["http1.1-pooled", "http2"])
+def workflow_transport(request):
+    if request.param == "http2":
+        transport = Http2Transport(prior_knowledge=True, max_connections=USERS)
+    else:
+        transport = Transport(pool_maxsize=USERS)
+    yield transport
+    transport.close()
+
+
+def test_product_lifecycle_throughput(benchmark, h2_server, workflow_transport):
+    """64 итерации create -> get -> PATCH -> PUT -> review -> reviews -> delete на 16 пользователях"""
+    reports = []
+
+    def run():
+        runner = LoadRunner(product_lifecycle, users=USERS, duration=60, base_url=h2_server.api_url,
+                            transport=workflow_transport, max_iterations=ITERATIONS)
+        reports.append(runner.run())
+
+    benchmark.pedantic(run, rounds=5, warmup_rounds=1)
+
+    assert all(report.failed_iterations == 0 for report in reports)
+    benchmark.extra_info["requests_per_round"] = reports[-1].total_requests
+    benchmark.extra_info["rps"] = round(sum(r.total_requests for r in reports) / sum(r.elapsed for r in reports), 1)
+    benchmark.extra_info["connections"] = workflow_transport.stats.snapshot()["new_connections"]
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+import requests
+from src.api.streaming import iter_json_items
+from src.fake.store import SEED_PRODUCTS
+from tests.benchmarks.conftest import new_product_data
+
+pytestmark = pytest.mark.benchmark(group="json", max_time=0.5)
+
+PRODUCT = new_product_data()
+CATALOG = {
+    "products": [dict(SEED_PRODUCTS[i % len(SEED_PRODUCTS)], id=str(i)) for i in range(500)],
+    "total": 500
+}
+CATALOG_BYTES = json.dumps(CATALOG).encode()
+
+
+def _response(content):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    response.encoding = "utf-8"
+    return response
+
+
+class TestJsonBenchmarks:
+
+    def test_encode_product(self, benchmark):
+        assert benchmark(json.dumps, PRODUCT)
+
+    def test_decode_product(self, benchmark):
+        encoded = json.dumps({"message": "Product created", "product": PRODUCT})
+        assert benchmark(json.loads, encoded)["product"] == PRODUCT
+
+    def test_encode_catalog(self, benchmark):
+        assert benchmark(json.dumps, CATALOG)
+
+    def test_decode_catalog_response(self, benchmark):
+        """Response.json() - как тесты читают список товаров"""
+        response = _response(CATALOG_BYTES)
+        assert len(benchmark(response.json)["products"]) == 500
+
+    def test_stream_decode_catalog(self, benchmark):
+        """iter_json_items - как iter_products разбирает тот же ответ чанками"""
+        chunks = [CATALOG_BYTES[i:i + 8192] for i in range(0, len(CATALOG_BYTES), 8192)]
+        products = benchmark(lambda: list(iter_json_items(iter(chunks), "products")))
+        assert len(products) == 500
@@ -0,0 +1,148 @@
+import requests
+from config.environment import Environment
+from src.api.client import ApiClient
+from src.api.ledger import ResourceLedger, purge_leftovers
+from src.api.transport import Transport
+
+pytest_plugins = ["src.plugins.durations", "src.plugins.sharding", "src.plugins.impact", "src.plugins.flaky",
+                  "src.plugins.attachments"]
+
+
+def pytest_addoption(parser):
+    """Общие опции запуска тестов"""
+    group = parser.getgroup("api", "Настройки API клиента")
+    group.addoption(
+        "--fake-api",
+        action="store_true",
+        default=False,
+        help="Запускать API тесты против локального in-process FakeStore вместо Environment.API_URL"
+    )
+    group.addoption(
+        "--api-record",
+        metavar="PATH",
+        default=None,
+        help="Записать HTTP трафик ApiClient в кассету PATH"
+    )
+    group.addoption(
+        "--api-replay",
+        metavar="PATH",
+        default=None,
+        help="Воспроизвести HTTP трафик ApiClient из кассеты PATH без сети"
+    )
+    group.addoption(
+        "--api-cache",
+        action="store_true",
+        default=False,
+        help="Включить кэш GET ответов ApiClient (TTL + ревалидация по ETag)"
+    )
+    group.addoption(
+        "--api-cache-ttl",
+        type=float,
+        default=30.0,
+        help="TTL записей кэша ответов в секундах"
+    )
+    group.addoption(
+        "--api-coalesce",
+        action="store_true",
+        default=False,
+        help="Объединять одинаковые одновременные GET запросы ApiClient в один"
+    )
+    group.addoption(
+        "--api-http2",
+        action="store_true",
+        default=False,
+        help="Использовать HTTP/2 транспорт (httpx) в ApiClient; с --fake-api fake API запускается под Hypercorn"
+    )
+    group.addoption(
+        "--api-limiter",
+        action="store_true",
+        default=False,
+        help="Адаптивно ограничивать число одновременных запросов ApiClient (AIMD, Retry-After)"
+    )
+    group.addoption(
+        "--api-limiter-max",
+        type=int,
+        default=64,
+        help="Верхняя граница адаптивного лимита одновременных запросов"
+    )
+    group.addoption(
+        "--api-breaker-threshold",
+        type=int,
+        default=3,
+        help="Сколько сетевых сбоев подряд размыкают предохранитель API (0 - выключить)"
+    )
+    group.addoption(
+        "--api-breaker-reset",
+        type=float,
+        default=30.0,
+        help="Через сколько секунд разомкнутый предохранитель пропускает пробный запрос"
+    )
+    group.addoption(
+        "--api-pool-size",
+        type=int,
+        default=3,
+        help="Сколько товаров заранее создает пул product_pool в каждом воркере"
+    )
+    group.addoption(
+        "--api-fuzz-cases",
+        type=int,
+        default=None,
+        help="Сколько сгенерированных запросов отправляет тест фаззинга валидации "
+             "(по умолчанию 210 на локальном fake API, 30 с --api-fuzz-live)"
+    )
+    group.addoption(
+        "--api-fuzz-live",
+        action="store_true",
+        default=False,
+        help="Фаззить настроенное окружение (Environment.API_URL), а не локальный fake API"
+    )
+    group.addoption(
+        "--validate-contracts",
+        action="store_true",
+        default=False,
+        help="Проверять каждый ответ ApiClient по JSON схеме эндпоинта (src/api/contracts.py)"
+    )
+    group.addoption(
+        "--api-keep-created",
+        action="store_true",
+        default=False,
+        help="Не удалять в конце сессии товары, созданные тестами и оставшиеся в каталоге"
+    )
+
+
+def api_ledger_dir(config):
+    """Каталог журналов ResourceLedger, общий для контроллера и воркеров одного запуска xdist"""
+    basetemp = config._tmp_path_factory.getbasetemp()
+    # basetemp воркера - подкаталог basetemp контроллера
+    return basetemp.parent if hasattr(config, "workerinput") else basetemp
+
+
+def pytest_sessionfinish(session):
+    """Контроллер пакетно удаляет товары, которые тесты создали и не удалили"""
+    config = session.config
+    if hasattr(config, "workerinput") or config.getoption("--api-keep-created"):
+        return
+    # Fake API к этому моменту уже остановлен, товары из кассеты в каталоге не существуют
+    if config.getoption("--fake-api") or config.getoption("--api-replay"):
+        return
+    directory = api_ledger_dir(config)
+    leftovers = ResourceLedger.live_ids(directory)
+    if not leftovers:
+        return
+
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    client = ApiClient(transport=Transport())
+    try:
+        response = client.login(Environment.TEST_USER["username"], Environment.TEST_USER["password"])
+        if response.status_code != 200:
+            raise requests.HTTPError(f"login failed with status {response.status_code}")
+        results = purge_leftovers(client, directory)
+    except requests.RequestException as e:
+        message = f"API cleanup: {len(leftovers)} created products left in the catalog ({e})"
+    else:
+        deleted = sum(1 for r in results if r.response is not None and r.response.status_code in (200, 404))
+        message = f"API cleanup: deleted {deleted} of {len(leftovers)} products left by tests"
+    finally:
+        client.transport.close()
+    if reporter is not None:
+        reporter.write_line(message)
@@ -0,0 +1,97 @@
+import glob
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+import allure
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SAMPLE_TESTS = textwrap.dedent("""
+    import allure
+    import pytest
+
+    BROWSER_INFO = "Browser: Chromium\\nViewport: 1920x1080"
+
+
+    @pytest.fixture
+    def page():
+        allure.attach(BROWSER_INFO, name="Browser Info", attachment_type=allure.attachment_type.TEXT)
+        return object()
+
+
+    @pytest.mark.parametrize("case", range(5))
+    def test_page(page, case, tmp_path):
+        with allure.step("Навигация"):
+            allure.attach("Navigated", name="Navigation", attachment_type=allure.attachment_type.TEXT)
+        screenshot = tmp_path / "screenshot.png"
+        screenshot.write_bytes(b"png" * 100)
+        allure.attach.file(str(screenshot), name="Screenshot", attachment_type=allure.attachment_type.PNG)
+        allure.attach(f"case {case}", name="Case", attachment_type=allure.attachment_type.TEXT)
+""")
+
+
+def _run_pytest(directory, *args):
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "src.plugins.attachments", "-p", "no:cacheprovider", "-q",
+         "--alluredir", str(directory / "results"), "--clean-alluredir", *args, str(directory / "test_sample.py")],
+        cwd=directory, env=env, capture_output=True, text=True, timeout=120
+    )
+
+
+def _sources(results_dir):
+    """Все ссылки на вложения из результатов и контейнеров Allure"""
+    sources = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            sources.extend(attachment["source"] for attachment in node.get("attachments", []))
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    for path in glob.glob(os.path.join(results_dir, "*-result.json")) + \
+            glob.glob(os.path.join(results_dir, "*-container.json")):
+        with open(path, encoding="utf-8") as f:
+            walk(json.load(f))
+    return sources
+
+
+@pytest.mark.plugins
+@allure.feature("Plugins - Allure Attachments")
+@allure.severity(allure.severity_level.NORMAL)
+class TestAttachmentStore:
+
+    @allure.story("Дедупликация вложений")
+    @allure.description("Одинаковые вложения пишутся в allure-results один раз, результаты ссылаются на общий файл")
+    @allure.tag("allure", "attachments")
+    def test_identical_attachments_are_stored_once(self, tmp_path):
+        """Вложенный запуск pytest с повторяющимися вложениями, с дедупликацией и без"""
+        (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+        results_dir = str(tmp_path / "results")
+
+        with allure.step("Запуск с дедупликацией"):
+            result = _run_pytest(tmp_path)
+            allure.attach(result.stdout, name="Pytest Output", attachment_type=allure.attachment_type.TEXT)
+            assert result.returncode == 0, result.stdout
+            assert "allure: 20 attachments stored as 8 unique files" in result.stdout
+
+        with allure.step("Все ссылки ведут на существующие файлы по содержимому"):
+            sources = _sources(results_dir)
+            files = glob.glob(os.path.join(results_dir, "*-attachment.*"))
+            assert len(sources) == 20
+            assert len(set(sources)) == len(files) == 8
+            assert all(os.path.exists(os.path.join(results_dir, source)) for source in sources)
+            assert not glob.glob(os.path.join(results_dir, "*.tmp"))
+
+        with allure.step("С --allure-no-dedup каждое вложение - отдельный файл"):
+            result = _run_pytest(tmp_path, "--allure-no-dedup")
+            assert result.returncode == 0, result.stdout
+            assert len(glob.glob(os.path.join(results_dir, "*-attachment.*"))) == 20
+            assert len(set(_sources(results_dir))) == 20
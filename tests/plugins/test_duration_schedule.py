@@ -0,0 +1,105 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+import allure
+from src.plugins.durations import DurationHistory, lpt_assign, plan_units, split_group
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SAMPLE_TESTS = textwrap.dedent("""
+    import os
+    import time
+
+    import pytest
+
+
+    def _record(name):
+        with open(os.path.join(os.path.dirname(__file__), "workers.log"), "a") as f:
+            f.write(f"{name} {os.environ.get('PYTEST_XDIST_WORKER', 'main')}\\n")
+
+
+    @pytest.mark.parametrize("seconds", [0.6, 0.1, 0.1, 0.1, 0.1, 0.1])
+    def test_sleep(seconds):
+        time.sleep(seconds)
+
+
+    @pytest.mark.xdist_group("shared")
+    def test_group_first():
+        _record("first")
+
+
+    @pytest.mark.xdist_group("shared")
+    def test_group_second():
+        _record("second")
+""")
+
+
+def _run_pytest(directory, *args):
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "src.plugins.durations", "-p", "no:cacheprovider",
+         "-q", "-n", "2", "--duration-schedule", "--durations-path", str(directory / "durations.json"),
+         *args, str(directory)],
+        cwd=directory, env=env, capture_output=True, text=True, timeout=120
+    )
+
+
+@pytest.mark.plugins
+@allure.feature("Plugins - Duration Schedule")
+@allure.severity(allure.severity_level.NORMAL)
+class TestDurationSchedule:
+
+    @allure.story("Планирование по длительности")
+    @allure.description("LPT дает меньшее общее время, чем равное число тестов на воркер; группа - одна единица")
+    @allure.tag("xdist", "durations")
+    def test_longest_first_plan(self, tmp_path):
+        """plan_units + lpt_assign на известных длительностях"""
+        with allure.step("LPT против раздачи поровну по числу тестов"):
+            costs = [5, 1, 1, 1, 1, 1]
+            _, loads = lpt_assign(costs, 2)
+            assert max(loads) == 5
+            assert max(sum(costs[:3]), sum(costs[3:])) == 7
+
+        with allure.step("Группа xdist_group планируется одной единицей"):
+            nodeids = ["t.py::a", "t.py::b@db", "t.py::c[x@y.z]", "t.py::d@db"]
+            assert split_group("t.py::c[x@y.z]") == ("t.py::c[x@y.z]", None)
+            units = plan_units(nodeids, [1.0, 2.0, 0.5, 2.0])
+            assert units == [(4.0, [1, 3]), (1.0, [0]), (0.5, [2])]
+
+        with allure.step("Тесты без истории получают медиану своего файла"):
+            history = DurationHistory(str(tmp_path / "durations.json"))
+            history.update({"a.py::one": 2.0, "a.py::two": 4.0, "b.py::one": 10.0})
+            history.update({"a.py::one": 4.0})
+            history.save()
+            reloaded = DurationHistory(history.path)
+            assert reloaded.estimate(["a.py::one", "a.py::new@g", "c.py::new"]) == [3.0, 3.5, 4.0]
+
+    @allure.story("Планировщик xdist")
+    @allure.description("Запуск с -n 2: история пишется без суффикса группы и используется следующим запуском")
+    @allure.tag("xdist", "durations")
+    def test_xdist_run_records_and_uses_history(self, tmp_path):
+        """Два запуска pytest -n 2 --duration-schedule во вложенном процессе"""
+        (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+
+        with allure.step("Первый запуск без истории"):
+            result = _run_pytest(tmp_path)
+            allure.attach(result.stdout, name="First Run", attachment_type=allure.attachment_type.TEXT)
+            assert result.returncode == 0, result.stdout + result.stderr
+            assert "8 tests in 7 units, 0 with history" in result.stdout
+            durations = json.loads((tmp_path / "durations.json").read_text(encoding="utf-8"))
+            assert "test_sample.py::test_group_first" in durations
+            assert durations["test_sample.py::test_sleep[0.6]"] >= 0.6
+
+        with allure.step("Группа выполнена на одном воркере"):
+            workers = {line.split()[1] for line in (tmp_path / "workers.log").read_text().splitlines()}
+            assert len(workers) == 1
+
+        with allure.step("Второй запуск берет длительности из истории"):
+            result = _run_pytest(tmp_path)
+            allure.attach(result.stdout, name="Second Run", attachment_type=allure.attachment_type.TEXT)
+            assert result.returncode == 0, result.stdout + result.stderr
+            assert "8 tests in 7 units, 8 with history" in result.stdout
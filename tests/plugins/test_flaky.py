@@ -0,0 +1,135 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+import allure
+from src.plugins.flaky import FlakyHistory, flakiness, main
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SAMPLE_TESTS = textwrap.dedent("""
+    import itertools
+
+    import pytest
+
+    calls = itertools.count()
+    setups = []
+
+
+    @pytest.fixture(scope="module")
+    def expensive():
+        setups.append(1)
+        return object()
+
+
+    @pytest.fixture
+    def per_test():
+        return []
+
+
+    def test_flaky(expensive, per_test):
+        per_test.append(1)
+        assert len(per_test) == 1
+        assert len(setups) == 1
+        assert next(calls) % 2 == 1
+
+
+    def test_stable():
+        pass
+
+
+    def test_broken():
+        assert False
+""")
+
+
+def _run_pytest(directory, *args):
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "src.plugins.flaky", "-p", "no:cacheprovider", "-q", "-rA",
+         "--flaky-history", str(directory / "flaky.json"), *args, str(directory)],
+        cwd=directory, env=env, capture_output=True, text=True, timeout=120
+    )
+
+
+@pytest.mark.plugins
+@allure.feature("Plugins - Flaky Tests")
+@allure.severity(allure.severity_level.NORMAL)
+class TestFlaky:
+
+    @allure.story("Оценка нестабильности")
+    @allure.description("Перезапуски и смены pass/fail повышают оценку, стабильное падение - нет")
+    @allure.tag("flaky", "quarantine")
+    def test_flakiness_score_and_quarantine(self, tmp_path):
+        """flakiness и FlakyHistory.quarantined"""
+        with allure.step("Оценки типичных историй"):
+            assert flakiness("ppppp") == 0
+            assert flakiness("fffff") == 0
+            assert flakiness("pfpfp") == 0.8
+            assert flakiness("pprpp") == 0.2
+
+        with allure.step("В карантин попадают нестабильные тесты с достаточной историей"):
+            history = FlakyHistory(str(tmp_path / "flaky.json"))
+            history.record({"a": "p", "b": "r", "c": "f"})
+            for _ in range(4):
+                history.record({"a": "p", "b": "r", "c": "f", "d": "r"})
+            assert history.quarantined(threshold=0.2, min_runs=5) == {"b": 1.0}
+
+        with allure.step("Исходы полосы карантина заменяют отметки q основной полосы"):
+            for _ in range(15):
+                history.record({"b": "q"})
+                history.merge_lane({"b": "p"})
+            assert history.outcomes["b"] == "rrrrr" + "p" * 15
+            assert history.quarantined(threshold=0.2, min_runs=5) == {"b": 0.25}
+            for _ in range(2):
+                history.record({"b": "q"})
+                history.merge_lane({"b": "p"})
+            assert history.quarantined(threshold=0.2, min_runs=5) == {}
+
+        with allure.step("Без полосы карантина отметки q только разбавляют окно"):
+            for _ in range(30):
+                history.record({"d": "q"})
+            assert history.outcomes["d"] == "q" * 20
+            assert "d" not in history.quarantined(threshold=0.2, min_runs=5)
+
+        with allure.step("Объединение файлов из командной строки"):
+            history.save()
+            results_path = tmp_path / "lane.json"
+            results_path.write_text(json.dumps({"c": "p"}), encoding="utf-8")
+            main([str(tmp_path / "flaky.json"), str(results_path)])
+            assert FlakyHistory(str(tmp_path / "flaky.json")).outcomes["c"] == "fffffp"
+
+    @allure.story("Перезапуск и полосы карантина")
+    @allure.description("Упавший тест перезапускается с теми же фикстурами модуля, затем уходит в карантин")
+    @allure.tag("flaky", "quarantine", "rerun")
+    def test_rerun_and_quarantine_lanes(self, tmp_path):
+        """--flaky-reruns, затем --quarantine exclude / only во вложенном процессе"""
+        (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+
+        with allure.step("Перезапуск: фикстура модуля та же, фикстура теста новая"):
+            for _ in range(5):
+                result = _run_pytest(tmp_path, "--flaky-reruns", "2")
+                assert "PASSED test_sample.py::test_flaky" in result.stdout, result.stdout
+            allure.attach(result.stdout, name="Rerun Output", attachment_type=allure.attachment_type.TEXT)
+            assert "flaky rerun: attempt 1 call failed" in result.stdout
+            history = json.loads((tmp_path / "flaky.json").read_text(encoding="utf-8"))
+            assert history["test_sample.py::test_flaky"] == "rrrrr"
+            assert history["test_sample.py::test_broken"] == "fffff"
+
+        with allure.step("Основная полоса без тестов в карантине"):
+            result = _run_pytest(tmp_path, "--flaky-reruns", "2", "--quarantine", "exclude")
+            assert "test_flaky" not in result.stdout.split("flaky: quarantine")[0]
+            assert "1 passed, 1 deselected" in result.stdout
+
+        with allure.step("Полоса карантина запускает только их и пишет исходы запуска"):
+            result = _run_pytest(tmp_path, "--flaky-reruns", "2", "--quarantine", "only",
+                                 "--flaky-results", str(tmp_path / "lane.json"))
+            assert result.returncode == 0, result.stdout
+            assert "1 passed, 2 deselected" in result.stdout
+            history = json.loads((tmp_path / "flaky.json").read_text(encoding="utf-8"))
+            assert history["test_sample.py::test_flaky"] == "rrrrrqr"
+            lane = json.loads((tmp_path / "lane.json").read_text(encoding="utf-8"))
+            assert lane == {"test_sample.py::test_flaky": "r"}
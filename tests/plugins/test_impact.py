@@ -0,0 +1,137 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+import allure
+from src.plugins.impact import parse_diff, select_tests
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MODULE = textwrap.dedent("""
+    LIMIT = 10
+
+
+    class Catalog:
+        def names(self):
+            return ["a", "b"]
+
+        def count(self):
+            return len(self.names())
+
+
+    def total(values):
+        return sum(values)
+""")
+
+SAMPLE_TESTS = textwrap.dedent("""
+    from shop import Catalog, total
+
+
+    def test_count():
+        assert Catalog().count() == 2
+
+
+    def test_total():
+        assert total([1, 2]) == 3
+""")
+
+DIFF = textwrap.dedent("""
+    diff --git a/shop.py b/shop.py
+    --- a/shop.py
+    +++ b/shop.py
+    @@ -13,0 +14 @@ def total(values):
+    +    # comment
+    @@ -20 +19,0 @@ def total(values):
+    -    pass
+    diff --git a/old.py b/old.py
+    --- a/old.py
+    +++ /dev/null
+    @@ -1,2 +0,0 @@
+""")
+
+
+def _git(directory, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=directory, check=True, capture_output=True)
+
+
+def _run_pytest(directory, *args):
+    env = dict(os.environ, PYTHONPATH=f"{PROJECT_ROOT}{os.pathsep}{directory}")
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "src.plugins.impact", "-p", "no:cacheprovider", "-q", "-rA",
+         "--impact-map", str(directory / "impact.json"), *args],
+        cwd=directory, env=env, capture_output=True, text=True, timeout=120
+    )
+
+
+@pytest.mark.plugins
+@allure.feature("Plugins - Test Impact")
+@allure.severity(allure.severity_level.NORMAL)
+class TestImpact:
+
+    @allure.story("Выбор тестов по diff")
+    @allure.description("Изменение функции выбирает ее тесты, изменение модуля - все тесты файла")
+    @allure.tag("impact", "git")
+    def test_select_by_changed_functions(self):
+        """parse_diff + select_tests на заданной карте"""
+        impact = {
+            "t.py::test_count": {"shop.py::Catalog.count", "shop.py::Catalog.names"},
+            "t.py::test_total": {"shop.py::total"},
+        }
+        nodeids = list(impact) + ["t.py::test_new"]
+
+        with allure.step("Разбор diff: строки нового файла и удаленный файл"):
+            changes = parse_diff(DIFF)
+            assert changes == {"shop.py": {14, 19, 20}, "old.py": None}
+
+        with allure.step("Изменен метод - только его тесты и тесты без карты"):
+            selected, reason = select_tests(nodeids, impact, {"shop.py": {7}}, {"shop.py": MODULE})
+            assert reason is None
+            assert selected == ["t.py::test_count", "t.py::test_new"]
+
+        with allure.step("Изменен код модуля - все тесты, использующие файл"):
+            selected, _ = select_tests(nodeids, impact, {"shop.py": {2}}, {"shop.py": MODULE})
+            assert selected == nodeids
+
+        with allure.step("Изменены хук conftest или настройки pytest - все тесты"):
+            conftest = "def pytest_configure(config):\n    pass\n"
+            selected, _ = select_tests(nodeids, impact, {"conftest.py": {2}}, {"conftest.py": conftest})
+            assert selected == nodeids
+            assert select_tests(nodeids, impact, {"pytest.ini": {1}}, {})[1] == "pytest.ini changed"
+
+        with allure.step("Изменен модуль, которого нет в карте - все тесты с причиной"):
+            settings = "TIMEOUT = 5\n"
+            selected, reason = select_tests(nodeids, impact, {"settings.py": {1}}, {"settings.py": settings})
+            assert selected == nodeids
+            assert reason == "settings.py not in impact map"
+
+        with allure.step("Изменен тестовый модуль - только его тесты без карты"):
+            selected, reason = select_tests(nodeids, impact, {"t.py": {3}}, {"t.py": "def test_new():\n    pass\n"})
+            assert reason is None
+            assert selected == ["t.py::test_new"]
+
+    @allure.story("Запись карты и запуск по изменениям")
+    @allure.description("--impact-record, затем --changed-since HEAD после изменения одной функции")
+    @allure.tag("impact", "git")
+    def test_record_and_select_changed(self, tmp_path):
+        """Временный git репозиторий с модулем и двумя тестами"""
+        (tmp_path / "shop.py").write_text(MODULE, encoding="utf-8")
+        (tmp_path / "test_shop.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-q", "-m", "init")
+
+        with allure.step("Записать карту влияния"):
+            result = _run_pytest(tmp_path, "--impact-record")
+            assert result.returncode == 0, result.stdout + result.stderr
+
+        with allure.step("Изменить Catalog.names и выбрать затронутые тесты"):
+            (tmp_path / "shop.py").write_text(MODULE.replace('["a", "b"]', '["a", "c"]'), encoding="utf-8")
+            result = _run_pytest(tmp_path, "--changed-since", "HEAD")
+            allure.attach(result.stdout, name="Impact Run", attachment_type=allure.attachment_type.TEXT)
+            assert result.returncode == 0, result.stdout + result.stderr
+            assert "selected 1 of 2 tests" in result.stdout
+            assert "PASSED test_shop.py::test_count" in result.stdout
+            assert "test_total" not in result.stdout
@@ -0,0 +1,102 @@
+import json
+import os
+import random
+import subprocess
+import sys
+import textwrap
+
+import pytest
+import allure
+from src.plugins.sharding import plan_shards
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SAMPLE_TESTS = textwrap.dedent("""
+    import pytest
+
+
+    @pytest.mark.parametrize("case", range(10))
+    def test_case(case):
+        pass
+
+
+    @pytest.mark.xdist_group("shared")
+    def test_group_first():
+        pass
+
+
+    @pytest.mark.xdist_group("shared")
+    def test_group_second():
+        pass
+""")
+
+
+def _run_pytest(directory, *args):
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "src.plugins.durations", "-p", "src.plugins.sharding",
+         "-p", "no:cacheprovider", "-q", "-rA", "--durations-path", str(directory / "durations.json"),
+         *args, str(directory)],
+        cwd=directory, env=env, capture_output=True, text=True, timeout=120
+    )
+
+
+def _passed(output):
+    return {line.split()[1] for line in output.splitlines() if line.startswith("PASSED ")}
+
+
+@pytest.mark.plugins
+@allure.feature("Plugins - Sharding")
+@allure.severity(allure.severity_level.NORMAL)
+class TestSharding:
+
+    @allure.story("Разбиение на шарды")
+    @allure.description("Шарды покрывают набор ровно один раз, почти равны по времени и не зависят от порядка сбора")
+    @allure.tag("sharding", "durations")
+    def test_plan_is_balanced_and_stable(self):
+        """plan_shards на известных длительностях"""
+        rng = random.Random(7)
+        nodeids = [f"tests/test_{i % 5}.py::test_{i}" for i in range(40)]
+        estimates = [round(rng.uniform(0.1, 5.0), 2) for _ in nodeids]
+        groups = ["browser" if i in (3, 17, 31) else None for i in range(40)]
+
+        with allure.step("Каждый тест ровно в одном шарде, группа - в одном"):
+            shards, loads = plan_shards(nodeids, estimates, groups, 4)
+            assert sorted(i for shard in shards for i in shard) == list(range(40))
+            assert sum(1 for shard in shards if {3, 17, 31} <= set(shard)) == 1
+
+        with allure.step("Самый долгий шард близок к среднему"):
+            allure.attach(str(loads), name="Shard Loads", attachment_type=allure.attachment_type.TEXT)
+            assert max(loads) - min(loads) <= max(estimates)
+
+        with allure.step("Другой порядок сбора дает то же разбиение"):
+            order = list(range(40))
+            rng.shuffle(order)
+            shuffled, _ = plan_shards([nodeids[i] for i in order], [estimates[i] for i in order],
+                                      [groups[i] for i in order], 4)
+            as_ids = lambda plan, ids: sorted(sorted(ids[i] for i in shard) for shard in plan)
+            assert as_ids(shuffled, [nodeids[i] for i in order]) == as_ids(shards, nodeids)
+
+    @allure.story("Запуск шардов")
+    @allure.description("--shard-plan печатает план, шарды вместе выполняют каждый тест один раз")
+    @allure.tag("sharding", "durations")
+    def test_shards_cover_suite(self, tmp_path):
+        """--shard-plan и --shard-index 0..2 во вложенном процессе"""
+        (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+        durations = {f"test_sample.py::test_case[{i}]": float(i + 1) for i in range(10)}
+        (tmp_path / "durations.json").write_text(json.dumps(durations), encoding="utf-8")
+
+        with allure.step("План без запуска тестов"):
+            result = _run_pytest(tmp_path, "--shard-count", "3", "--shard-plan")
+            allure.attach(result.stdout, name="Shard Plan", attachment_type=allure.attachment_type.TEXT)
+            assert result.returncode == 0, result.stdout + result.stderr
+            assert "12 tests (10 with history)" in result.stdout
+            assert "PASSED" not in result.stdout
+
+        with allure.step("Шарды не пересекаются и покрывают весь набор"):
+            passed = [_passed(_run_pytest(tmp_path, "--shard-count", "3", "--shard-index", str(i)).stdout)
+                      for i in range(3)]
+            assert sum(len(shard) for shard in passed) == 12
+            assert len(set.union(*passed)) == 12
+            assert any({"test_sample.py::test_group_first", "test_sample.py::test_group_second"} <= shard
+                       for shard in passed)
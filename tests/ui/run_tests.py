@@ -48,7 +48,8 @@ def run_tests():
         "6": ["pytest", "-m", "api", "-v"],  # Только API тесты
         "7": ["pytest", "-m", "ui", "-v"],  # Только UI тесты
         "8": ["pytest", "-v", "--alluredir", allure_results_dir],  # С Allure отчетом
-        "9": ["pytest", "-n", "auto", "-v", "--alluredir", allure_results_dir],  # Параллельный запуск
+        # Параллельный запуск: воркеры получают тесты от самых длинных по истории .test_durations
+        "9": ["pytest", "-n", "auto", "--duration-schedule", "-v", "--alluredir", allure_results_dir],
     }
 
     print("=" * 60)